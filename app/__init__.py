@@ -1,2 +1,11 @@
-from .menu import Menu
+"""Calculator front ends, imported lazily so light entry points such as the client stay fast."""
+import importlib
+
 __all__ = ["Menu"]
+
+
+def __getattr__(name):
+    """Imports ``Menu`` the first time it is accessed."""
+    if name != "Menu":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(".menu", __name__).Menu
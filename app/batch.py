@@ -0,0 +1,123 @@
+"""
+Batch Module - Evaluates a stream of calculator commands without prompting.
+
+Commands are read one line at a time from a file or stdin, evaluated with the
+same parser as the REPL and written as CSV or JSON Lines. History entries are
+buffered and persisted in bulk, and throughput is reported at the end.
+"""
+
+import csv
+import json
+import logging
+import sys
+import time
+
+from app.evaluator import describe_error, evaluate_command
+from history.history import History
+
+logger = logging.getLogger("calculator_logger")
+
+OUTPUT_FIELDS = ["line", "command", "result", "error"]
+
+
+class BatchRunner:
+    """Streams commands through the evaluator and writes one result record per command."""
+
+    def __init__(self, output, output_format="csv", record_history=True, history_flush_size=10_000):
+        if output_format not in ("csv", "jsonl"):
+            raise ValueError(f"⚠️ Unknown output format '{output_format}'. Expected 'csv' or 'jsonl'.")
+        self.output = output
+        self.output_format = output_format
+        self.record_history = record_history
+        self.history_flush_size = history_flush_size
+        self._pending_history = []
+        self.processed = 0
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def run(self, lines):
+        """Evaluates every non-blank, non-comment line and returns the number processed."""
+        started = time.perf_counter()
+        write = self._record_writer()
+
+        for line_number, line in enumerate(lines, start=1):
+            command = line.strip()
+            if not command or command.startswith("#"):
+                continue
+
+            _, operation_name, numbers, result, error = evaluate_command(command)
+            self.processed += 1
+            if error is not None:
+                self.errors += 1
+                error = describe_error(error)
+            elif self.record_history:
+                self._pending_history.append((operation_name, [str(num) for num in numbers], str(result)))
+                if len(self._pending_history) >= self.history_flush_size:
+                    self.flush_history()
+
+            write(line_number, command, None if result is None else str(result), error)
+
+        self.flush_history()
+        self.elapsed = time.perf_counter() - started
+        logger.info(f"📦 Batch processed {self.processed} commands ({self.errors} errors) in {self.elapsed:.3f}s.")
+        return self.processed
+
+    def _record_writer(self):
+        """Returns a function writing one result record in the configured format."""
+        if self.output_format == "jsonl":
+            def write_jsonl(line_number, command, result, error):
+                self.output.write(json.dumps(
+                    dict(zip(OUTPUT_FIELDS, (line_number, command, result, error))), ensure_ascii=False) + "\n")
+            return write_jsonl
+
+        writer = csv.writer(self.output)
+        writer.writerow(OUTPUT_FIELDS)
+
+        def write_csv(line_number, command, result, error):
+            writer.writerow([line_number, command, "" if result is None else result, "" if error is None else error])
+        return write_csv
+
+    def flush_history(self):
+        """Persists buffered history entries with a single bulk write."""
+        if self._pending_history:
+            History.add_entries(self._pending_history)
+            self._pending_history = []
+
+    @property
+    def throughput(self):
+        """Commands processed per second during the last run."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        """Returns a one-line throughput report."""
+        return (f"✅ Processed {self.processed} commands ({self.errors} errors) in {self.elapsed:.3f}s "
+                f"- {self.throughput:,.0f} lines/s")
+
+
+def run_batch(source, output_path=None, output_format="csv", record_history=True):
+    """
+    Runs a batch from ``source`` (a path, or ``-`` for stdin) and reports throughput on stderr.
+
+    Raises ``OSError`` when the input or output file cannot be opened; nothing is left open.
+    """
+    input_stream = sys.stdin if source == "-" else open(source, encoding="utf-8")  # pylint: disable=consider-using-with
+    try:
+        output_stream = sys.stdout if output_path in (None, "-") else open(  # pylint: disable=consider-using-with
+            output_path, "w", newline="", encoding="utf-8")
+    except OSError:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        raise
+    try:
+        runner = BatchRunner(output_stream, output_format, record_history)
+        runner.run(input_stream)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+        else:
+            output_stream.flush()
+
+    print(runner.summary(), file=sys.stderr)
+    return runner
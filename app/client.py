@@ -0,0 +1,69 @@
+"""
+Client Module - Sends commands to a running calculator server.
+
+Usage::
+
+    python -m app.client "add 2 3"
+    python -m app.client "mean 1 2 3" "(2 + 3) * 4"   # one batch request
+    python -m app.client --socket /tmp/calculator.sock "std_dev 1 2 3"
+
+Nothing but the standard library and ``config.env`` is imported, so a
+one-shot calculation costs a socket round trip instead of a full calculator
+start-up.
+"""
+
+import argparse
+import json
+import socket
+import sys
+
+from config.env import SERVER_HOST, SERVER_PORT, SERVER_SOCKET
+
+
+def connect(host=SERVER_HOST, port=SERVER_PORT, socket_path=SERVER_SOCKET, timeout=30.0):
+    """Opens a connection to the server over a Unix socket (if ``socket_path``) or TCP."""
+    if socket_path:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(socket_path)
+        return connection
+    return socket.create_connection((host, port), timeout=timeout)
+
+
+def request(payloads, **connect_options):
+    """Sends request objects over one pipelined connection and returns the responses in order."""
+    with connect(**connect_options) as connection:
+        data = "".join(json.dumps(payload) + "\n" for payload in payloads).encode("utf-8")
+        connection.sendall(data)
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("r", encoding="utf-8") as responses:
+            return [json.loads(line) for line in responses if line.strip()]
+
+
+def main(argv=None):
+    """Sends the given commands (one request, or a batch if several) and prints the results."""
+    parser = argparse.ArgumentParser(description="Send commands to a running calculator server.")
+    parser.add_argument("commands", nargs="+", help="calculator commands, e.g. 'add 2 3'")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--socket", dest="socket_path", default=SERVER_SOCKET, help="Unix socket path")
+    args = parser.parse_args(argv)
+
+    payload = {"command": args.commands[0]} if len(args.commands) == 1 else {"commands": args.commands}
+    try:
+        (response,) = request([payload], host=args.host, port=args.port, socket_path=args.socket_path)
+    except OSError as e:
+        print(f"❌ Could not reach the calculator server: {e}", file=sys.stderr)
+        return 2
+
+    outcomes = response.get("results", [response])
+    for outcome in outcomes:
+        if outcome["error"] is None:
+            print(f"✅ Result: {outcome['result']}")
+        else:
+            print(outcome["error"])
+    return 1 if any(outcome["error"] for outcome in outcomes) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Evaluator Module - Parses calculator commands and evaluates them.
+
+Shared by the interactive REPL and the non-interactive entry points so every
+mode parses, validates and rounds results the same way. Infix formulas are
+recognised by ``is_expression`` and handled by ``app.expressions``. ``evaluate_many`` runs
+large batches across a process pool while keeping results in input order.
+"""
+
+import functools
+import math
+import os
+import re
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple, Optional
+
+from mappings.engines import get_engine
+from mappings.operations_map import operation_mapping
+
+# ✅ Below this many commands the cost of starting workers outweighs the parallel speedup
+PARALLEL_MIN_BATCH = 5_000
+CHUNKS_PER_WORKER = 4
+MAX_CHUNK_SIZE = 50_000
+
+# ✅ A bracketed vector such as "[1, 2, 3]" is one token even when it contains spaces
+_TOKEN = re.compile(r"\[[^\]]*\]|\S+")
+
+# ✅ Expressions are recorded in history under this operation name, with the formula as the operand
+EXPRESSION_OPERATION = "expr"
+_EXPRESSION_SYMBOLS = "+-*/()"
+
+
+class CommandError(ValueError):
+    """Raised when a command cannot be parsed into an operation and its operands."""
+
+
+def parse_command(command):
+    """
+    Splits ``<operation> <num1> <num2> ...`` into the operation name and Decimal operands.
+
+    Operands written as ``[1,2,3]`` become ``Vector`` operands: arithmetic
+    operations combine them element-wise (or reduce a single vector) and
+    statistical operations treat their elements as individual numbers.
+    Operands written as ``@file.csv`` or ``@file.csv:column`` become
+    ``OperandSource`` operands, accepted by statistical operations only;
+    binary ``@file.npy`` / ``.f64`` / ``.i64`` operands are memory-mapped and
+    are also accepted by arithmetic operations, like vectors.
+
+    Raises:
+        CommandError: If the command is empty, names an unknown operation or has invalid operands.
+    """
+    parts = _TOKEN.findall(command)
+
+    if not parts:
+        raise CommandError("⚠️ Invalid format. Expected: <operation> <num1> <num2> ...")
+
+    operation_name = parts[0].lower()
+
+    # 🔹 Check for unknown operations before processing numbers
+    if operation_name not in operation_mapping:
+        raise CommandError(f"❌ Unknown operation: '{operation_name}'. Type 'menu' for options.")
+
+    arity = operation_mapping.arity(operation_name)
+    try:
+        numbers = [_parse_operand(token) for token in parts[1:]]
+        sources = [number for number in numbers if not isinstance(number, (Decimal, tuple))]  # OperandSources
+        has_source = bool(sources)
+        has_vector = any(isinstance(number, tuple) or getattr(number, "vectorizable", False) for number in numbers)
+        if arity is not None and not all(source.vectorizable for source in sources):
+            raise CommandError(f"⚠️ '{operation_name}' does not accept text operand files; use a binary file.")
+        if has_vector and arity is None:
+            numbers = [value for number in numbers for value in (number if isinstance(number, tuple) else (number,))]
+            has_vector = False
+        if len(numbers) < 2 and not has_source and not (has_vector and len(numbers) == 1):
+            raise ValueError("⚠️ Expected at least two numbers for this operation.")
+    except CommandError:
+        raise
+    except (InvalidOperation, ValueError):
+        raise CommandError("⚠️ Invalid number format. Ensure all values are numeric.") from None
+
+    if arity is not None and len(numbers) != arity and not (has_vector and len(numbers) == 1):
+        raise CommandError(f"⚠️ '{operation_name}' expects exactly {arity} numbers.")
+
+    return operation_name, numbers
+
+
+def _parse_operand(token):
+    """Parses one operand token into a Decimal, a Vector for ``[...]`` or an OperandSource for ``@file``."""
+    if token.startswith("["):
+        from operations.vectorized import Vector  # ✅ Keeps the plugin package off the startup path
+
+        return Vector.parse(token)
+    if token.startswith("@"):
+        from operations.sources import OperandSource
+
+        try:
+            return OperandSource.parse(token)
+        except (FileNotFoundError, ValueError) as e:
+            raise CommandError(str(e)) from None
+    return Decimal(token)
+
+
+def evaluate(operation_name, numbers, engine=None):
+    """Runs the named operation on the session's (or the named) numeric engine and rounds its result."""
+    return get_engine(engine).evaluate(operation_name, numbers)
+
+
+class Evaluation(NamedTuple):
+    """Outcome of evaluating one command: either a rounded result or the exception it raised."""
+    command: str
+    operation: Optional[str]
+    operands: Optional[list]
+    result: Optional[Decimal]
+    error: Optional[Exception]
+
+
+def is_expression(command):
+    """True for infix formulas such as ``(2 + 3) * mean(4, 5)`` rather than ``<operation> <numbers>`` commands."""
+    first = command.split(None, 1)[0].lower() if command.strip() else ""
+    return first not in operation_mapping and any(symbol in command for symbol in _EXPRESSION_SYMBOLS)
+
+
+def evaluate_command(command, engine=None):
+    """Parses and evaluates one command or expression, capturing any error instead of raising it."""
+    try:
+        if is_expression(command):
+            from app.expressions import evaluate_expression  # ✅ Compiled and cached per source text
+
+            return Evaluation(command, EXPRESSION_OPERATION, [command.strip()],
+                              evaluate_expression(command, engine), None)
+        operation_name, numbers = parse_command(command)
+        return Evaluation(command, operation_name, numbers, evaluate(operation_name, numbers, engine), None)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return Evaluation(command, None, None, None, e)
+
+
+def describe_error(error):
+    """Returns the user-facing message the REPL prints for ``error``."""
+    if isinstance(error, CommandError):
+        return str(error)
+    if isinstance(error, ZeroDivisionError):
+        return "❌ Division by zero is not allowed."
+    return f"❌ Error: {error}"
+
+
+def evaluate_chunk(commands, engine=None):
+    """Evaluates a chunk of commands in order; the entry point for worker processes."""
+    return [evaluate_command(command, engine) for command in commands]
+
+
+def auto_chunk_size(total, workers):
+    """Picks a chunk size giving each worker several chunks to balance uneven operand counts."""
+    return max(1, min(MAX_CHUNK_SIZE, math.ceil(total / (workers * CHUNKS_PER_WORKER))))
+
+
+def evaluate_many(commands, workers=None, chunk_size=None, record_history=False, engine=None):
+    """
+    Evaluates many commands, in parallel worker processes when the batch is large enough.
+
+    Results come back as ``Evaluation`` tuples in input order with per-command
+    errors preserved. Small batches (or ``workers=1``) run in-process. When
+    ``record_history`` is set, successful results are added to history in input
+    order, so their IDs do not depend on how the work was scheduled. Workers
+    use ``engine``, or the session's numeric engine when it is ``None``.
+    """
+    commands = [command.strip() for command in commands]
+    workers = workers or os.cpu_count() or 1
+    engine = get_engine(engine).name  # Workers may not share this process's session
+
+    if workers == 1 or len(commands) < PARALLEL_MIN_BATCH:
+        results = evaluate_chunk(commands, engine)
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # ✅ Deferred: only large batches need worker processes
+
+        size = chunk_size or auto_chunk_size(len(commands), workers)
+        chunks = [commands[start:start + size] for start in range(0, len(commands), size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = [evaluation for chunk in executor.map(functools.partial(evaluate_chunk, engine=engine), chunks) for evaluation in chunk]
+
+    if record_history:
+        from history.history import History
+
+        History.add_entries(
+            (evaluation.operation, [str(num) for num in evaluation.operands], str(evaluation.result))
+            for evaluation in results if evaluation.error is None
+        )
+    return results
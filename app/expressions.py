@@ -0,0 +1,227 @@
+"""
+Expressions Module - Parses and compiles infix formulas over the registered operations.
+
+``(2 + 3) * mean(4, 5, 6) / 7`` is tokenized, parsed into an AST and compiled
+into a flat plan: a tuple of steps, each applying one operation to earlier
+results or constants. Identical subexpressions compile to a single step, plans
+are cached by source text and only the final result is rounded.
+
+Grammar::
+
+    expression := term (("+" | "-") term)*
+    term       := unary (("*" | "/") unary)*
+    unary      := "-" unary | primary
+    primary    := NUMBER | NAME "(" [expression ("," expression)*] ")" | "(" expression ")"
+
+Parentheses, calls and unary minus may nest at most ``MAX_NESTING`` levels deep;
+deeper input is a syntax error rather than a ``RecursionError``.
+"""
+
+import functools
+import re
+from decimal import Decimal
+from typing import NamedTuple
+
+from app.evaluator import CommandError
+from config.env import EXPRESSION_CACHE_SIZE
+from mappings.engines import get_engine
+from mappings.operations_map import operation_mapping
+
+_TOKEN = re.compile(r"(?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|(?P<name>[A-Za-z_]\w*)|(?P<symbol>[-+*/(),])")
+
+_BINARY_OPERATIONS = {"+": "add", "-": "subtract", "*": "multiply", "/": "divide"}
+
+# ✅ Parentheses, calls and unary minus nested deeper than this are rejected before Python's recursion limit
+MAX_NESTING = 50
+
+
+class ExpressionError(CommandError):
+    """Raised when an expression cannot be parsed or names an unknown operation."""
+
+
+class Number(NamedTuple):
+    """A numeric literal."""
+    value: Decimal
+
+
+class Call(NamedTuple):
+    """An operation applied to argument subexpressions."""
+    operation: str
+    arguments: tuple
+
+
+def tokenize(source):
+    """Splits ``source`` into ``(kind, text, position)`` tokens."""
+    tokens = []
+    position = 0
+    while position < len(source):
+        if source[position].isspace():
+            position += 1
+            continue
+        match = _TOKEN.match(source, position)
+        if match is None:
+            raise ExpressionError(f"⚠️ Syntax error at position {position + 1}: unexpected {source[position]!r}.")
+        tokens.append((match.lastgroup, match.group(), position))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing ``Number`` and ``Call`` nodes."""
+
+    def __init__(self, source):
+        self.tokens = tokenize(source)
+        self.index = 0
+        self.depth = 0
+
+    def _peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None, None)
+
+    def _error(self, message=None):
+        _, text, position = self._peek()
+        if position is None:
+            raise ExpressionError(f"⚠️ Syntax error at end of input: {message or 'incomplete expression'}.")
+        raise ExpressionError(f"⚠️ Syntax error at position {position + 1}: {message or f'unexpected {text!r}'}.")
+
+    def _accept(self, symbol):
+        kind, text, _ = self._peek()
+        if kind == "symbol" and text == symbol:
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, symbol):
+        if not self._accept(symbol):
+            self._error(f"expected {symbol!r}")
+
+    def _nested(self, parse):
+        """Runs ``parse`` one nesting level deeper, rejecting input nested past ``MAX_NESTING``."""
+        if self.depth >= MAX_NESTING:
+            self._error(f"nested more than {MAX_NESTING} levels deep")
+        self.depth += 1
+        try:
+            return parse()
+        finally:
+            self.depth -= 1
+
+    def parse(self):
+        """Parses the whole source as one expression."""
+        if not self.tokens:
+            raise ExpressionError("⚠️ Empty expression.")
+        node = self._expression()
+        if self.index != len(self.tokens):
+            self._error()
+        return node
+
+    def _binary(self, operand, symbols):
+        node = operand()
+        while True:
+            kind, text, _ = self._peek()
+            if kind != "symbol" or text not in symbols:
+                return node
+            self.index += 1
+            node = Call(_BINARY_OPERATIONS[text], (node, operand()))
+
+    def _expression(self):
+        return self._binary(self._term, "+-")
+
+    def _term(self):
+        return self._binary(self._unary, "*/")
+
+    def _unary(self):
+        if self._accept("-"):
+            return Call("subtract", (Number(Decimal(0)), self._nested(self._unary)))
+        return self._primary()
+
+    def _primary(self):
+        kind, text, _ = self._peek()
+        if kind == "number":
+            self.index += 1
+            return Number(Decimal(text))
+        if kind == "name":
+            self.index += 1
+            return self._call(text.lower())
+        if self._accept("("):
+            node = self._nested(self._expression)
+            self._expect(")")
+            return node
+        return self._error()
+
+    def _call(self, name):
+        if name not in operation_mapping:
+            raise ExpressionError(f"❌ Unknown operation: '{name}'. Type 'menu' for options.")
+        self._expect("(")
+        arguments = []
+        if not self._accept(")"):
+            arguments.append(self._nested(self._expression))
+            while self._accept(","):
+                arguments.append(self._nested(self._expression))
+            self._expect(")")
+        arity = operation_mapping.arity(name)
+        if arity is not None and len(arguments) != arity:
+            raise ExpressionError(f"⚠️ '{name}' expects exactly {arity} arguments.")
+        if not arguments:
+            raise ExpressionError(f"⚠️ '{name}' expects at least one argument.")
+        return Call(name, tuple(arguments))
+
+
+def parse_expression(source):
+    """Parses ``source`` into an AST of ``Number`` and ``Call`` nodes."""
+    try:
+        return _Parser(source).parse()
+    except RecursionError:
+        # 🔹 Only reachable when called from an already deep stack; MAX_NESTING catches deep input first
+        raise ExpressionError("⚠️ Expression is nested too deeply.") from None
+
+
+class CompiledExpression(NamedTuple):
+    """A flat evaluation plan: slots start as ``constants`` and each step appends one result."""
+    source: str
+    constants: tuple
+    steps: tuple  # (operation name, argument slot indices)
+    result: int  # Slot holding the final value
+
+    def evaluate(self, engine=None):
+        """Runs the plan on the session's (or the named) numeric engine and rounds only the final result."""
+        engine = get_engine(engine)
+        slots = [engine.convert(constant) for constant in self.constants]
+        for operation_name, arguments in self.steps:
+            slots.append(engine.apply(operation_name, [slots[index] for index in arguments]))
+        return engine.finish(slots[self.result])
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(source):
+    """Parses and compiles ``source``, reusing the plan for repeated source text."""
+    root = parse_expression(source)
+    constants, steps, slots = [], [], {}
+
+    def collect_constants(node):
+        if isinstance(node, Number):
+            key = ("number", str(node.value))
+            if key not in slots:
+                slots[key] = len(constants)
+                constants.append(node.value)
+        else:
+            for argument in node.arguments:
+                collect_constants(argument)
+
+    def emit(node):
+        """Emits steps in post-order and returns the node's slot; repeated subtrees share one step."""
+        if isinstance(node, Number):
+            return slots[("number", str(node.value))]
+        arguments = tuple(emit(argument) for argument in node.arguments)
+        key = (node.operation, arguments)
+        if key not in slots:
+            steps.append((node.operation, arguments))
+            slots[key] = len(constants) + len(steps) - 1
+        return slots[key]
+
+    collect_constants(root)
+    result = emit(root)
+    return CompiledExpression(source, tuple(constants), tuple(steps), result)
+
+
+def evaluate_expression(source, engine=None):
+    """Compiles (or reuses) the plan for ``source`` and evaluates it."""
+    return compile_expression(source.strip()).evaluate(engine)
@@ -2,8 +2,10 @@
 Calculator Menu Module - Handles user interactions via menu
 """
 import logging
+import math
 import sys
-from history.history import History
+from config.env import HISTORY_PAGE_SIZE
+from history.history import History, COLUMNS
 from mappings.operations_map import operation_mapping
 
 # ✅ Setup logger
@@ -50,18 +52,79 @@ class Menu:
         action()
 
     @classmethod
-    def view_history(cls):
-        """Displays the calculation history without duplicate logging."""
-        history_df = History.get_history()
-
-        if history_df.empty:
-            message = "\n⚠️ No calculations found."
-            print(message)  # ✅ Show only in console
-            logger.warning("⚠️ No calculations found.")  # ✅ Log without duplication
-        else:
-            print("\n📜 Calculation History:")
-            print(history_df.to_string(index=False))  # ✅ Print clean output
-            logger.info("📜 Calculation history viewed.")  # ✅ Silent log
+    def view_history(cls, operation=None):
+        """Displays the calculation history one page at a time without duplicate logging."""
+        if History.count(operation) == 0:
+            message = f"⚠️ No '{operation}' calculations found." if operation else "⚠️ No calculations found."
+            print(f"\n{message}")  # ✅ Show only in console
+            logger.warning(message)  # ✅ Log without duplication
+            return
+
+        print("\n📜 Calculation History:")
+        cls.browse_history(operation)
+        logger.info("📜 Calculation history viewed.")  # ✅ Silent log
+
+    @classmethod
+    def browse_history(cls, operation=None, page_size=HISTORY_PAGE_SIZE):
+        """Pages through history starting at the newest entries, rendering one page per prompt."""
+        page = None  # ✅ Start on the last page (the tail window)
+        while True:
+            total = History.count(operation)
+            pages = max(1, math.ceil(total / page_size))
+            page = pages if page is None else min(max(page, 1), pages)
+
+            rows = History.entries((page - 1) * page_size, page_size, operation)
+            if rows:
+                print(cls.format_rows(rows))
+            else:
+                print(f"\n⚠️ No '{operation}' calculations found.")
+
+            scope = f" [{operation}]" if operation else ""
+            command = input(
+                f"\n📄 Page {page}/{pages}{scope} - n: next, p: previous, g <ID>: go to ID, "
+                "f <operation>: filter (f alone clears), Enter: back: "
+            ).strip().lower()
+            action, _, argument = command.partition(" ")
+            argument = argument.strip()
+
+            if not action:
+                return
+            if action == "n":
+                page += 1
+            elif action == "p":
+                page -= 1
+            elif action == "g":
+                page = cls._page_of(argument, operation, page_size, page)
+            elif action == "f":
+                operation = argument or None
+                page = None
+            else:
+                print("\n❌ Invalid pager command.")
+
+    @staticmethod
+    def _page_of(argument, operation, page_size, current_page):
+        """Returns the page holding the entry with the given ID, or the current page if absent."""
+        try:
+            entry_id = int(argument)
+        except ValueError:
+            print("\n❌ Invalid input. Please enter a numeric ID.")
+            return current_page
+
+        position = History.position(entry_id, operation)
+        if position is None:
+            print(f"\n⚠️ Entry with ID {entry_id} not found.")
+            return current_page
+        return position // page_size + 1
+
+    @staticmethod
+    def format_rows(rows):
+        """Formats history rows as a right-aligned table."""
+        table = [COLUMNS] + [
+            [str(entry_id), str(operation), str(list(operands)), str(result)]
+            for entry_id, operation, operands, result in rows
+        ]
+        widths = [max(len(line[column]) for line in table) for column in range(len(COLUMNS))]
+        return "\n".join(" ".join(cell.rjust(width) for cell, width in zip(line, widths)) for line in table)
 
     @classmethod
     def clear_history(cls):
@@ -78,20 +141,22 @@ class Menu:
     @classmethod
     def remove_entry(cls):
         """Removes an entry from history by ID."""
-        history_df = History.get_history()
+        total = History.count()
 
-        if history_df.empty:
+        if total == 0:
             print("\n⚠️ No history available to remove.")
             logger.warning("⚠️ No history available to remove.")
             return
 
         print("\n📜 Current History:")
-        print(history_df.to_string(index=False))
+        print(cls.format_rows(History.entries(total - HISTORY_PAGE_SIZE, HISTORY_PAGE_SIZE)))
+        if total > HISTORY_PAGE_SIZE:
+            print(f"🔹 Showing the latest {HISTORY_PAGE_SIZE} of {total} entries. Use option 1 to browse the rest.")
 
         try:
             entry_id = int(input("\n🔢 Enter the ID of the entry to remove: ").strip())
 
-            if entry_id not in history_df["ID"].values:
+            if History.find(entry_id) is None:
                 print(f"\n⚠️ Entry with ID {entry_id} not found.")
                 logger.warning(f"⚠️ Entry with ID {entry_id} not found.")
                 return
@@ -107,7 +172,7 @@ class Menu:
     @classmethod
     def reload_history(cls):
         """Reloads history from CSV."""
-        History.get_history()  # ✅ Correct method to load history
+        History.reload()  # ✅ Only rows appended since the last load are parsed
         print("\n🔄 History reloaded successfully.")
         logger.info("🔄 History reloaded successfully.")
 
@@ -0,0 +1,201 @@
+"""
+Server Module - Serves the calculator over TCP or a Unix domain socket with asyncio.
+
+The protocol is line-delimited JSON. Each request is one line:
+
+- ``{"id": 1, "command": "add 2 3"}`` -> ``{"id": 1, "result": "5.00", "error": null}``
+- ``{"id": 2, "commands": ["add 1 2", "mean 1 2 3"]}`` ->
+  ``{"id": 2, "results": [{"result": "3.00", "error": null}, ...]}``
+- a bare line such as ``add 2 3`` is treated as ``{"command": "add 2 3"}``.
+
+Either form may name a numeric engine (``"engine": "float"``); otherwise the
+server's session engine is used.
+
+Clients may pipeline: requests are evaluated concurrently (up to
+``SERVER_CONCURRENCY`` at a time across all connections) and responses are
+written back in request order. Statistics, formulas, operand files and batches
+run in an executor (``SERVER_EXECUTOR``: ``process`` or ``thread``) so the
+event loop stays responsive; fixed-arity arithmetic is evaluated inline.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.evaluator import describe_error, evaluate_chunk, evaluate_command
+from config.env import SERVER_CONCURRENCY, SERVER_EXECUTOR
+from mappings.engines import get_engine
+from mappings.operations_map import operation_mapping
+
+logger = logging.getLogger("calculator_logger")
+
+# ✅ Batches can be large; one request line may be up to this many bytes
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+def _outcome(evaluation):
+    """Returns the JSON-ready ``result``/``error`` pair of one evaluation."""
+    if evaluation.error is not None:
+        return {"result": None, "error": describe_error(evaluation.error)}
+    return {"result": str(evaluation.result), "error": None}
+
+
+def is_heavy(command):
+    """True for commands worth offloading: statistics, formulas and operand files."""
+    first = command.split(None, 1)[0].lower() if command.strip() else ""
+    return "@" in command or first not in operation_mapping or operation_mapping.arity(first) is None
+
+
+class CalculatorServer:
+    """Evaluates line-delimited JSON requests from any number of pipelined connections."""
+
+    def __init__(self, concurrency=SERVER_CONCURRENCY, executor=SERVER_EXECUTOR, record_history=True):
+        if executor not in ("process", "thread"):
+            raise ValueError(f"⚠️ Unknown executor '{executor}'. Expected 'process' or 'thread'.")
+        self.concurrency = concurrency
+        self.executor_kind = executor
+        self.record_history = record_history
+        self._executor = None
+        self._semaphore = None
+        self.requests = 0
+
+    def _get_executor(self):
+        """Creates the executor on first use."""
+        if self._executor is None:
+            if self.executor_kind == "process":
+                import multiprocessing  # ✅ Only imported when a request is offloaded
+
+                # 🔹 Workers start lazily, while a client is connected: forked workers would inherit its
+                #    socket and keep the connection open after the server closes it
+                self._executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver"))
+            else:
+                self._executor = ThreadPoolExecutor()
+        return self._executor
+
+    async def _evaluate(self, commands, offload, engine):
+        """Evaluates commands inline or in the executor, limited by the shared semaphore."""
+        async with self._semaphore:
+            if not offload:
+                return [evaluate_command(command, engine) for command in commands]
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), evaluate_chunk, commands, engine)
+
+    async def respond(self, line):
+        """Returns the response object for one request line; failures become error responses."""
+        self.requests += 1
+        text = line.strip()
+        request_id = None
+        try:
+            request = json.loads(text) if text.startswith("{") else {"command": text}
+            request_id = request.get("id")
+            if "commands" in request:
+                commands, batch = request["commands"], True
+                if not isinstance(commands, list) or not all(isinstance(command, str) for command in commands):
+                    raise ValueError("'commands' must be a list of strings")
+            elif "command" in request:
+                commands, batch = [request["command"]], False
+                if not isinstance(commands[0], str):
+                    raise ValueError("'command' must be a string")
+            else:
+                raise ValueError("expected 'command' or 'commands'")
+            commands = [command.strip() for command in commands]
+            engine = get_engine(request.get("engine")).name  # Named explicitly for worker processes
+        except ValueError as e:
+            return {"id": request_id, "result": None, "error": f"⚠️ Invalid request: {e}"}
+
+        try:
+            evaluations = await self._evaluate(commands, batch or any(map(is_heavy, commands)), engine)
+            self._record(evaluations)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # ✅ One failed request must not stall the responses pipelined behind it
+            logger.error(f"❌ Request {request_id!r} failed: {e}")
+            return {"id": request_id, "result": None, "error": f"❌ Error: {e}"}
+        if batch:
+            return {"id": request_id, "results": [_outcome(evaluation) for evaluation in evaluations]}
+        return {"id": request_id, **_outcome(evaluations[0])}
+
+    def _record(self, evaluations):
+        """Adds successful results to history in request order."""
+        if not self.record_history:
+            return
+        from history.history import History
+
+        entries = [
+            (evaluation.operation, [str(number) for number in evaluation.operands], str(evaluation.result))
+            for evaluation in evaluations if evaluation.error is None
+        ]
+        if entries:
+            History.add_entries(entries)
+
+    async def handle_connection(self, reader, writer):
+        """Reads pipelined requests and writes responses in the order the requests arrived."""
+        responses = asyncio.Queue(maxsize=self.concurrency)
+        sender = asyncio.create_task(self._send_in_order(responses, writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    await responses.put(asyncio.create_task(self.respond(line.decode("utf-8", "replace"))))
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+            logger.warning(f"⚠️ Connection dropped: {e}")
+        finally:
+            await responses.put(None)
+            await sender
+            writer.close()
+
+    @staticmethod
+    async def _send_in_order(responses, writer):
+        """Writes each response as soon as it and every earlier one are ready."""
+        while (task := await responses.get()) is not None:
+            try:
+                response = await task
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"❌ Request failed: {e}")
+                response = {"id": None, "result": None, "error": f"❌ Error: {e}"}
+            try:
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()
+            except ConnectionError:
+                continue
+
+    async def start(self, host=None, port=None, socket_path=None):
+        """Starts listening on a Unix socket (if ``socket_path``) or TCP and returns the asyncio server."""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        if socket_path:
+            return await asyncio.start_unix_server(self.handle_connection, path=socket_path, limit=MAX_LINE_BYTES)
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+
+    def close(self):
+        """Shuts the executor down."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+async def _serve_forever(server, host, port, socket_path):
+    """Starts listening and serves until cancelled."""
+    listener = await server.start(host, port, socket_path)
+    where = socket_path or ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"🛰️ Calculator server listening on {where} (Ctrl+C to stop).", flush=True)
+    logger.info(f"🛰️ Server listening on {where}.")
+    async with listener:
+        await listener.serve_forever()
+
+
+def serve(host, port, socket_path=None, concurrency=SERVER_CONCURRENCY, executor=SERVER_EXECUTOR,
+          record_history=True):
+    """Runs the server until interrupted."""
+    server = CalculatorServer(concurrency, executor, record_history)
+    try:
+        asyncio.run(_serve_forever(server, host, port, socket_path))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped.")
+    finally:
+        server.close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+        logger.info(f"👋 Server stopped after {server.requests} requests.")
@@ -0,0 +1,51 @@
+"""
+Startup Report Module - Measures how long the calculator takes to import.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter and
+summarises the result, so regressions in startup time (such as a heavy library
+sneaking back onto the import path) are easy to spot.
+"""
+
+import os
+import subprocess
+import sys
+
+# ✅ Modules that should only be imported once a feature actually needs them
+HEAVY_MODULES = ("pandas", "numpy", "pytest", "multiprocessing")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_imports(module="main"):
+    """Imports ``module`` in a fresh interpreter and returns ``(name, self_us, cumulative_us)`` rows."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def import_time_report(module="main", top=10):
+    """Returns a printable summary of the import time of ``module``."""
+    timings = measure_imports(module)
+    by_name = {name: cumulative for name, _, cumulative in timings}
+    total_us = by_name.get(module, sum(self_us for _, self_us, _ in timings))
+    loaded = {name.split(".")[0] for name, _, _ in timings}
+
+    lines = [f"⏱️ Import time for '{module}': {total_us / 1000:.1f} ms ({len(timings)} modules)"]
+    lines.append(f"🔹 Slowest {top} modules (self time):")
+    for name, self_us, cumulative_us in sorted(timings, key=lambda row: row[1], reverse=True)[:top]:
+        lines.append(f"   {self_us / 1000:8.2f} ms  (cumulative {cumulative_us / 1000:8.2f} ms)  {name}")
+    for heavy in HEAVY_MODULES:
+        status = "⚠️ imported at startup" if heavy in loaded else "✅ deferred"
+        lines.append(f"🔸 {heavy}: {status}")
+    return "\n".join(lines)
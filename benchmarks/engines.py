@@ -0,0 +1,65 @@
+"""
+Numeric Engine Benchmark - Compares the decimal, float and fixed engines on bulk statistics.
+
+Each size writes a temporary operand file of two-decimal-place values and times
+``<operation> @file`` end to end (parsing included) on every engine, plus a
+batch of scalar ``add`` commands.
+
+Usage: ``python -m benchmarks.engines [--sizes 10000 100000]``
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import timeit
+
+from app.evaluator import evaluate, parse_command
+from mappings.engines import ENGINES
+from mappings.result_cache import result_cache
+
+OPERATIONS = ("mean", "median", "variance", "std_dev")
+
+
+def write_operands(path, size, seed=0):
+    """Writes ``size`` two-decimal-place values, one per line."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as operand_file:
+        operand_file.writelines(f"{rng.randint(-10 ** 6, 10 ** 6) / 100:.2f}\n" for _ in range(size))
+
+
+def best_of(function, repeat=3):
+    """Returns the fastest of ``repeat`` single runs, in seconds."""
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def run(sizes):
+    """Times every operation on every engine and returns printable lines."""
+    names = list(ENGINES)
+    lines = [f"{'operation':<10}{'size':>10}" + "".join(f"{name + ' ms':>12}" for name in names)
+             + "".join(f"{name + ' x':>10}" for name in names[1:])]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "operands.csv")
+        for size in sizes:
+            write_operands(path, size)
+            commands = [parse_command(f"{operation} @{path}") for operation in OPERATIONS]
+            scalar_commands = [parse_command(f"add {index}.25 {index}.50") for index in range(size)]
+            timings = {}
+            for operation_name, numbers in commands:
+                timings[operation_name] = [
+                    best_of(lambda name=name: evaluate(operation_name, numbers, name)) for name in names]
+            timings["add x N"] = [
+                best_of(lambda name=name: [evaluate(operation_name, numbers, name)
+                                           for operation_name, numbers in scalar_commands]) for name in names]
+            for label, seconds in timings.items():
+                lines.append(f"{label:<10}{size:>10}" + "".join(f"{value * 1000:>12.2f}" for value in seconds)
+                             + "".join(f"{seconds[0] / value:>9.1f}x" for value in seconds[1:]))
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the numeric engines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    result_cache.clear()
+    result_cache.maxsize = 0  # ✅ Time the engines, not cache hits
+    print("\n".join(run(parser.parse_args().sizes)))
@@ -0,0 +1,47 @@
+"""
+Statistics Kernel Benchmark - Compares the Decimal kernel with the stdlib.
+
+Usage: ``python -m benchmarks.statistics_kernel [--sizes 1000 10000 100000]``
+"""
+
+import argparse
+import random
+import statistics
+import timeit
+from decimal import Decimal
+
+from operations import decimal_stats
+
+FUNCTIONS = ("mean", "median", "variance", "stdev")
+
+
+def sample(size, seed=0):
+    """Returns ``size`` two-decimal-place Decimals, like typical calculator input."""
+    rng = random.Random(seed)
+    return [Decimal(rng.randint(-10 ** 6, 10 ** 6)).scaleb(-2) for _ in range(size)]
+
+
+def best_of(function, values, repeat=3):
+    """Returns the fastest of ``repeat`` single runs, in seconds."""
+    return min(timeit.repeat(lambda: function(values), number=1, repeat=repeat))
+
+
+def run(sizes):
+    """Times every function at every size and returns printable lines."""
+    lines = [f"{'function':<10}{'size':>10}{'stdlib ms':>12}{'kernel ms':>12}{'speedup':>10}"]
+    for size in sizes:
+        values = sample(size)
+        for name in FUNCTIONS:
+            stdlib_function, kernel_function = getattr(statistics, name), getattr(decimal_stats, name)
+            assert kernel_function(values) == stdlib_function(values), name
+            baseline, kernel = best_of(stdlib_function, values), best_of(kernel_function, values)
+            lines.append(
+                f"{name:<10}{size:>10}{baseline * 1000:>12.2f}{kernel * 1000:>12.2f}{baseline / kernel:>9.1f}x"
+            )
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Decimal statistics kernel.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    print("\n".join(run(parser.parse_args().sizes)))
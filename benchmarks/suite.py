@@ -0,0 +1,274 @@
+"""
+Benchmark Suite - Reproducible timings of the calculator's hot paths, compared against a baseline.
+
+Groups:
+
+- ``operations``: every built-in operation, end to end through ``evaluate``,
+  at several operand counts (fixed-arity operations at two operands).
+- ``history``: ``add_entry``, ``reload`` and ``remove_entry`` with 1k, 100k and
+  1M entries already stored, against a scratch CSV journal.
+- ``plugins``: ``load_plugins`` in a fresh interpreter, with a current
+  manifest and with a full rebuild.
+- ``startup``: cold start of the calculator (``import main``) in a fresh
+  interpreter, and the whole process's wall time.
+
+Results are written as JSON (``--output``). Every benchmark slower than the
+``--baseline`` by more than ``--threshold`` is flagged and the exit status is 1.
+The baseline defaults to ``benchmarks/baseline.json``, or
+``benchmarks/baseline-quick.json`` with ``--quick``; the quick one is committed.
+When there is no baseline, or it shares no benchmark with the run, a warning
+says that nothing was compared. Everything runs offline; the result cache is
+disabled so repeated calls are really evaluated.
+
+Usage::
+
+    python -m benchmarks.suite --quick                    # compare against the committed quick baseline
+    python -m benchmarks.suite --quick --update-baseline  # regenerate it
+    python -m benchmarks.suite --update-baseline          # record this machine's full baseline
+    python -m benchmarks.suite --output results.json      # compare against it
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from decimal import Decimal
+
+from app.evaluator import evaluate
+from history.history import History
+from mappings.engines import get_engine
+from mappings.operations_map import operation_mapping
+from mappings.result_cache import result_cache
+
+GROUPS = ("operations", "history", "plugins", "startup")
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+QUICK_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline-quick.json")
+DEFAULT_THRESHOLD = 0.25
+
+OPERAND_COUNTS = (10, 1_000, 100_000)
+HISTORY_SIZES = (1_000, 100_000, 1_000_000)
+QUICK_OPERAND_COUNTS = (10, 1_000)
+QUICK_HISTORY_SIZES = (1_000, 10_000)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(function, repeat=5, number=None):
+    """Times ``function`` and returns per-call ``seconds`` (best run) and ``median`` with the loop counts used."""
+    timer = timeit.Timer(function)
+    if number is None:
+        number, _ = timer.autorange()
+    runs = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {"seconds": min(runs), "median": statistics.median(runs), "number": number, "repeat": repeat}
+
+
+def sample(count, seed=0):
+    """Returns ``count`` two-decimal-place Decimals, like typical calculator input."""
+    rng = random.Random(seed)
+    return [Decimal(rng.randint(-10 ** 6, 10 ** 6)).scaleb(-2) for _ in range(count)]
+
+
+def bench_operations(operand_counts=OPERAND_COUNTS, repeat=5, number=None):
+    """Times every registered operation end to end at each operand count (``number`` calls per run, or auto)."""
+    results = {}
+    for name in sorted(operation_mapping):
+        counts = (2,) if operation_mapping.arity(name) == 2 else operand_counts
+        for count in counts:
+            numbers = sample(count)
+            results[f"operations.{name}[{count}]"] = measure(
+                lambda name=name, numbers=numbers: evaluate(name, numbers), repeat=repeat, number=number)
+    return results
+
+
+@contextlib.contextmanager
+def scratch_history(path):
+    """Points ``History`` at a scratch CSV journal and restores its configuration afterwards."""
+    saved = {attribute: getattr(History, attribute) for attribute in
+             ("_records", "_history_file", "_backend", "_journal_mode", "_store", "_store_key", "_loaded", "_next_id")}
+    History._history_file, History._backend, History._journal_mode = path, "csv", True  # pylint: disable=protected-access
+    History._store, History._loaded = None, False  # pylint: disable=protected-access
+    try:
+        yield
+    finally:
+        for attribute, value in saved.items():
+            setattr(History, attribute, value)
+
+
+def bench_history(sizes=HISTORY_SIZES, repeat=5):
+    """Times append, reload and remove against a journal already holding ``size`` entries."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, scratch_history(os.path.join(directory, "history.csv")):
+        for size in sizes:
+            History.clear_history()
+            History.add_entries(("add", [str(index), "1"], f"{index + 1}.00") for index in range(size))
+            results[f"history.add_entry[{size}]"] = measure(
+                lambda: History.add_entry("add", ["2", "3"], "5.00"), repeat=repeat, number=100)
+            results[f"history.reload[{size}]"] = measure(History.reload, repeat=min(repeat, 3), number=1)
+            ids = iter(range(1, size + 1))
+            results[f"history.remove_entry[{size}]"] = measure(
+                lambda ids=ids: History.remove_entry(next(ids)), repeat=repeat,
+                number=max(1, min(100, size // (2 * repeat))))
+    return results
+
+
+def fresh_interpreter_seconds(code, directory, env=None):
+    """Runs ``code`` in a new interpreter (cwd ``directory``) and returns the seconds it prints."""
+    child_env = dict(os.environ, PYTHONPATH=_ROOT, **(env or {}))
+    output = subprocess.run([sys.executable, "-c", code], cwd=directory, env=child_env,
+                            capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _fresh_measure(code, directory, repeat, env=None):
+    """Times ``code`` in ``repeat`` fresh interpreters."""
+    runs = [fresh_interpreter_seconds(code, directory, env) for _ in range(repeat)]
+    return {"seconds": min(runs), "median": statistics.median(runs), "number": 1, "repeat": repeat}
+
+
+_TIMED = "import time; started = time.perf_counter(); {body}; print(time.perf_counter() - started)"
+
+
+def bench_plugins(repeat=5):
+    """Times ``load_plugins`` in fresh interpreters, rebuilding the manifest and reading a current one."""
+    with tempfile.TemporaryDirectory() as directory:
+        env = {"PLUGIN_MANIFEST_PATH": os.path.join(directory, "manifest.json")}
+        body = "from config.plugins import load_plugins; load_plugins(refresh={refresh})"
+        return {
+            "plugins.load_plugins[rebuild]": _fresh_measure(_TIMED.format(body=body.format(refresh=True)),
+                                                            directory, repeat, env),
+            "plugins.load_plugins[cached]": _fresh_measure(_TIMED.format(body=body.format(refresh=False)),
+                                                           directory, repeat, env),
+        }
+
+
+def bench_startup(repeat=5):
+    """Times a cold ``import main`` and the wall time of a whole ``python -c 'import main'`` process."""
+    with tempfile.TemporaryDirectory() as directory:
+        results = {"startup.import_main": _fresh_measure(_TIMED.format(body="import main"), directory, repeat)}
+        wall = []
+        for _ in range(repeat):
+            started = timeit.default_timer()
+            subprocess.run([sys.executable, "-c", "import main"], cwd=directory, check=True,
+                           env=dict(os.environ, PYTHONPATH=_ROOT), capture_output=True)
+            wall.append(timeit.default_timer() - started)
+        results["startup.process"] = {"seconds": min(wall), "median": statistics.median(wall),
+                                      "number": 1, "repeat": repeat}
+    return results
+
+
+def run(groups=GROUPS, quick=False, repeat=5):
+    """Runs the selected groups and returns the JSON-ready report."""
+    maxsize, result_cache.maxsize = result_cache.maxsize, 0  # ✅ Time the operations, not cache hits
+    result_cache.clear()
+    try:
+        benchmarks = {}
+        if "operations" in groups:
+            benchmarks.update(bench_operations(QUICK_OPERAND_COUNTS if quick else OPERAND_COUNTS, repeat))
+        if "history" in groups:
+            benchmarks.update(bench_history(QUICK_HISTORY_SIZES if quick else HISTORY_SIZES, repeat))
+        if "plugins" in groups:
+            benchmarks.update(bench_plugins(repeat))
+        if "startup" in groups:
+            benchmarks.update(bench_startup(repeat))
+    finally:
+        result_cache.maxsize = maxsize
+    return {
+        "meta": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "engine": get_engine().name,
+            "quick": quick,
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(report, baseline):
+    """Returns ``(name, baseline seconds, current seconds, change)`` for every benchmark present in both."""
+    rows = []
+    for name, result in report["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous:
+            rows.append((name, previous["seconds"], result["seconds"],
+                         result["seconds"] / previous["seconds"] - 1 if previous["seconds"] else 0.0))
+    return rows
+
+
+def regressions(rows, threshold=DEFAULT_THRESHOLD):
+    """Returns the compared rows slower than the baseline by more than ``threshold``."""
+    return [row for row in rows if row[3] > threshold]
+
+
+def format_report(report, rows=None, threshold=DEFAULT_THRESHOLD):
+    """Returns printable lines: every benchmark, with its change against the baseline when there is one."""
+    changes = {name: (previous, change) for name, previous, _, change in rows or ()}
+    lines = [f"{'benchmark':<40}{'ms':>12}{'baseline ms':>14}{'change':>10}"]
+    for name, result in report["benchmarks"].items():
+        line = f"{name:<40}{result['seconds'] * 1000:>12.4f}"
+        if name in changes:
+            previous, change = changes[name]
+            line += f"{previous * 1000:>14.4f}{change:>+10.0%}" + ("  ⚠️ regression" if change > threshold else "")
+        lines.append(line)
+    return lines
+
+
+def main(argv=None):
+    """Runs the suite, writes JSON and compares against the baseline; returns 1 on a regression."""
+    parser = argparse.ArgumentParser(description="Run the calculator benchmark suite.")
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--quick", action="store_true", help="smaller operand counts and history sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (best is kept)")
+    parser.add_argument("--output", metavar="FILE", help="write the JSON report to FILE ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="baseline JSON to compare against (default: benchmarks/baseline.json, "
+                             "or benchmarks/baseline-quick.json with --quick)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"flag benchmarks slower than the baseline by more than this fraction "
+                             f"(default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--update-baseline", action="store_true", help="write this run to the baseline file")
+    args = parser.parse_args(argv)
+    baseline_path = args.baseline or (QUICK_BASELINE_PATH if args.quick else BASELINE_PATH)
+
+    report = run(args.groups, args.quick, args.repeat)
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+    rows = []
+    if not args.update_baseline and os.path.exists(baseline_path):
+        with open(baseline_path, encoding="utf-8") as baseline:
+            rows = compare(report, json.load(baseline))
+    stream = sys.stderr if args.output == "-" else sys.stdout
+    print("\n".join(format_report(report, rows, args.threshold)), file=stream)
+
+    if args.update_baseline:
+        with open(baseline_path, "w", encoding="utf-8") as baseline:
+            json.dump(report, baseline, indent=2)
+        print(f"✅ Baseline written to {baseline_path}.")
+        return 0
+    if not rows:
+        # ✅ Say so instead of passing silently: without a baseline there is no regression gate
+        print(f"⚠️ Nothing was compared: {baseline_path} is missing or shares no benchmark with this run. "
+              f"Record it with: python -m benchmarks.suite{' --quick' if args.quick else ''} --update-baseline",
+              file=stream)
+    slower = regressions(rows, args.threshold)
+    if slower:
+        print(f"⚠️ {len(slower)} benchmark(s) regressed by more than {args.threshold:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,11 +26,51 @@ def get_env_var(var_name, default=None, cast_func=str):
 # ✅ Define key environment variables
 LOG_LEVEL = get_env_var("LOG_LEVEL", "INFO").upper()
 PLUGIN_DIRECTORY = get_env_var("PLUGIN_DIRECTORY", "operations")
+PLUGIN_MANIFEST_PATH = get_env_var("PLUGIN_MANIFEST_PATH", ".plugin_manifest.json")
 DATABASE_URL = get_env_var("DATABASE_URL", "sqlite:///calculator.db")
 DEBUG_MODE = get_env_var("DEBUG_MODE", "False", lambda x: x.lower() in ["true", "1"])
 TEST_MODE = get_env_var("TEST_MODE", "False", lambda x: x.lower() in ["true", "1"])
 COVERAGE_THRESHOLD = get_env_var("COVERAGE_THRESHOLD", 80, int)
 HISTORY_FILE_PATH = get_env_var("HISTORY_FILE_PATH", "calculator_history.csv")
+HISTORY_BACKEND = get_env_var("HISTORY_BACKEND", "csv").lower()
+HISTORY_JOURNAL_MODE = get_env_var("HISTORY_JOURNAL_MODE", "True", lambda x: x.lower() in ["true", "1"])
+HISTORY_COMPACT_RATIO = get_env_var("HISTORY_COMPACT_RATIO", 0.5, float)
+HISTORY_COMPACT_MIN_GARBAGE = get_env_var("HISTORY_COMPACT_MIN_GARBAGE", 1000, int)
+HISTORY_PAGE_SIZE = get_env_var("HISTORY_PAGE_SIZE", 20, int)
+HISTORY_SEGMENT_BYTES = get_env_var("HISTORY_SEGMENT_BYTES", 4 * 1024 * 1024, int)
+HISTORY_SEGMENT_SECONDS = get_env_var("HISTORY_SEGMENT_SECONDS", 0, int)
+HISTORY_SEGMENT_COMPRESSION = get_env_var("HISTORY_SEGMENT_COMPRESSION", "gzip").lower()
+HISTORY_RETENTION_SEGMENTS = get_env_var("HISTORY_RETENTION_SEGMENTS", 0, int)
+HISTORY_RETENTION_DAYS = get_env_var("HISTORY_RETENTION_DAYS", 0, float)
+HISTORY_WRITE_BEHIND = get_env_var("HISTORY_WRITE_BEHIND", "False", lambda x: x.lower() in ["true", "1"])
+HISTORY_WRITE_BATCH_SIZE = get_env_var("HISTORY_WRITE_BATCH_SIZE", 256, int)
+HISTORY_WRITE_INTERVAL_MS = get_env_var("HISTORY_WRITE_INTERVAL_MS", 50, int)
+HISTORY_WRITE_DURABILITY = get_env_var("HISTORY_WRITE_DURABILITY", "flush").lower()
+VECTOR_MODE = get_env_var("VECTOR_MODE", "fast").lower()
+OPERAND_CHUNK_SIZE = get_env_var("OPERAND_CHUNK_SIZE", 65536, int)
+BINARY_OPERAND_MODE = get_env_var("BINARY_OPERAND_MODE", "fast").lower()
+STATS_WORKERS = get_env_var("STATS_WORKERS", 0, int)
+STATS_PARALLEL_MIN_VALUES = get_env_var("STATS_PARALLEL_MIN_VALUES", 5_000_000, int)
+RESULT_CACHE_SIZE = get_env_var("RESULT_CACHE_SIZE", 1024, int)
+RESULT_CACHE_PATH = get_env_var("RESULT_CACHE_PATH", "")
+EXPRESSION_CACHE_SIZE = get_env_var("EXPRESSION_CACHE_SIZE", 256, int)
+SERVER_HOST = get_env_var("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = get_env_var("SERVER_PORT", 8765, int)
+SERVER_SOCKET = get_env_var("SERVER_SOCKET", "")
+SERVER_CONCURRENCY = get_env_var("SERVER_CONCURRENCY", 32, int)
+SERVER_EXECUTOR = get_env_var("SERVER_EXECUTOR", "process").lower()
+NUMERIC_ENGINE = get_env_var("NUMERIC_ENGINE", "decimal").lower()
+FIXED_POINT_DECIMALS = get_env_var("FIXED_POINT_DECIMALS", 2, int)
+METRICS_ENABLED = get_env_var("METRICS_ENABLED", "True", lambda x: x.lower() in ["true", "1"])
+METRICS_EXPORT_PATH = get_env_var("METRICS_EXPORT_PATH", "")
 
 # ✅ Export all relevant variables
-__all__ = ["get_env_var", "LOG_LEVEL", "PLUGIN_DIRECTORY", "DATABASE_URL", "DEBUG_MODE", "TEST_MODE", "COVERAGE_THRESHOLD"]
+__all__ = ["get_env_var", "LOG_LEVEL", "PLUGIN_DIRECTORY", "PLUGIN_MANIFEST_PATH", "DATABASE_URL", "DEBUG_MODE", "TEST_MODE", "COVERAGE_THRESHOLD",
+           "HISTORY_BACKEND", "HISTORY_JOURNAL_MODE", "HISTORY_COMPACT_RATIO", "HISTORY_COMPACT_MIN_GARBAGE",
+           "HISTORY_PAGE_SIZE", "HISTORY_SEGMENT_BYTES", "HISTORY_SEGMENT_SECONDS", "HISTORY_SEGMENT_COMPRESSION",
+           "HISTORY_RETENTION_SEGMENTS", "HISTORY_RETENTION_DAYS", "HISTORY_WRITE_BEHIND", "HISTORY_WRITE_BATCH_SIZE",
+           "HISTORY_WRITE_INTERVAL_MS", "HISTORY_WRITE_DURABILITY", "VECTOR_MODE", "OPERAND_CHUNK_SIZE",
+           "BINARY_OPERAND_MODE", "STATS_WORKERS", "STATS_PARALLEL_MIN_VALUES",
+           "RESULT_CACHE_SIZE", "RESULT_CACHE_PATH", "EXPRESSION_CACHE_SIZE",
+           "SERVER_HOST", "SERVER_PORT", "SERVER_SOCKET", "SERVER_CONCURRENCY", "SERVER_EXECUTOR",
+           "NUMERIC_ENGINE", "FIXED_POINT_DECIMALS", "METRICS_ENABLED", "METRICS_EXPORT_PATH"]
@@ -0,0 +1,174 @@
+"""
+Runtime Metrics - Call counters and latency histograms for calculations and history I/O.
+
+Each family (``calculation``, ``history``) keeps, per label (the operation, or
+the ``History`` method), a call count, an error count and a latency histogram
+with buckets 20% apart from 1 µs to about a minute, so p50/p95/p99 are
+estimated within one bucket. Recording costs one ``bisect`` and a few
+additions under a lock; with ``METRICS_ENABLED`` off every hook returns after a
+single attribute check.
+
+Metrics are shown by the REPL's ``stats`` command and exported as Prometheus
+text or JSON (``stats export <file>``, or ``METRICS_EXPORT_PATH`` on exit).
+"""
+
+import atexit
+import functools
+import json
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+from config.env import METRICS_ENABLED, METRICS_EXPORT_PATH
+
+# ✅ Upper bounds (seconds) of the latency buckets; the last bucket catches anything slower
+BUCKET_BOUNDS = tuple(1e-6 * 1.2 ** index for index in range(100))
+QUANTILES = (0.5, 0.95, 0.99)
+
+_PROMETHEUS_PREFIX = "calculator"
+_LABEL_NAMES = {"calculation": "operation", "history": "method"}
+
+
+class LatencyHistogram:
+    """Calls, errors and a bucketed latency distribution for one label."""
+
+    __slots__ = ("buckets", "count", "errors", "total", "maximum")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds, error=False):
+        """Records one call."""
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, q):
+        """Estimates the ``q`` quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            if bucket and seen + bucket >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index else 0.0
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.maximum
+                return min(lower + (upper - lower) * (rank - seen) / bucket, self.maximum)
+            seen += bucket
+        return self.maximum
+
+    def summary(self):
+        """Returns calls, errors, total and maximum seconds and the standard quantiles."""
+        return {
+            "calls": self.count,
+            "errors": self.errors,
+            "seconds_total": self.total,
+            "seconds_max": self.maximum,
+            **{f"p{round(q * 100)}": self.quantile(q) for q in QUANTILES},
+        }
+
+
+class Metrics:
+    """Registry of latency histograms keyed by family and label."""
+
+    def __init__(self, enabled=METRICS_ENABLED):
+        self.enabled = enabled
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def record(self, family, label, seconds, error=False):
+        """Records one call of ``label`` in ``family``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            labels = self._families.setdefault(family, {})
+            histogram = labels.get(label)
+            if histogram is None:
+                histogram = labels[label] = LatencyHistogram()
+            histogram.observe(seconds, error)
+
+    def call(self, family, label, function, *args):
+        """Calls ``function(*args)`` and records it, counting a raised exception as an error."""
+        if not self.enabled:
+            return function(*args)
+        started = perf_counter()
+        try:
+            result = function(*args)
+        except BaseException:
+            self.record(family, label, perf_counter() - started, error=True)
+            raise
+        self.record(family, label, perf_counter() - started)
+        return result
+
+    def timed(self, family, label):
+        """Decorates a function so every call is recorded, counting raised exceptions as errors."""
+        def decorate(function):
+            @functools.wraps(function)
+            def timed_call(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                started = perf_counter()
+                try:
+                    result = function(*args, **kwargs)
+                except BaseException:
+                    self.record(family, label, perf_counter() - started, error=True)
+                    raise
+                self.record(family, label, perf_counter() - started)
+                return result
+            return timed_call
+        return decorate
+
+    def snapshot(self):
+        """Returns ``{family: {label: summary}}`` for everything recorded so far."""
+        with self._lock:
+            return {
+                family: {label: histogram.summary() for label, histogram in sorted(labels.items())}
+                for family, labels in sorted(self._families.items())
+            }
+
+    def reset(self):
+        """Discards everything recorded so far."""
+        with self._lock:
+            self._families.clear()
+
+    def to_json(self):
+        """Returns the snapshot as JSON text."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Returns the snapshot in the Prometheus text exposition format (one summary per family)."""
+        lines = []
+        for family, labels in self.snapshot().items():
+            name = f"{_PROMETHEUS_PREFIX}_{family}"
+            label_name = _LABEL_NAMES.get(family, "label")
+            lines += [f"# HELP {name}_seconds Latency of {family} calls.", f"# TYPE {name}_seconds summary"]
+            for label, summary in labels.items():
+                for q in QUANTILES:
+                    lines.append(f'{name}_seconds{{{label_name}="{label}",quantile="{q}"}} '
+                                 f"{summary[f'p{round(q * 100)}']:.9f}")
+                lines.append(f'{name}_seconds_sum{{{label_name}="{label}"}} {summary["seconds_total"]:.9f}')
+                lines.append(f'{name}_seconds_count{{{label_name}="{label}"}} {summary["calls"]}')
+            lines += [f"# HELP {name}_errors_total Failed {family} calls.", f"# TYPE {name}_errors_total counter"]
+            lines += [f'{name}_errors_total{{{label_name}="{label}"}} {summary["errors"]}'
+                      for label, summary in labels.items()]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Writes JSON to ``*.json`` paths and Prometheus text otherwise; returns the format used."""
+        export_format = "json" if path.lower().endswith(".json") else "prometheus"
+        with open(path, "w", encoding="utf-8") as export_file:
+            export_file.write(self.to_json() if export_format == "json" else self.to_prometheus())
+        return export_format
+
+
+# ✅ Shared by the REPL and the History facade
+metrics = Metrics()
+
+if METRICS_ENABLED and METRICS_EXPORT_PATH:
+    atexit.register(metrics.export, METRICS_EXPORT_PATH)
@@ -4,14 +4,25 @@ import importlib
 import logging
 import pkgutil
 from config.log_config import logger
+from mappings.manifest import build_manifest, read_manifest, write_manifest
 from mappings.operations_map import operation_mapping
 
 # ✅ Store loaded plugins to prevent duplicate imports
 _loaded_plugins = set()
 
 
-def load_plugins():
-    """Dynamically loads all operation plugins from the 'operations' package."""
+def load_plugins(refresh=False):
+    """
+    Loads operation plugins from the 'operations' package.
+
+    When the cached plugin manifest is current nothing is imported: operations are
+    loaded on first use. Otherwise (or when ``refresh`` is set) every module is
+    imported and the manifest is rewritten.
+    """
+    if not refresh and read_manifest() is not None:
+        logger.info("✅ Plugin manifest is current; operations load on first use.")
+        return
+
     import operations  # ✅ Prevents circular imports
 
     logger.info("🔄 Loading operation plugins...")
@@ -29,6 +40,7 @@ def load_plugins():
         except ImportError as e:
             logger.error("❌ Failed to import plugin: %s - %s", module_name, e)
 
+    write_manifest(build_manifest())
     logger.info("✅ Plugin system initialized!")
 
 
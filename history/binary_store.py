@@ -0,0 +1,629 @@
+"""
+Binary History Store - Persists calculation history as length-prefixed binary records.
+
+Layout of the data file (all integers little-endian):
+
+- a fixed 12-byte header: ``b"CALCHIST"``, format version (u16), reserved (u16);
+- records appended after it, each ``length (u32)`` followed by ``length`` bytes:
+  ``kind (u8)`` and ``ID (i64)``, then for entries the operation, the operand
+  count (u32), the operands and the result. Names and values are encoded as
+  ``tag (1 byte: s/i/f) + size (u8) + UTF-8 text`` (tags S/I/F with a u32 size
+  for values of 256 bytes or more), so operands keep their type without
+  ``ast.literal_eval``. Removals are tombstone records (kind 1,
+  ID only).
+
+Next to it, ``<file>.idx`` holds a 32-byte header (magic, a "sorted" flag, the
+data file's inode and how many of its bytes are indexed) and one 16-byte slot
+per entry: ``ID (i64)`` and the record's offset (u64). Removing an entry sets
+the top bit of its slot's offset in place. While IDs only grow, ``find`` is a
+binary search over the memory-mapped slots, and ``tail`` reads the newest
+entries without decoding the rest of the file. The index is derived data: when
+it is missing or behind the data file it is caught up (or rebuilt) by scanning
+records.
+
+The store is ``lazy``: ``count``, ``window``, ``position``, ``find`` and
+``newest_id`` answer the History facade's queries from the index, decoding
+only the records they return, so nothing is loaded into memory at startup.
+Removed slots are found by scanning the flag byte of each slot, and the slots
+of each operation are collected from the operation names alone; both are
+cached until the file changes (slots of one operation are only extended).
+
+``csv_to_binary`` and ``binary_to_csv`` convert to and from the CSV journal::
+
+    python -m history.binary_store to-binary history.csv history.bin
+"""
+
+import argparse
+import logging
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left
+
+from history.csv_store import TOMBSTONE, CSVHistoryStore
+from history.records import locate_live
+
+logger = logging.getLogger("calculator_logger")
+
+MAGIC = b"CALCHIST"
+VERSION = 1
+_HEADER = struct.Struct("<8sHH")
+_LENGTH = struct.Struct("<I")
+_RECORD_HEAD = struct.Struct("<Bq")
+_SHORT_VALUE = struct.Struct("<cB")
+_LONG_VALUE = struct.Struct("<cI")
+_COUNT = struct.Struct("<I")
+
+INDEX_MAGIC = b"CALCIDX1"
+_INDEX_HEADER = struct.Struct("<8sB7xQQ")  # magic, sorted, padding, data inode, indexed bytes
+_SLOT = struct.Struct("<qQ")
+_REMOVED = 1 << 63
+_FLAGGED = re.compile(rb"[\x80-\xff]")  # Top byte of a slot's offset with the removed bit set
+
+ENTRY, TOMBSTONE_KIND = 0, 1
+
+# ✅ Value tags: how an operand or result is turned back into a Python value (upper case: u32 size)
+_DECODERS = {b"s": str, b"i": int, b"f": float, b"S": str, b"I": int, b"F": float}
+
+
+def _encode_value(value):
+    """Encodes one operand or result, keeping ints and floats distinguishable from text."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        tag, text = b"i", str(value)
+    elif isinstance(value, float):
+        tag, text = b"f", repr(value)
+    else:
+        tag, text = b"s", str(value)
+    data = text.encode("utf-8")
+    if len(data) < 256:
+        return _SHORT_VALUE.pack(tag, len(data)) + data
+    return _LONG_VALUE.pack(tag.upper(), len(data)) + data
+
+
+def _loaded_value(value):
+    """Returns ``value`` as it reads back after encoding."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return str(value)
+
+
+def encode_entry(row):
+    """Encodes an ``(ID, Operation, Operands, Result)`` row as one length-prefixed record."""
+    entry_id, operation, operands, result = row
+    parts = [_RECORD_HEAD.pack(ENTRY, int(entry_id)), _encode_value(str(operation)), _COUNT.pack(len(operands))]
+    parts.extend(_encode_value(operand) for operand in operands)
+    parts.append(_encode_value(result))
+    body = b"".join(parts)
+    return _LENGTH.pack(len(body)) + body
+
+
+def encode_tombstone(entry_id):
+    """Encodes the removal of ``entry_id``."""
+    body = _RECORD_HEAD.pack(TOMBSTONE_KIND, int(entry_id))
+    return _LENGTH.pack(len(body)) + body
+
+
+def _decode_value(buffer, position):
+    """Decodes one value at ``position`` and returns it with the position after it."""
+    tag, size = _SHORT_VALUE.unpack_from(buffer, position)
+    if tag.islower():
+        start = position + _SHORT_VALUE.size
+    else:
+        tag, size = _LONG_VALUE.unpack_from(buffer, position)
+        start = position + _LONG_VALUE.size
+    return _DECODERS[tag](str(buffer[start:start + size], "utf-8")), start + size
+
+
+def decode_record(buffer, position):
+    """Decodes the record at ``position``: returns ``(kind, row or ID, next position)``."""
+    (length,) = _LENGTH.unpack_from(buffer, position)
+    start = position + _LENGTH.size
+    kind, entry_id = _RECORD_HEAD.unpack_from(buffer, start)
+    if kind == TOMBSTONE_KIND:
+        return kind, entry_id, start + length
+    operation, cursor = _decode_value(buffer, start + _RECORD_HEAD.size)
+    (count,) = _COUNT.unpack_from(buffer, cursor)
+    cursor += _COUNT.size
+    operands = []
+    for _ in range(count):
+        operand, cursor = _decode_value(buffer, cursor)
+        operands.append(operand)
+    result, _ = _decode_value(buffer, cursor)
+    return kind, (entry_id, operation, operands, result), start + length
+
+
+class BinaryHistoryStore:
+    """Reads and writes history rows in a binary record log with a memory-mappable offset index."""
+
+    incremental = True  # ✅ Entries and removals are appended as single records
+    lazy = True  # ✅ Queries are answered from the offset index without loading every record
+
+    def __init__(self, path, compact_ratio=0.5, compact_min_garbage=1000):
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.compact_ratio = compact_ratio
+        self.compact_min_garbage = compact_min_garbage
+        self.garbage = 0  # Dead records (tombstones and the entries they cancel) in the log
+        self._position = None  # (device, inode, offset) consumed by the last load or own write
+        self._removed_view = None  # (file key, sorted removed slots) from the last flag scan
+        self._operation_view = None  # [(device, inode), slots scanned, {operation: slots}, last slot] when filtering
+
+    # 🔹 Data file
+
+    def _read_data(self):
+        """Returns the data file's bytes and stat (raises FileNotFoundError when missing)."""
+        with open(self.path, "rb") as data_file:
+            data = data_file.read()
+            stat = os.fstat(data_file.fileno())
+        self._check_header(data)
+        return data, stat
+
+    def _check_header(self, data):
+        """Raises ValueError unless ``data`` starts with this format's header."""
+        if len(data) < _HEADER.size:
+            raise ValueError(f"⚠️ '{self.path}' is not a binary history file.")
+        magic, version, _ = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"⚠️ '{self.path}' is not a binary history file (version {VERSION}).")
+
+    @staticmethod
+    def _replay(data, position):
+        """Decodes records from ``position``, letting each tombstone cancel the entries before it."""
+        rows = []
+        positions_by_id = {}
+        garbage = 0
+        end = len(data)
+        while position < end:
+            kind, value, position = decode_record(data, position)
+            if kind == TOMBSTONE_KIND:
+                cancelled = positions_by_id.pop(value, ())
+                for cancelled_position in cancelled:
+                    rows[cancelled_position] = None
+                garbage += len(cancelled) + 1
+                continue
+            positions_by_id.setdefault(value[0], []).append(len(rows))
+            rows.append(value)
+        return rows, garbage
+
+    def load(self):
+        """Returns the live history rows as ``(ID, Operation, Operands, Result)`` tuples."""
+        try:
+            data, stat = self._read_data()
+        except FileNotFoundError:
+            self.garbage = 0
+            self._position = None
+            return []
+        rows, self.garbage = self._replay(memoryview(data), _HEADER.size)
+        self._position = (stat.st_dev, stat.st_ino, len(data))
+        return [row for row in rows if row is not None] if self.garbage else rows
+
+    def load_changes(self):
+        """Returns records appended since the last read (removals as tombstone rows), or ``None`` to reload."""
+        if self._position is None:
+            return None
+        device, inode, offset = self._position
+        try:
+            with open(self.path, "rb") as data_file:
+                stat = os.fstat(data_file.fileno())
+                if (stat.st_dev, stat.st_ino) != (device, inode) or stat.st_size < offset:
+                    return None  # 🔹 Rewritten (always through a replace) or truncated
+                data_file.seek(offset)
+                data = data_file.read()
+        except FileNotFoundError:
+            return None
+        self._position = (device, inode, offset + len(data))
+
+        changes = []
+        view, position = memoryview(data), 0
+        while position < len(data):
+            kind, value, position = decode_record(view, position)
+            if kind == TOMBSTONE_KIND:
+                changes.append((value, TOMBSTONE, [], ""))
+                self.garbage += 2  # The tombstone and the entry it cancels
+            else:
+                changes.append(value)
+        return changes
+
+    @staticmethod
+    def as_loaded(row):
+        """Returns ``row`` as ``load`` would read it back."""
+        entry_id, operation, operands, result = row
+        return int(entry_id), str(operation), [_loaded_value(operand) for operand in operands], _loaded_value(result)
+
+    def _append_records(self, records, slots, removed_ids=()):
+        """Appends encoded records and keeps the index and the consumed offset in step."""
+        if not os.path.exists(self.path):
+            self.rewrite([])
+        current = self._is_current()
+        with open(self.path, "ab") as data_file:
+            start = data_file.tell()
+            data = b"".join(records)
+            data_file.write(data)
+            data_file.flush()
+            stat = os.fstat(data_file.fileno())
+        if current and stat.st_size == start + len(data):
+            self._position = (stat.st_dev, stat.st_ino, stat.st_size)
+        else:
+            self._position = None
+        self._update_index(start, slots, removed_ids, stat)
+
+    def _is_current(self):
+        """True when nobody has appended to or replaced the file since it was last read or written here."""
+        if self._position is None:
+            return False
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_dev, stat.st_ino, stat.st_size) == self._position
+
+    def append(self, rows):
+        """Appends ``(ID, Operation, Operands, Result)`` rows as entry records."""
+        records, slots, offset = [], [], 0
+        for row in rows:
+            record = encode_entry(row)
+            records.append(record)
+            slots.append((int(row[0]), offset))
+            offset += len(record)
+        if records:
+            self._append_records(records, slots)
+
+    def remove(self, entry_id, removed_count=1):
+        """Appends a tombstone for ``entry_id`` and marks its index slots removed."""
+        self._append_records([encode_tombstone(entry_id)], [], [int(entry_id)])
+        self.garbage += removed_count + 1
+
+    def clear(self):
+        """Truncates the history down to its header."""
+        self.rewrite([])
+
+    def rewrite(self, rows):
+        """Replaces the file (through a temporary file and ``os.replace``) with the given live rows."""
+        temporary = f"{self.path}.tmp"
+        slots, offset = [], _HEADER.size
+        with open(temporary, "wb") as data_file:
+            data_file.write(_HEADER.pack(MAGIC, VERSION, 0))
+            for row in rows:
+                record = encode_entry(row)
+                data_file.write(record)
+                slots.append((int(row[0]), offset))
+                offset += len(record)
+        os.replace(temporary, self.path)
+        self._forget_views()
+        stat = os.stat(self.path)
+        self._write_index(slots, stat)
+        self._position = (stat.st_dev, stat.st_ino, stat.st_size)
+        self.garbage = 0
+
+    def sync(self):
+        """Forces the records and their index to disk with ``fsync``."""
+        for path in (self.path, self.index_path):
+            if os.path.exists(path):
+                with open(path, "ab") as synced:
+                    os.fsync(synced.fileno())
+
+    def needs_compaction(self, live_count):
+        """True once dead records outweigh the configured threshold."""
+        if self.garbage < self.compact_min_garbage:
+            return False
+        return self.garbage >= self.compact_ratio * live_count
+
+    def close(self):
+        """Nothing is kept open between calls."""
+
+    # 🔹 Offset index
+
+    def _write_index(self, slots, stat):
+        """Writes a fresh index for ``slots`` (``(ID, offset)`` pairs in file order)."""
+        ids = [entry_id for entry_id, _ in slots]
+        is_sorted = all(earlier <= later for earlier, later in zip(ids, ids[1:]))
+        temporary = f"{self.index_path}.tmp"
+        with open(temporary, "wb") as index_file:
+            index_file.write(_INDEX_HEADER.pack(INDEX_MAGIC, is_sorted, stat.st_ino, stat.st_size))
+            index_file.write(b"".join(_SLOT.pack(entry_id, offset) for entry_id, offset in slots))
+        os.replace(temporary, self.index_path)
+
+    def _read_index_header(self):
+        """Returns ``(sorted, inode, indexed bytes)`` or ``None`` when the index is missing or foreign."""
+        try:
+            with open(self.index_path, "rb") as index_file:
+                header = index_file.read(_INDEX_HEADER.size)
+        except FileNotFoundError:
+            return None
+        if len(header) < _INDEX_HEADER.size:
+            return None
+        magic, is_sorted, inode, indexed = _INDEX_HEADER.unpack(header)
+        return (bool(is_sorted), inode, indexed) if magic == INDEX_MAGIC else None
+
+    def _update_index(self, start, slots, removed_ids, stat):
+        """Appends slots for records written at ``start`` and flags removed IDs, rebuilding if out of step."""
+        header = self._read_index_header()
+        if header is None or header[1] != stat.st_ino or header[2] != start:
+            self._rebuild_index()
+            return
+        is_sorted = header[0]
+        with open(self.index_path, "r+b") as index_file:
+            if slots:
+                ids = [entry_id for entry_id, _ in slots]
+                end = index_file.seek(0, os.SEEK_END)
+                if end > _INDEX_HEADER.size:
+                    index_file.seek(end - _SLOT.size)
+                    ids.insert(0, _SLOT.unpack(index_file.read(_SLOT.size))[0])
+                is_sorted = is_sorted and all(earlier <= later for earlier, later in zip(ids, ids[1:]))
+                index_file.seek(0, os.SEEK_END)
+                index_file.write(b"".join(_SLOT.pack(entry_id, start + offset) for entry_id, offset in slots))
+            for entry_id in removed_ids:
+                self._flag_removed(index_file, entry_id, is_sorted)
+            index_file.seek(0)
+            index_file.write(_INDEX_HEADER.pack(INDEX_MAGIC, is_sorted, stat.st_ino, stat.st_size))
+
+    def _flag_removed(self, index_file, entry_id, is_sorted):
+        """Sets the removed bit on every live slot holding ``entry_id``."""
+        index_file.seek(0, os.SEEK_END)
+        count = (index_file.tell() - _INDEX_HEADER.size) // _SLOT.size
+        if not count:
+            return
+        with mmap.mmap(index_file.fileno(), 0) as mapped:
+            for slot in self._slots_with_id(mapped, count, entry_id, is_sorted):
+                position = _INDEX_HEADER.size + slot * _SLOT.size
+                _, offset = _SLOT.unpack_from(mapped, position)
+                _SLOT.pack_into(mapped, position, entry_id, offset | _REMOVED)
+
+    @staticmethod
+    def _slots_with_id(mapped, count, entry_id, is_sorted):
+        """Returns the slot numbers holding ``entry_id``."""
+        slots = memoryview(mapped)[_INDEX_HEADER.size:_INDEX_HEADER.size + count * _SLOT.size].cast("q")
+        try:
+            if is_sorted:
+                # ✅ IDs only grow: binary search over the mapped slots (every other i64 is an ID)
+                first = bisect_left(range(count), entry_id, key=lambda slot: slots[2 * slot])
+                matches = []
+                while first < count and slots[2 * first] == entry_id:
+                    matches.append(first)
+                    first += 1
+                return matches
+            ids = array("q", slots.tobytes())[::2]
+            return [slot for slot, slot_id in enumerate(ids) if slot_id == entry_id]
+        finally:
+            slots.release()
+
+    def _rebuild_index(self):
+        """Rebuilds the index by scanning every record of the data file."""
+        data, stat = self._read_data()
+        view = memoryview(data)
+        slots, slot_of = [], {}
+        position = _HEADER.size
+        while position < len(data):
+            kind, value, next_position = decode_record(view, position)
+            if kind == TOMBSTONE_KIND:
+                for slot in slot_of.pop(value, ()):
+                    slots[slot] = (slots[slot][0], slots[slot][1] | _REMOVED)
+            else:
+                slot_of.setdefault(value[0], []).append(len(slots))
+                slots.append((value[0], position))
+            position = next_position
+        self._write_index(slots, stat)
+        logger.info(f"🗂️ History index rebuilt for {self.path}.")
+
+    def _mapped(self):
+        """Maps the data file and its (caught-up) index; returns ``(data, slots, count, sorted, stat)`` or ``None``."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        header = self._read_index_header()
+        if header is None or header[1] != stat.st_ino or header[2] != stat.st_size:
+            self._rebuild_index()
+            header = self._read_index_header()
+        if stat.st_size <= _HEADER.size:
+            return None
+        with open(self.path, "rb") as data_file, open(self.index_path, "rb") as index_file:
+            data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+            index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        count = (len(index) - _INDEX_HEADER.size) // _SLOT.size
+        return data, index, count, header[0], stat
+
+    def find(self, entry_id):
+        """Reads the live entry with ``entry_id`` straight from the mapped file, or returns ``None``."""
+        mapped = self._mapped()
+        if mapped is None:
+            return None
+        data, index, count, is_sorted, _ = mapped
+        try:
+            for slot in reversed(self._slots_with_id(index, count, int(entry_id), is_sorted)):
+                _, offset = _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)
+                if not offset & _REMOVED:
+                    return decode_record(data, offset)[1]
+            return None
+        finally:
+            data.close()
+            index.close()
+
+    def tail(self, limit):
+        """Returns the newest ``limit`` live entries, oldest first, decoding only those records."""
+        mapped = self._mapped()
+        if mapped is None:
+            return []
+        data, index, count, _, _ = mapped
+        try:
+            rows = []
+            slot = count - 1
+            while slot >= 0 and len(rows) < limit:
+                _, offset = _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)
+                if not offset & _REMOVED:
+                    rows.append(decode_record(data, offset)[1])
+                slot -= 1
+            rows.reverse()
+            return rows
+        finally:
+            data.close()
+            index.close()
+
+    # 🔹 Lazy queries
+
+    def refresh(self):
+        """Nothing to drop: cached views are keyed by the file's identity, size and modification time."""
+
+    def _forget_views(self):
+        """Drops the cached removed and per-operation slots (the file was replaced)."""
+        self._removed_view = None
+        self._operation_view = None
+
+    def _removed_slots(self, index, count, stat):
+        """Returns the sorted slot numbers flagged removed, rescanning only when the file changed."""
+        _, _, inode, indexed = _INDEX_HEADER.unpack_from(index)
+        key = (stat.st_dev, inode, indexed, stat.st_mtime_ns)
+        if self._removed_view is None or self._removed_view[0] != key:
+            first_flag = _INDEX_HEADER.size + _SLOT.size - 1
+            flags = index[first_flag:_INDEX_HEADER.size + count * _SLOT.size:_SLOT.size]
+            removed = [match.start() for match in _FLAGGED.finditer(flags)]
+            self._removed_view = (key, removed)
+            self.garbage = 2 * len(removed)  # 🔹 Each removal leaves a tombstone and a cancelled entry
+        return self._removed_view[1]
+
+    @staticmethod
+    def _slot(index, slot):
+        """Returns slot ``slot`` as ``(ID, record offset)``, without its removed bit."""
+        entry_id, offset = _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)
+        return entry_id, offset & ~_REMOVED
+
+    def _operation_slots(self, data, index, count, operation, stat):
+        """Returns the slot numbers of ``operation``'s entries, reading only the names of unseen slots."""
+        key = (stat.st_dev, _INDEX_HEADER.unpack_from(index)[2])
+        view = self._operation_view
+        # 🔹 Slots are only ever appended to one file, so the view is extended unless the file was replaced
+        #    (another inode, or a reused one whose slots no longer match)
+        if view is None or view[0] != key or count < view[1] or (view[1] and self._slot(index, view[1] - 1) != view[3]):
+            view = self._operation_view = [key, 0, {}, None]
+        _, scanned, slots_by_operation, _ = view
+        name_offset = _LENGTH.size + _RECORD_HEAD.size
+        for slot in range(scanned, count):
+            _, offset = self._slot(index, slot)
+            name, _ = _decode_value(data, offset + name_offset)
+            slots_by_operation.setdefault(name, array("q")).append(slot)
+        if count > scanned:
+            view[1], view[3] = count, self._slot(index, count - 1)
+        return slots_by_operation.get(operation, array("q"))
+
+    def _sequence(self, data, index, count, stat, operation=None):
+        """Returns the slots to visit (all, or one operation's) and which of them are removed."""
+        removed = self._removed_slots(index, count, stat)
+        if operation is None:
+            return range(count), removed
+        slots = self._operation_slots(data, index, count, operation, stat)
+        return slots, [slot for slot in removed if self._holds(slots, slot)]
+
+    @staticmethod
+    def _holds(slots, slot):
+        """True when the sorted ``slots`` contain ``slot``."""
+        position = bisect_left(slots, slot)
+        return position < len(slots) and slots[position] == slot
+
+    def count(self, operation=None):
+        """Returns the number of live entries, optionally for one operation only."""
+        mapped = self._mapped()
+        if mapped is None:
+            return 0
+        data, index, count, _, stat = mapped
+        try:
+            sequence, removed = self._sequence(data, index, count, stat, operation)
+            return len(sequence) - len(removed)
+        finally:
+            data.close()
+            index.close()
+
+    def window(self, offset, limit, operation=None):
+        """Returns at most ``limit`` live entries starting at ``offset``, decoding only those records."""
+        mapped = self._mapped()
+        if mapped is None:
+            return []
+        data, index, count, _, stat = mapped
+        try:
+            sequence, removed = self._sequence(data, index, count, stat, operation)
+            offset = max(offset, 0)
+            limit = max(min(limit, len(sequence) - len(removed) - offset), 0)
+            if not limit:
+                return []
+            start = locate_live(sequence, removed, offset)
+            end = locate_live(sequence, removed, offset + limit - 1)
+            rows = []
+            for slot in sequence[start:end + 1]:
+                _, record = _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)
+                if not record & _REMOVED:
+                    rows.append(decode_record(data, record)[1])
+            return rows
+        finally:
+            data.close()
+            index.close()
+
+    def position(self, entry_id, operation=None):
+        """Returns the offset of ``entry_id`` among live (optionally filtered) entries, or ``None``."""
+        mapped = self._mapped()
+        if mapped is None:
+            return None
+        data, index, count, is_sorted, stat = mapped
+        try:
+            sequence, removed = self._sequence(data, index, count, stat, operation)
+            # 🔹 The oldest live slot with this ID (and operation, when filtering) comes first
+            for slot in self._slots_with_id(index, count, int(entry_id), is_sorted):
+                _, record = _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)
+                if record & _REMOVED or (operation is not None and not self._holds(sequence, slot)):
+                    continue
+                return bisect_left(sequence, slot) - bisect_left(removed, slot)
+            return None
+        finally:
+            data.close()
+            index.close()
+
+    def newest_id(self):
+        """Returns the highest live entry ID, or 0 when there is none."""
+        mapped = self._mapped()
+        if mapped is None:
+            return 0
+        data, index, count, is_sorted, _ = mapped
+        try:
+            slots = range(count - 1, -1, -1) if is_sorted else range(count)
+            newest = 0
+            for slot in slots:
+                entry_id, record = _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)
+                if record & _REMOVED:
+                    continue
+                if is_sorted:
+                    return entry_id  # ✅ IDs only grow: the last live slot holds the highest
+                newest = max(newest, entry_id)
+            return newest
+        finally:
+            data.close()
+            index.close()
+
+
+def csv_to_binary(csv_path, binary_path):
+    """Converts a CSV history journal to the binary format and returns the number of entries written."""
+    rows = CSVHistoryStore(csv_path).load()
+    BinaryHistoryStore(binary_path).rewrite(rows)
+    return len(rows)
+
+
+def binary_to_csv(binary_path, csv_path):
+    """Converts a binary history file to a CSV journal and returns the number of entries written."""
+    rows = BinaryHistoryStore(binary_path).load()
+    CSVHistoryStore(csv_path).rewrite(rows)
+    return len(rows)
+
+
+def main(argv=None):
+    """Converts between the CSV and binary history formats."""
+    parser = argparse.ArgumentParser(description="Convert calculator history between CSV and binary formats.")
+    parser.add_argument("direction", choices=["to-binary", "to-csv"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args(argv)
+    convert = csv_to_binary if args.direction == "to-binary" else binary_to_csv
+    count = convert(args.source, args.destination)
+    print(f"✅ {count} entries written to {args.destination}.")
+
+
+if __name__ == "__main__":
+    main()
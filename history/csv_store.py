@@ -0,0 +1,220 @@
+"""
+CSV History Store - Persists calculation history to a CSV file.
+
+In journal mode the file is an append-only log: new entries are appended as
+single rows, removals are appended as tombstone rows and clearing truncates the
+file. ``rewrite`` replaces the file with the live rows only.
+
+The store remembers how far into the file it has read (byte offset, device,
+inode, size, mtime and the last bytes consumed), so ``load_changes`` only
+parses rows appended since, by anyone. A file that was replaced, truncated or
+rewritten is reported so the caller falls back to a full ``load``.
+"""
+
+import ast
+import csv
+import io
+import logging
+import os
+
+logger = logging.getLogger("calculator_logger")
+
+COLUMNS = ["ID", "Operation", "Operands", "Result"]
+TOMBSTONE = "__removed__"
+
+
+def _serialize(row):
+    """Formats a row for CSV, storing operands as a Python list literal."""
+    entry_id, operation, operands, result = row
+    return [int(entry_id), operation, str(list(operands)), result]
+
+
+# ✅ Bytes before the read offset re-checked to detect a rewrite that only grew the file
+_FINGERPRINT_BYTES = 64
+
+
+def _parse_scalar(text):
+    """Parses a stored result the way ``pandas.read_csv`` would infer it."""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+class CSVHistoryStore:
+    """Reads and writes history rows in a CSV file."""
+
+    lazy = False  # Queries are answered from the rows loaded into memory
+
+    def __init__(self, path, journal_mode=True, compact_ratio=0.5, compact_min_garbage=1000):
+        self.path = path
+        self.journal_mode = journal_mode
+        self.compact_ratio = compact_ratio
+        self.compact_min_garbage = compact_min_garbage
+        self.garbage = 0  # Dead rows (tombstones and the entries they cancel) in the journal
+        self._position = None  # (device, inode, offset, mtime_ns, fingerprint) after the last read or own write
+
+    @property
+    def incremental(self):
+        """True when single entries can be persisted without a full rewrite."""
+        return self.journal_mode
+
+    def load(self):
+        """Returns the live history rows as ``(ID, Operation, Operands, Result)`` tuples."""
+        try:
+            with open(self.path, "rb") as journal:
+                data = journal.read()
+                self._remember(os.fstat(journal.fileno()), len(data), data[-_FINGERPRINT_BYTES:])
+        except FileNotFoundError:
+            self.garbage = 0
+            self._position = (None, None, 0, None, b"")  # ✅ Known to be missing, so our first append stays current
+            return []
+        reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+        if next(reader, None) is None:
+            self.garbage = 0
+            return []
+        return self._replay(reader)
+
+    def load_changes(self):
+        """
+        Returns the journal rows appended since the last read, or ``None`` when a full ``load`` is needed.
+
+        Removals come back as ``(ID, TOMBSTONE, [], "")`` rows.
+        """
+        if self._position is None:
+            return None
+        device, inode, offset, mtime_ns, fingerprint = self._position
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        if (stat.st_dev, stat.st_ino) != (device, inode) or stat.st_size < offset or offset == 0:
+            return None  # 🔹 Replaced, truncated or never read past the header
+        if stat.st_size == offset:
+            return [] if stat.st_mtime_ns == mtime_ns else None
+
+        with open(self.path, "rb") as journal:
+            journal.seek(offset - len(fingerprint))
+            if journal.read(len(fingerprint)) != fingerprint:
+                return None  # 🔹 Rewritten in place and grown past the old end
+            data = journal.read()
+            self._remember(os.fstat(journal.fileno()), offset + len(data), (fingerprint + data)[-_FINGERPRINT_BYTES:])
+
+        changes = []
+        for record in csv.reader(io.StringIO(data.decode("utf-8"), newline="")):
+            if record:
+                changes.append(self._parse(record))
+                if changes[-1][1] == TOMBSTONE:
+                    self.garbage += 2  # The tombstone and the entry it cancels
+        return changes
+
+    @staticmethod
+    def as_loaded(row):
+        """Returns ``row`` as ``load`` would read it back, so in-memory and reloaded entries match."""
+        entry_id, operation, operands, result = row
+        return int(entry_id), operation, operands, _parse_scalar(str(result))
+
+    def _remember(self, stat, offset, fingerprint):
+        """Records how far the file has been consumed."""
+        self._position = (stat.st_dev, stat.st_ino, offset, stat.st_mtime_ns, fingerprint)
+
+    def _is_current(self):
+        """True when nobody has changed the file since it was last read or written here."""
+        if self._position is None:
+            return False
+        device, inode, offset, mtime_ns, _ = self._position
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return device is None
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns) == (device, inode, offset, mtime_ns)
+
+    @staticmethod
+    def _parse(record):
+        """Converts one CSV record to a row, with operands back as a list."""
+        entry_id, operation, operands, result = record
+        if operation == TOMBSTONE:
+            return int(entry_id), TOMBSTONE, [], ""
+        return int(entry_id), operation, ast.literal_eval(operands) if operands else [], _parse_scalar(result)
+
+    def _replay(self, reader):
+        """Replays journal rows, letting each tombstone cancel the rows written before it."""
+        rows = []
+        positions_by_id = {}
+        garbage = 0
+        for record in reader:
+            if not record:
+                continue
+            row = self._parse(record)
+            entry_id = row[0]
+            if row[1] == TOMBSTONE:
+                cancelled = positions_by_id.pop(entry_id, ())
+                for position in cancelled:
+                    rows[position] = None
+                garbage += len(cancelled) + 1
+                continue
+            positions_by_id.setdefault(entry_id, []).append(len(rows))
+            rows.append(row)
+
+        self.garbage = garbage
+        return [row for row in rows if row is not None] if garbage else rows
+
+    def _append_raw(self, csv_rows):
+        """Appends already formatted rows, writing the header for a new file."""
+        current = self._is_current()
+        needs_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer, lineterminator="\n")
+        if needs_header:
+            writer.writerow(COLUMNS)
+        writer.writerows(csv_rows)
+        data = buffer.getvalue().encode("utf-8")
+
+        with open(self.path, "ab") as journal:
+            journal.write(data)
+            journal.flush()
+            stat = os.fstat(journal.fileno())
+        if current and stat.st_size == self._position[2] + len(data):
+            # ✅ Our own rows are already in memory; skip past them on the next incremental load
+            self._remember(stat, stat.st_size, (self._position[4] + data)[-_FINGERPRINT_BYTES:])
+        else:
+            self._position = None
+
+    def append(self, rows):
+        """Appends ``(ID, Operation, Operands, Result)`` rows to the journal."""
+        self._append_raw(_serialize(row) for row in rows)
+
+    def sync(self):
+        """Forces the journal to disk with ``fsync``."""
+        if os.path.exists(self.path):
+            with open(self.path, "ab") as journal:
+                os.fsync(journal.fileno())
+
+    def remove(self, entry_id, removed_count=1):
+        """Journals a tombstone for ``entry_id``."""
+        self._append_raw([[int(entry_id), TOMBSTONE, "", ""]])
+        self.garbage += removed_count + 1
+
+    def clear(self):
+        """Truncates the file down to its header."""
+        self.rewrite([])
+
+    def rewrite(self, rows):
+        """Replaces the file contents with the given live rows."""
+        with open(self.path, "w", newline="", encoding="utf-8") as journal:
+            writer = csv.writer(journal, lineterminator="\n")
+            writer.writerow(COLUMNS)
+            writer.writerows(_serialize(row) for row in rows)
+        self.garbage = 0
+        with open(self.path, "rb") as journal:
+            stat = os.fstat(journal.fileno())
+            journal.seek(max(stat.st_size - _FINGERPRINT_BYTES, 0))
+            self._remember(stat, stat.st_size, journal.read())
+
+    def needs_compaction(self, live_count):
+        """True once dead rows outweigh the configured threshold."""
+        if not self.journal_mode or self.garbage < self.compact_min_garbage:
+            return False
+        return self.garbage >= self.compact_ratio * live_count
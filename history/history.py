@@ -1,94 +1,343 @@
 """
-History Module - Manages storage and retrieval of calculation history using Pandas.
+History Module - Manages storage and retrieval of calculation history.
+
+Entries are held in memory by a compact ``HistoryRecords`` store; a Pandas
+DataFrame is only built when ``get_history`` is called for display or analysis.
+Stores marked ``lazy`` (binary and segmented) answer ``count``, ``entries``,
+``find`` and ``position`` themselves, so their history is never loaded whole.
+
+Persistence is delegated to a store chosen by ``HISTORY_BACKEND``: ``csv``
+(the default, see ``history.csv_store``), ``sqlite`` (see
+``history.sqlite_store``, located through ``DATABASE_URL``), ``binary`` (see
+``history.binary_store``, the history file with a ``.bin`` extension) or
+``segmented`` (see ``history.segmented_store``, a ``.segments`` directory).
+
+Reads and writes of the store are timed under the ``history`` metrics family
+(see ``config.metrics``).
+
+With ``HISTORY_WRITE_BEHIND`` on, new entries are written by a background
+``WriteBehindWriter`` (see ``history.writer``) instead of the calling thread.
+Queued entries are flushed before anything else touches the store.
 """
 
-import pandas as pd
 import logging
-import ast
+import os
 
-import pytest
+from config.env import (
+    DATABASE_URL,
+    HISTORY_BACKEND,
+    HISTORY_COMPACT_MIN_GARBAGE,
+    HISTORY_COMPACT_RATIO,
+    HISTORY_JOURNAL_MODE,
+    HISTORY_RETENTION_DAYS,
+    HISTORY_RETENTION_SEGMENTS,
+    HISTORY_SEGMENT_BYTES,
+    HISTORY_SEGMENT_COMPRESSION,
+    HISTORY_SEGMENT_SECONDS,
+    HISTORY_WRITE_BATCH_SIZE,
+    HISTORY_WRITE_BEHIND,
+    HISTORY_WRITE_DURABILITY,
+    HISTORY_WRITE_INTERVAL_MS,
+)
+from config.metrics import metrics
+from history.csv_store import COLUMNS, TOMBSTONE, CSVHistoryStore
+from history.records import HistoryRecords
 
 # ✅ Setup logger
 logger = logging.getLogger("calculator_logger")
 
+__all__ = ["History", "COLUMNS", "TOMBSTONE"]
+
 
 class History:
-    """Manages calculation history using a Pandas DataFrame."""
-    _history = pd.DataFrame(columns=["ID", "Operation", "Operands", "Result"])
+    """Manages calculation history behind a simple facade."""
+    _records = HistoryRecords()
     _history_file = "history.csv"
+    _backend = HISTORY_BACKEND
+    _database_url = DATABASE_URL
+    _journal_mode = HISTORY_JOURNAL_MODE
+    _store = None
+    _store_key = None
+    _loaded = False
+    _write_behind = HISTORY_WRITE_BEHIND
+    _writer = None
+    _next_id = None  # Next entry ID on a lazy store, read from it once and then counted up
+
+    @classmethod
+    def _get_store(cls):
+        """Returns the configured store, rebuilding it when the configuration changes."""
+        key = (cls._backend, cls._history_file, cls._database_url, cls._journal_mode)
+        if cls._store is None or cls._store_key != key:
+            cls.close_writer()  # ✅ Queued entries belong to the previous store
+            if cls._backend == "sqlite":
+                from history.sqlite_store import SQLiteHistoryStore  # ✅ Only imported when selected
+
+                cls._store = SQLiteHistoryStore(cls._database_url)
+            elif cls._backend == "binary":
+                from history.binary_store import BinaryHistoryStore  # ✅ Only imported when selected
+
+                cls._store = BinaryHistoryStore(
+                    os.path.splitext(cls._history_file)[0] + ".bin",
+                    compact_ratio=HISTORY_COMPACT_RATIO,
+                    compact_min_garbage=HISTORY_COMPACT_MIN_GARBAGE,
+                )
+            elif cls._backend == "segmented":
+                from history.segmented_store import SegmentedHistoryStore  # ✅ Only imported when selected
+
+                cls._store = SegmentedHistoryStore(
+                    os.path.splitext(cls._history_file)[0] + ".segments",
+                    segment_bytes=HISTORY_SEGMENT_BYTES,
+                    segment_seconds=HISTORY_SEGMENT_SECONDS,
+                    compression=HISTORY_SEGMENT_COMPRESSION,
+                    retention_segments=HISTORY_RETENTION_SEGMENTS,
+                    retention_seconds=HISTORY_RETENTION_DAYS * 86400,
+                    compact_ratio=HISTORY_COMPACT_RATIO,
+                    compact_min_garbage=HISTORY_COMPACT_MIN_GARBAGE,
+                )
+            elif cls._backend == "csv":
+                cls._store = CSVHistoryStore(
+                    cls._history_file,
+                    journal_mode=cls._journal_mode,
+                    compact_ratio=HISTORY_COMPACT_RATIO,
+                    compact_min_garbage=HISTORY_COMPACT_MIN_GARBAGE,
+                )
+            else:
+                raise ValueError(f"⚠️ Unknown history backend '{cls._backend}'. Expected 'csv', 'sqlite', 'binary' or 'segmented'.")
+            cls._store_key = key
+            cls._loaded = False
+            cls._next_id = None
+        return cls._store
+
+    @classmethod
+    def _get_writer(cls):
+        """Returns the background writer for the current store, or ``None`` when writes are synchronous."""
+        store = cls._get_store()
+        if not cls._write_behind or not store.incremental:
+            return None
+        if cls._writer is None:
+            from history.writer import WriteBehindWriter  # ✅ Only imported when selected
+
+            cls._writer = WriteBehindWriter(
+                store,
+                batch_size=HISTORY_WRITE_BATCH_SIZE,
+                interval=HISTORY_WRITE_INTERVAL_MS / 1000,
+                durability=HISTORY_WRITE_DURABILITY,
+            )
+        return cls._writer
+
+    @classmethod
+    def flush(cls):
+        """Blocks until entries queued for the background writer are persisted."""
+        if cls._writer is not None:
+            cls._writer.flush()
+
+    @classmethod
+    def close_writer(cls):
+        """Flushes and stops the background writer, if one is running."""
+        if cls._writer is not None:
+            writer, cls._writer = cls._writer, None
+            writer.close()
+
+    @classmethod
+    def writer_stats(cls):
+        """Returns the background writer's queue depth and last group latency, or ``None``."""
+        return cls._writer.stats() if cls._writer is not None else None
+
+    @classmethod
+    def _is_lazy(cls):
+        """True when the store answers queries itself instead of being loaded into memory."""
+        return cls._get_store().lazy
 
     @classmethod
     def get_history(cls):
-        """Retrieves stored history from CSV or initializes an empty DataFrame."""
-        try:
-            cls._history = pd.read_csv(cls._history_file)
+        """Reloads history from the configured store and returns it as a DataFrame."""
+        cls.reload()
+        if cls._is_lazy():
+            return HistoryRecords.from_rows(cls._get_store().load()).to_dataframe()
+        return cls._records.to_dataframe()
+
+    @classmethod
+    @metrics.timed("history", "reload")
+    def reload(cls):
+        """Reloads history from the configured store, reading only what changed since the last load."""
+        cls.flush()
+        store = cls._get_store()
+        if store.lazy:
+            store.refresh()  # ✅ Nothing to load: queries go to the store
+            cls._next_id = None
+            cls._loaded = True
+            cls._maybe_compact()
+            return
+        changes = store.load_changes() if cls._loaded else None
+        if changes is None:
+            cls._records = HistoryRecords.from_rows(store.load())
+        else:
+            for row in changes:
+                if row[1] == TOMBSTONE:
+                    cls._records.remove(row[0])
+                else:
+                    cls._records.append(*row)
+        cls._loaded = True
+        cls._maybe_compact()
+
+    @classmethod
+    def _ensure_loaded(cls):
+        """Loads the persisted history once so new IDs continue from the store."""
+        cls._get_store()
+        if not cls._loaded:
+            cls.reload()
+
+    @classmethod
+    def _queried(cls):
+        """Returns the lazy store to query (with queued entries flushed), or ``None`` to use the records."""
+        cls._ensure_loaded()
+        if not cls._is_lazy():
+            return None
+        cls.flush()
+        return cls._get_store()
 
-            # ✅ Convert Operands back from string to list
-            cls._history["Operands"] = cls._history["Operands"].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
+    @classmethod
+    def count(cls, operation=None):
+        """Returns how many entries are stored, optionally for one operation only."""
+        store = cls._queried()
+        return cls._records.count(operation) if store is None else store.count(operation)
+
+    @classmethod
+    def entries(cls, offset, limit, operation=None):
+        """Returns up to ``limit`` entries starting at ``offset`` as row tuples."""
+        store = cls._queried()
+        if store is None:
+            return cls._records.window(offset, limit, operation)
+        return store.window(offset, limit, operation)
+
+    @classmethod
+    def find(cls, entry_id):
+        """Returns the entry with ``entry_id`` as a row tuple, or ``None``."""
+        store = cls._queried()
+        return cls._records.get(entry_id) if store is None else store.find(entry_id)
+
+    @classmethod
+    def position(cls, entry_id, operation=None):
+        """Returns the offset of ``entry_id`` among (optionally filtered) entries, or ``None``."""
+        store = cls._queried()
+        if store is None:
+            return cls._records.position(entry_id, operation)
+        return store.position(entry_id, operation)
 
-        except (FileNotFoundError, pd.errors.EmptyDataError):
-            cls._history = pd.DataFrame(columns=["ID", "Operation", "Operands", "Result"])
-        return cls._history
+    @classmethod
+    def _take_id(cls, store):
+        """Returns the ID for the next new entry."""
+        if not store.lazy:
+            return cls._records.next_id
+        if cls._next_id is None:
+            cls.flush()
+            cls._next_id = store.newest_id() + 1
+        cls._next_id += 1
+        return cls._next_id - 1
 
     @classmethod
+    @metrics.timed("history", "add_entry")
     def add_entry(cls, operation, operands, result):
-        """Adds a new calculation entry to history and saves to CSV."""
+        """Adds a new calculation entry to history and persists it."""
 
         # ✅ Ensure operands are stored as a **list or tuple**
         if not isinstance(operands, (list, tuple)):
             raise TypeError("Operands must be a list or tuple.")
 
+        cls._ensure_loaded()
+
         # ✅ Assign unique ID
-        new_id = cls._history["ID"].max() + 1 if not cls._history.empty else 1
+        store = cls._get_store()
+        row = (cls._take_id(store), operation, list(operands), result)
+        if not store.lazy:
+            cls._records.append(*store.as_loaded(row))  # Kept as a reload would read it back
+
+        writer = cls._get_writer()
+        if writer is not None:
+            writer.submit([row])
+        elif store.incremental:
+            store.append([row])
+        else:
+            cls._save_history()
+        logger.info(f"✅ Calculation saved: {operation} {operands} = {result}")
+
+    @classmethod
+    @metrics.timed("history", "add_entries")
+    def add_entries(cls, entries):
+        """Adds many ``(operation, operands, result)`` entries with a single store write."""
+        cls._ensure_loaded()
 
-        new_entry = pd.DataFrame([{
-            "ID": int(new_id),
-            "Operation": operation,
-            "Operands": str(operands),  # ✅ Store as string for CSV compatibility
-            "Result": result
-        }])
+        store = cls._get_store()
+        rows = []
+        for operation, operands, result in entries:
+            if not isinstance(operands, (list, tuple)):
+                raise TypeError("Operands must be a list or tuple.")
+            row = (cls._take_id(store), operation, list(operands), result)
+            if not store.lazy:
+                cls._records.append(*store.as_loaded(row))
+            rows.append(row)
 
-        if cls._history.empty:
-            cls._history = new_entry
+        if not rows:
+            return
+        writer = cls._get_writer()
+        if writer is not None:
+            writer.submit(rows)
+        elif store.incremental:
+            store.append(rows)
         else:
-            cls._history = pd.concat([cls._history, new_entry], ignore_index=True)
+            cls._save_history()
+        logger.info(f"✅ {len(rows)} calculations saved.")
 
+    @classmethod
+    def _save_history(cls):
+        """Rewrites the store with the in-memory history."""
+        cls.flush()
+        store = cls._get_store()
+        store.rewrite(store.load() if store.lazy else cls._records.rows())
+
+    @classmethod
+    @metrics.timed("history", "compact")
+    def compact(cls):
+        """Rewrites the store so it only holds live entries."""
+        cls._ensure_loaded()
         cls._save_history()
-        logger.info(f"✅ Calculation saved: {operation} {operands} = {result}")
+        logger.info("🧹 History journal compacted.")
 
     @classmethod
-    def _save_history(cls):
-        """Saves history to CSV."""
-        cls._history.to_csv(cls._history_file, index=False)
+    def _maybe_compact(cls):
+        """Compacts the store once dead rows outweigh the configured threshold."""
+        store = cls._get_store()
+        if store.needs_compaction(store.count() if store.lazy else len(cls._records)):
+            cls.compact()
 
     @classmethod
+    @metrics.timed("history", "clear_history")
     def clear_history(cls):
         """Clears all stored history."""
-        cls._history = pd.DataFrame(columns=["ID", "Operation", "Operands", "Result"])
-        cls._save_history()
+        cls.flush()
+        cls._records = HistoryRecords()
+        cls._get_store().clear()
+        cls._loaded = True
+        cls._next_id = None
         logger.info("🗑️ History cleared.")
 
     @classmethod
+    @metrics.timed("history", "remove_entry")
     def remove_entry(cls, entry_id):
         """Removes an entry from history by ID."""
-        cls._history = cls._history[cls._history["ID"] != entry_id].reset_index(drop=True)
-        cls._save_history()
-        logger.info(f"❌ Entry {entry_id} removed from history.")
-
-
-# ✅ TEST CASES
-def test_reload_history():
-    """Test reloading history from CSV using EAFP."""
-    try:
-        # ✅ Pass operands as a **list or tuple**
-        History.add_entry("divide", [8, 2], 4)
+        cls._ensure_loaded()
+        store = cls._get_store()
+        cls.flush()
+        if store.lazy:
+            removed = 1 if store.find(entry_id) is not None else 0
+            cls._next_id = None  # 🔹 Removing the newest entry hands its ID out again, as a reload would
+        else:
+            removed = cls._records.remove(entry_id)
 
-        # ✅ Reload history and check if the entry exists
-        history_df = History.get_history()
-        assert not history_df.empty, "History should not be empty after adding an entry."
-        assert history_df.iloc[-1]["Operation"] == "divide", "Last operation should be 'divide'."
-        assert history_df.iloc[-1]["Operands"] == [8, 2], "Operands should be correctly stored and retrieved."
-        assert history_df.iloc[-1]["Result"] == 4, "Result should be correctly stored."
+        if store.incremental:
+            store.remove(entry_id, removed)
+            cls._maybe_compact()
+        else:
+            cls._save_history()
+        logger.info(f"❌ Entry {entry_id} removed from history.")
 
-    except Exception as e:
-        pytest.fail(f"Unexpected error occurred: {e}")
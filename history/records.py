@@ -0,0 +1,230 @@
+"""
+History Records - Compact, append-friendly in-memory storage for history rows.
+
+Rows are kept column-wise: IDs in an ``array('q')``, operation names interned
+to small integer codes, every row's operands in one flat list addressed by an
+offsets array, and removals as a liveness flag per row. Appends are amortized
+O(1) and a DataFrame is only built when ``to_dataframe`` is called.
+
+Two indexes are kept in sync on append and remove: a hash index from ID to row
+position (O(1) ``get`` and ``remove``) and, per operation, the positions of its
+rows (O(1) ``count`` and filtered windows that never visit other operations).
+Sorted lists of removed positions let ``position`` rank an entry, and ``window``
+find the row at a live offset, by bisection.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+COLUMNS = ["ID", "Operation", "Operands", "Result"]
+
+
+def locate_live(sequence, removed, offset):
+    """Returns the index in ``sequence`` of the live item at ``offset``, given the sorted ``removed`` items."""
+    # 🔹 The c-th removed item sits at sequence index r(c); the live item at ``offset`` follows exactly the
+    #    removed items with r(c) - c <= offset, and r(c) - c never decreases
+    skipped = bisect_right(range(len(removed)), offset, key=lambda c: bisect_left(sequence, removed[c]) - c)
+    return offset + skipped
+
+
+class HistoryRecords:
+    """Column-oriented store of calculation history rows."""
+
+    __slots__ = (
+        "_ids", "_op_codes", "_op_names", "_op_lookup", "_operand_offsets",
+        "_operands", "_results", "_alive", "_live_count", "_max_id",
+        "_index", "_shadowed", "_op_positions", "_op_live", "_removed", "_op_removed", "_ordered",
+    )
+
+    def __init__(self):
+        self._ids = array("q")
+        self._op_codes = array("I")
+        self._op_names = []  # Interned operation names, indexed by code
+        self._op_lookup = {}
+        self._operand_offsets = array("q", [0])  # Row i's operands are _operands[offsets[i]:offsets[i + 1]]
+        self._operands = []
+        self._results = []
+        self._alive = bytearray()
+        self._live_count = 0
+        self._max_id = 0
+        self._index = {}  # ID -> position of its newest live row
+        self._shadowed = {}  # ID -> older live positions, only for IDs appended more than once
+        self._op_positions = []  # Per operation code, positions of its rows in insertion order
+        self._op_live = []  # Per operation code, number of live rows
+        self._removed = []  # Sorted positions of removed rows, to rank live rows without scanning
+        self._op_removed = []  # Per operation code, sorted positions of its removed rows
+        self._ordered = True  # IDs appended in increasing order, so the newest live row holds the max ID
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Builds a store from ``(ID, Operation, Operands, Result)`` rows."""
+        records = cls()
+        for entry_id, operation, operands, result in rows:
+            records.append(entry_id, operation, operands, result)
+        return records
+
+    def __len__(self):
+        return self._live_count
+
+    @property
+    def next_id(self):
+        """The ID the next appended entry should receive."""
+        return self._max_id + 1
+
+    def _intern_operation(self, operation):
+        """Returns the integer code for an operation name, registering it if new."""
+        code = self._op_lookup.get(operation)
+        if code is None:
+            code = len(self._op_names)
+            self._op_names.append(operation)
+            self._op_lookup[operation] = code
+            self._op_positions.append(array("q"))
+            self._op_live.append(0)
+            self._op_removed.append([])
+        return code
+
+    def append(self, entry_id, operation, operands, result):
+        """Appends one row."""
+        entry_id = int(entry_id)
+        position = len(self._ids)
+        code = self._intern_operation(operation)
+        self._ids.append(entry_id)
+        self._op_codes.append(code)
+        self._operands.extend(operands)
+        self._operand_offsets.append(len(self._operands))
+        self._results.append(result)
+        self._alive.append(1)
+        self._live_count += 1
+        self._op_positions[code].append(position)
+        self._op_live[code] += 1
+
+        previous = self._index.get(entry_id)
+        if previous is not None:
+            self._shadowed.setdefault(entry_id, []).append(previous)
+        self._index[entry_id] = position
+        if entry_id > self._max_id:
+            self._max_id = entry_id
+        else:
+            self._ordered = False
+
+    def remove(self, entry_id):
+        """Marks every live row with ``entry_id`` as removed and returns how many there were."""
+        entry_id = int(entry_id)
+        position = self._index.pop(entry_id, None)
+        if position is None:
+            return 0
+        positions = [position, *self._shadowed.pop(entry_id, ())]
+        for position in positions:
+            code = self._op_codes[position]
+            self._alive[position] = 0
+            self._op_live[code] -= 1
+            insort(self._removed, position)
+            insort(self._op_removed[code], position)
+        removed = len(positions)
+        self._live_count -= removed
+        if entry_id == self._max_id:
+            # 🔹 Matches the historical "max live ID + 1" numbering after the newest entry is removed
+            self._max_id = self._newest_live_id() if self._ordered else max(self._index, default=0)
+        if len(self._ids) > 2 * self._live_count:
+            self._compact()
+        return removed
+
+    def _newest_live_id(self):
+        """Returns the ID of the last live row, or 0 when none is left."""
+        alive = self._alive
+        position = len(alive) - 1
+        while position >= 0 and not alive[position]:
+            position -= 1
+        return self._ids[position] if position >= 0 else 0
+
+    def _compact(self):
+        """Drops removed rows from the underlying buffers."""
+        live = HistoryRecords.from_rows(self.rows())
+        for slot in HistoryRecords.__slots__:
+            setattr(self, slot, getattr(live, slot))
+
+    def _row(self, position):
+        """Returns the row stored at ``position`` as a tuple."""
+        offsets = self._operand_offsets
+        return (
+            self._ids[position],
+            self._op_names[self._op_codes[position]],
+            self._operands[offsets[position]:offsets[position + 1]],
+            self._results[position],
+        )
+
+    def _sequence(self, operation=None):
+        """Returns the positions to visit (all rows, or one operation's) and how many of them are live."""
+        if operation is None:
+            return range(len(self._ids)), self._live_count
+        code = self._op_lookup.get(operation)
+        if code is None:
+            return (), 0
+        return self._op_positions[code], self._op_live[code]
+
+    def _positions(self, operation=None, reverse=False):
+        """Yields positions of live rows, optionally restricted to one operation."""
+        sequence, _ = self._sequence(operation)
+        alive = self._alive
+        for position in (reversed(sequence) if reverse else sequence):
+            if alive[position]:
+                yield position
+
+    def rows(self, operation=None, reverse=False):
+        """Yields live rows as ``(ID, Operation, Operands, Result)`` tuples in insertion order."""
+        for position in self._positions(operation, reverse):
+            yield self._row(position)
+
+    def count(self, operation=None):
+        """Returns the number of live rows, optionally for one operation only."""
+        return self._sequence(operation)[1]
+
+    def _removed_positions(self, operation=None):
+        """Returns the sorted positions of removed rows, optionally for one operation only."""
+        if operation is None:
+            return self._removed
+        code = self._op_lookup.get(operation)
+        return [] if code is None else self._op_removed[code]
+
+    def window(self, offset, limit, operation=None):
+        """Returns at most ``limit`` live rows starting at ``offset``, without touching the rest."""
+        sequence, total = self._sequence(operation)
+        offset = max(offset, 0)
+        limit = max(min(limit, total - offset), 0)
+        if total == len(sequence):
+            # ✅ No removed rows in the way: the window is a direct slice
+            return [self._row(position) for position in sequence[offset:offset + limit]]
+        if not limit:
+            return []
+        removed = self._removed_positions(operation)
+        start = locate_live(sequence, removed, offset)
+        end = locate_live(sequence, removed, offset + limit - 1)
+        alive = self._alive
+        return [self._row(position) for position in sequence[start:end + 1] if alive[position]]
+
+    def get(self, entry_id):
+        """Returns the live row with ``entry_id`` or ``None``."""
+        position = self._index.get(entry_id)
+        return None if position is None else self._row(position)
+
+    def position(self, entry_id, operation=None):
+        """Returns the offset of ``entry_id`` among live rows (optionally filtered), or ``None``."""
+        newest = self._index.get(entry_id)
+        if newest is None:
+            return None
+        # 🔹 The oldest live row with this ID (and operation, when filtering) comes first
+        candidates = sorted([newest, *self._shadowed.get(entry_id, ())])
+        if operation is None:
+            position = candidates[0]
+            return position - bisect_left(self._removed, position)
+        code = self._op_lookup.get(operation)
+        position = next((candidate for candidate in candidates if self._op_codes[candidate] == code), None)
+        if position is None:
+            return None
+        return bisect_left(self._op_positions[code], position) - bisect_left(self._op_removed[code], position)
+
+    def to_dataframe(self):
+        """Builds a pandas DataFrame of the live rows."""
+        import pandas as pd  # ✅ Only needed when the history is displayed or analysed
+
+        return pd.DataFrame(list(self.rows()), columns=COLUMNS)
@@ -0,0 +1,569 @@
+"""
+Segmented History Store - Persists calculation history as a chain of bounded, compressed segments.
+
+History lives in a directory:
+
+- ``active.seg``: the hot segment. It is uncompressed, holds binary records in
+  the ``history.binary_store`` encoding, and is mirrored in memory. New entries
+  and removal tombstones are appended here.
+- ``segment-000001.gz`` (or ``.xz``) and so on: sealed, read-only segments.
+  Each one is the active segment's records compressed with gzip or lzma,
+  followed by a small uncompressed JSON footer (the ID range, entry and
+  tombstone counts, per-operation counts, removed IDs, how many entries of each
+  segment and operation its tombstones cancelled, and timestamps), then
+  ``footer size (u32)`` and ``b"CSEG"``.
+
+The active segment is sealed once it reaches ``segment_bytes`` or is older
+than ``segment_seconds``. Footers are read without decompressing anything, so
+``find`` and ``rows(operation)`` skip every segment that cannot hold a match.
+Clearing deletes the segment files, and retention drops the oldest sealed
+segments by count or age. Both cost O(segments) file operations, however many
+entries the segments hold.
+
+The store is ``lazy``: only the active segment is kept in memory. The live
+entries of every segment, per operation, follow from the footers, so
+``count`` decompresses nothing and ``window`` and ``position`` decompress only
+the segments holding the entries they return.
+"""
+
+import glob
+import gzip
+import json
+import logging
+import lzma
+import os
+import struct
+import time
+from bisect import bisect_left
+
+from history.binary_store import (
+    ENTRY,
+    TOMBSTONE_KIND,
+    BinaryHistoryStore,
+    decode_record,
+    encode_entry,
+    encode_tombstone,
+)
+from history.csv_store import TOMBSTONE
+
+logger = logging.getLogger("calculator_logger")
+
+ACTIVE_MAGIC = b"CALCSEGA"
+FOOTER_MAGIC = b"CSEG"
+_ACTIVE_HEADER = struct.Struct("<8sd")  # magic, creation time
+_FOOTER_TRAILER = struct.Struct("<I4s")  # footer size, magic
+
+# ✅ Compression name -> (file extension, compress, decompress)
+COMPRESSORS = {
+    "gzip": ("gz", gzip.compress, gzip.decompress),
+    "lzma": ("xz", lzma.compress, lzma.decompress),
+}
+_EXTENSIONS = {extension: name for name, (extension, _, _) in COMPRESSORS.items()}
+ACTIVE = "active"  # Key of the active segment among the targets of cancelled entries
+
+
+def _index_ids(records):
+    """Maps each ID to the indexes of its records (entries and tombstones), in order."""
+    indexes = {}
+    for index, (kind, value) in enumerate(records):
+        indexes.setdefault(value if kind == TOMBSTONE_KIND else value[0], []).append(index)
+    return indexes
+
+
+def _decode_all(data, position=0):
+    """Decodes every record in ``data`` as ``(kind, row or ID)`` pairs."""
+    view = memoryview(data)
+    records = []
+    while position < len(data):
+        kind, value, position = decode_record(view, position)
+        records.append((kind, value))
+    return records
+
+
+def read_footer(path):
+    """Returns the JSON footer of a sealed segment without decompressing its records."""
+    with open(path, "rb") as segment:
+        end = segment.seek(0, os.SEEK_END)
+        segment.seek(end - _FOOTER_TRAILER.size)
+        size, magic = _FOOTER_TRAILER.unpack(segment.read(_FOOTER_TRAILER.size))
+        if magic != FOOTER_MAGIC:
+            raise ValueError(f"⚠️ '{path}' is not a sealed history segment.")
+        segment.seek(end - _FOOTER_TRAILER.size - size)
+        footer = json.loads(segment.read(size))
+    footer["path"] = path
+    return footer
+
+
+def segment_number(path):
+    """Returns the sequence number in a sealed segment's file name."""
+    return int(os.path.basename(path).split("-")[1].split(".")[0])
+
+
+def _add_counts(totals, counts):
+    """Adds ``{target: {operation: count}}`` counts into ``totals``."""
+    for target, operations in counts.items():
+        merged = totals.setdefault(target, {})
+        for operation, count in operations.items():
+            merged[operation] = merged.get(operation, 0) + count
+
+
+class SegmentedHistoryStore:
+    """Reads and writes history rows across a hot active segment and compressed sealed segments."""
+
+    incremental = True  # ✅ Entries and removals are appended to the active segment
+    lazy = True  # ✅ Queries read the footers and only the segments they need
+
+    def __init__(self, directory, segment_bytes=4 * 1024 * 1024, segment_seconds=0, compression="gzip",
+                 retention_segments=0, retention_seconds=0, compact_ratio=0.5, compact_min_garbage=1000):
+        if compression not in COMPRESSORS:
+            raise ValueError(f"⚠️ Unknown compression '{compression}'. Expected one of: {', '.join(COMPRESSORS)}.")
+        self.directory = directory
+        self.active_path = os.path.join(directory, "active.seg")
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.compression = compression
+        self.retention_segments = retention_segments
+        self.retention_seconds = retention_seconds
+        self.compact_ratio = compact_ratio
+        self.compact_min_garbage = compact_min_garbage
+        self.garbage = 0
+        self._active = []  # Decoded records of the active segment, kept hot
+        self._active_operations = {}  # Entries per operation in the active segment
+        self._active_cancelled = {}  # {target: {operation: count}} cancelled by the active segment's tombstones
+        self._active_ids = {}  # ID -> indexes of its records in the active segment
+        self._active_created = None
+        self._decoded = None  # (path, sealed time, records, ID indexes) of the last sealed segment decompressed
+        self._position = None  # (inode, offset) of the active segment consumed here
+        self._footers = None  # Cached sealed segment footers, oldest first
+
+    # 🔹 Segment files
+
+    def segments(self):
+        """Returns the footers of the sealed segments, oldest first."""
+        if self._footers is None:
+            paths = sorted(path for path in glob.glob(os.path.join(self.directory, "segment-*.*"))
+                           if path.rsplit(".", 1)[-1] in _EXTENSIONS)
+            self._footers = [read_footer(path) for path in paths]
+        return self._footers
+
+    def _read_segment(self, footer):
+        """Decompresses a sealed segment's records (the last one read is kept for repeated lookups)."""
+        return self._read_indexed(footer)[0]
+
+    def _read_indexed(self, footer):
+        """Returns a sealed segment's records and the indexes of each ID's records in it."""
+        key = (footer["path"], footer["sealed"])
+        if self._decoded is not None and self._decoded[:2] == key:
+            return self._decoded[2:]
+        with open(footer["path"], "rb") as segment:
+            payload = segment.read()
+        size, _ = _FOOTER_TRAILER.unpack_from(payload, len(payload) - _FOOTER_TRAILER.size)
+        decompress = COMPRESSORS[_EXTENSIONS[footer["path"].rsplit(".", 1)[-1]]][2]
+        records = _decode_all(decompress(payload[:len(payload) - _FOOTER_TRAILER.size - size]))
+        self._decoded = (*key, records, _index_ids(records))
+        return self._decoded[2:]
+
+    def _read_active(self):
+        """Loads the active segment into memory, creating it when missing."""
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            with open(self.active_path, "rb") as active:
+                data = active.read()
+                stat = os.fstat(active.fileno())
+        except FileNotFoundError:
+            self._start_active()
+            return
+        magic, created = _ACTIVE_HEADER.unpack_from(data)
+        if magic != ACTIVE_MAGIC:
+            raise ValueError(f"⚠️ '{self.active_path}' is not an active history segment.")
+        self._active = []
+        self._active_operations, self._active_cancelled, self._active_ids = {}, {}, {}
+        self._active_created = created
+        self._position = (stat.st_ino, len(data))
+        self._extend_active(_decode_all(data, _ACTIVE_HEADER.size))
+
+    def _extend_active(self, records):
+        """Adds records to the in-memory active segment, counting its entries and what its tombstones cancel."""
+        for kind, value in records:
+            if kind == TOMBSTONE_KIND:
+                _add_counts(self._active_cancelled, self._cancellations(value))
+                entry_id = value
+            else:
+                self._active_operations[value[1]] = self._active_operations.get(value[1], 0) + 1
+                entry_id = value[0]
+            self._active_ids.setdefault(entry_id, []).append(len(self._active))
+            self._active.append((kind, value))
+
+    def _start_active(self):
+        """Replaces the active segment with an empty one."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._active_created = time.time()
+        temporary = f"{self.active_path}.tmp"
+        with open(temporary, "wb") as active:
+            active.write(_ACTIVE_HEADER.pack(ACTIVE_MAGIC, self._active_created))
+        os.replace(temporary, self.active_path)
+        self._active = []
+        self._active_operations, self._active_cancelled, self._active_ids = {}, {}, {}
+        stat = os.stat(self.active_path)
+        self._position = (stat.st_ino, stat.st_size)
+
+    def _next_segment_path(self):
+        """Returns the file name for the next sealed segment."""
+        segments = self.segments()
+        number = segment_number(segments[-1]["path"]) + 1 if segments else 1
+        extension = COMPRESSORS[self.compression][0]
+        return os.path.join(self.directory, f"segment-{number:06d}.{extension}")
+
+    def _seal(self, records, created, cancelled=None):
+        """Compresses ``records`` into a new sealed segment with its footer.
+
+        ``cancelled`` counts the entries its tombstones cancelled, by target segment (``ACTIVE`` for its own).
+        """
+        path = self._next_segment_path()
+        number = str(segment_number(path))
+        ids = [value[0] for kind, value in records if kind != TOMBSTONE_KIND]
+        operations = {}
+        for kind, value in records:
+            if kind != TOMBSTONE_KIND:
+                operations[value[1]] = operations.get(value[1], 0) + 1
+        removed = sorted({value for kind, value in records if kind == TOMBSTONE_KIND})
+        footer = {
+            "first_id": min(ids, default=None),
+            "last_id": max(ids, default=None),
+            "entries": len(ids),
+            "tombstones": len(records) - len(ids),
+            "operations": operations,
+            "removed": removed,
+            "cancelled": {number if target == ACTIVE else target: counts
+                          for target, counts in (cancelled or {}).items()},
+            "created": created,
+            "sealed": time.time(),
+        }
+        body = b"".join(encode_tombstone(value) if kind == TOMBSTONE_KIND else encode_entry(value)
+                        for kind, value in records)
+        footer_bytes = json.dumps(footer, separators=(",", ":")).encode("utf-8")
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as segment:
+            segment.write(COMPRESSORS[self.compression][1](body))
+            segment.write(footer_bytes)
+            segment.write(_FOOTER_TRAILER.pack(len(footer_bytes), FOOTER_MAGIC))
+        os.replace(temporary, path)
+        footer["path"] = path
+        self.segments().append(footer)
+        logger.info(f"🗜️ History segment sealed: {os.path.basename(path)} ({len(ids)} entries).")
+
+    def _rotate_if_due(self, size):
+        """Seals the active segment once it is large (``size`` bytes) or old enough, then applies retention."""
+        too_big = size - _ACTIVE_HEADER.size >= self.segment_bytes
+        too_old = self.segment_seconds and time.time() - self._active_created >= self.segment_seconds
+        if not self._active or not (too_big or too_old):
+            return
+        self._seal(self._active, self._active_created, self._active_cancelled)
+        self._start_active()
+        self.apply_retention()
+
+    def apply_retention(self):
+        """Deletes the oldest sealed segments beyond the configured count or age; returns how many."""
+        segments = self.segments()
+        expired = []
+        if self.retention_segments and len(segments) > self.retention_segments:
+            expired = segments[:len(segments) - self.retention_segments]
+        if self.retention_seconds:
+            cutoff = time.time() - self.retention_seconds
+            expired += [footer for footer in segments[len(expired):] if footer["sealed"] < cutoff]
+        for footer in expired:
+            os.remove(footer["path"])
+        if expired:
+            self._footers = segments[len(expired):]
+            self._position = None  # ✅ Forces the next reload to drop the expired entries from memory
+            logger.info(f"🧹 {len(expired)} history segment(s) expired.")
+        return len(expired)
+
+    # 🔹 Store interface
+
+    def load(self):
+        """Returns the live history rows across every segment, oldest first."""
+        self._footers = None
+        self._read_active()
+        rows = []
+        positions_by_id = {}
+        garbage = 0
+        for records in [*(self._read_segment(footer) for footer in self.segments()), self._active]:
+            for kind, value in records:
+                if kind == TOMBSTONE_KIND:
+                    cancelled = positions_by_id.pop(value, ())
+                    for position in cancelled:
+                        rows[position] = None
+                    garbage += len(cancelled) + 1
+                    continue
+                positions_by_id.setdefault(value[0], []).append(len(rows))
+                rows.append(value)
+        self.garbage = garbage
+        return [row for row in rows if row is not None] if garbage else rows
+
+    def load_changes(self):
+        """Returns records appended to the active segment since the last read, or ``None`` to reload."""
+        if self._position is None:
+            return None
+        inode, offset = self._position
+        try:
+            with open(self.active_path, "rb") as active:
+                stat = os.fstat(active.fileno())
+                if stat.st_ino != inode or stat.st_size < offset:
+                    return None  # 🔹 Sealed, cleared or rewritten by someone else
+                active.seek(offset)
+                data = active.read()
+        except FileNotFoundError:
+            return None
+        records = _decode_all(data)
+        self._extend_active(records)
+        self._position = (inode, offset + len(data))
+        self.garbage += 2 * sum(1 for kind, _ in records if kind == TOMBSTONE_KIND)
+        return [(value, TOMBSTONE, [], "") if kind == TOMBSTONE_KIND else value for kind, value in records]
+
+    as_loaded = staticmethod(BinaryHistoryStore.as_loaded)
+
+    def _append_records(self, records, encoded):
+        """Appends records to the active segment and its in-memory mirror, then rotates if due."""
+        if self._active_created is None:
+            self._read_active()
+        with open(self.active_path, "ab") as active:
+            start = active.tell()
+            active.write(encoded)
+            active.flush()
+            stat = os.fstat(active.fileno())
+        if self._position == (stat.st_ino, start) and stat.st_size == start + len(encoded):
+            self._position = (stat.st_ino, stat.st_size)
+        else:
+            self._position = None  # Someone else wrote too; the next reload is a full one
+        self._extend_active(records)
+        self._rotate_if_due(stat.st_size)
+
+    def append(self, rows):
+        """Appends ``(ID, Operation, Operands, Result)`` rows to the active segment."""
+        rows = [self.as_loaded(row) for row in rows]
+        if rows:
+            self._append_records([(ENTRY, row) for row in rows], b"".join(encode_entry(row) for row in rows))
+
+    def remove(self, entry_id, removed_count=1):
+        """Appends a tombstone for ``entry_id`` to the active segment."""
+        self._append_records([(TOMBSTONE_KIND, int(entry_id))], encode_tombstone(entry_id))
+        self.garbage += removed_count + 1
+
+    def clear(self):
+        """Deletes every sealed segment and empties the active one: O(segments) file operations."""
+        for footer in self.segments():
+            os.remove(footer["path"])
+        self._footers = []
+        self._start_active()
+        self.garbage = 0
+
+    def rewrite(self, rows):
+        """Replaces the history with the given live rows, sealed into bounded segments."""
+        self.clear()
+        batch, size = [], 0
+        for row in rows:
+            record = encode_entry(row)
+            batch.append((ENTRY, self.as_loaded(row)))
+            size += len(record)
+            if size >= self.segment_bytes:
+                self._seal(batch, time.time())
+                batch, size = [], 0
+        if batch:
+            self._append_records(batch, b"".join(encode_entry(row) for _, row in batch))
+
+    def sync(self):
+        """Forces the active segment to disk with ``fsync`` (sealed segments never change)."""
+        if os.path.exists(self.active_path):
+            with open(self.active_path, "ab") as active:
+                os.fsync(active.fileno())
+
+    def needs_compaction(self, live_count):
+        """True once dead records outweigh the configured threshold."""
+        if self.garbage < self.compact_min_garbage:
+            return False
+        return self.garbage >= self.compact_ratio * live_count
+
+    def close(self):
+        """Nothing is kept open between calls."""
+
+    # 🔹 Queries that skip segments through their footers
+
+    def refresh(self):
+        """Drops the cached footers and active segment so the next query sees other writers' changes."""
+        self._footers = None
+        self._active_created = None
+
+    def _newest_first(self, wanted):
+        """Yields the records of the active and each sealed segment, newest first, that ``wanted(footer)`` admits.
+
+        Segments that are skipped still contribute their removed IDs, as ``(TOMBSTONE_KIND, ID)`` records.
+        """
+        if self._active_created is None:
+            self._read_active()
+        yield from reversed(self._active)
+        for footer in reversed(self.segments()):
+            if wanted(footer):
+                yield from reversed(self._read_segment(footer))
+            else:
+                for entry_id in footer["removed"]:
+                    yield TOMBSTONE_KIND, entry_id
+
+    @staticmethod
+    def _holding(entry_id):
+        """Returns a footer filter admitting segments whose ID range holds ``entry_id``."""
+        return lambda footer: footer["entries"] and footer["first_id"] <= entry_id <= footer["last_id"]
+
+    def _matches(self, entry_id, before=None):
+        """Yields ``(segment position, kind, value)`` for the records of ``entry_id``, newest first.
+
+        Positions count sealed segments oldest first, the active one being ``len(segments)``. Only segments
+        whose ID range holds ``entry_id`` are decompressed; the others still contribute their tombstones.
+        ``before`` (a segment position and a record index) starts the walk just before that record.
+        """
+        if self._active_created is None:
+            self._read_active()
+        footers = self.segments()
+        holds = self._holding(entry_id)
+        tier, end = before if before is not None else (len(footers), len(self._active))
+        for position in range(tier, -1, -1):
+            if position == len(footers):
+                records, indexes = self._active, self._active_ids
+            elif position == tier or holds(footers[position]):
+                records, indexes = self._read_indexed(footers[position])
+            else:
+                removed = footers[position]["removed"]
+                at = bisect_left(removed, entry_id)
+                if at < len(removed) and removed[at] == entry_id:
+                    yield position, TOMBSTONE_KIND, entry_id
+                continue
+            for index in reversed(indexes.get(entry_id, ())):
+                if position != tier or index < end:
+                    yield (position, *records[index])
+
+    def _cancellations(self, entry_id, before=None):
+        """Counts the live entries a tombstone for ``entry_id`` at ``before`` cancels, by segment and operation."""
+        footers = self.segments()
+        cancelled = {}
+        for position, kind, value in self._matches(entry_id, before):
+            if kind == TOMBSTONE_KIND:
+                break  # 🔹 Older entries were cancelled by that tombstone already
+            target = ACTIVE if position == len(footers) else str(segment_number(footers[position]["path"]))
+            _add_counts(cancelled, {target: {value[1]: 1}})
+        return cancelled
+
+    def _cancelled(self, position):
+        """Returns the cancelled counts of the sealed segment at ``position``, working them out for older footers."""
+        footer = self.segments()[position]
+        if "cancelled" not in footer:
+            cancelled = {}
+            for index, (kind, value) in enumerate(self._read_segment(footer)):
+                if kind == TOMBSTONE_KIND:
+                    _add_counts(cancelled, self._cancellations(value, (position, index)))
+            footer["cancelled"] = cancelled
+        return footer["cancelled"]
+
+    def _live_counts(self):
+        """Returns ``(footer, {operation: live entries})`` per segment, oldest first, the active one last.
+
+        Also refreshes ``garbage`` (tombstones and the entries they cancelled), decompressing nothing.
+        """
+        if self._active_created is None:
+            self._read_active()
+        footers = self.segments()
+        tiers = [(footer, dict(footer["operations"])) for footer in footers]
+        tiers.append((None, dict(self._active_operations)))
+        by_target = {str(segment_number(footer["path"])): counts for footer, counts in tiers[:-1]}
+        by_target[ACTIVE] = tiers[-1][1]
+        garbage = sum(footer["tombstones"] for footer in footers)
+        garbage += len(self._active) - sum(self._active_operations.values())
+        for cancelled in [*(self._cancelled(position) for position in range(len(footers))), self._active_cancelled]:
+            for target, operations in cancelled.items():
+                counts = by_target.get(target, {})  # Targets dropped by retention no longer count
+                for operation, count in operations.items():
+                    garbage += count
+                    if operation in counts:
+                        counts[operation] -= count
+        self.garbage = garbage
+        return tiers
+
+    @staticmethod
+    def _live(counts, operation=None):
+        """Returns the live entries in one segment's counts, optionally for one operation only."""
+        return sum(counts.values()) if operation is None else counts.get(operation, 0)
+
+    def _live_rows(self, position, operation=None):
+        """Returns the live entries (optionally of one operation) of the segment at ``position``, oldest first."""
+        footers = self.segments()
+        removed = {value for kind, value in self._active if kind == TOMBSTONE_KIND} if position < len(footers) else set()
+        for footer in footers[position + 1:]:
+            removed.update(footer["removed"])
+        records = self._read_segment(footers[position]) if position < len(footers) else self._active
+        matches = []
+        for kind, value in reversed(records):
+            if kind == TOMBSTONE_KIND:
+                removed.add(value)
+            elif value[0] not in removed and (operation is None or value[1] == operation):
+                matches.append(value)
+        matches.reverse()
+        return matches
+
+    def count(self, operation=None):
+        """Returns the number of live entries, optionally for one operation only, from the footers alone."""
+        return sum(self._live(counts, operation) for _, counts in self._live_counts())
+
+    def window(self, offset, limit, operation=None):
+        """Returns at most ``limit`` live entries starting at ``offset``, decompressing only the segments they are in."""
+        offset, rows = max(offset, 0), []
+        for position, (_, counts) in enumerate(self._live_counts()):
+            if len(rows) >= limit:
+                break
+            live = self._live(counts, operation)
+            if offset >= live:
+                offset -= live
+                continue
+            rows.extend(self._live_rows(position, operation)[offset:offset + limit - len(rows)])
+            offset = 0
+        return rows
+
+    def position(self, entry_id, operation=None):
+        """Returns the offset of ``entry_id`` among live (optionally filtered) entries, or ``None``."""
+        entry_id = int(entry_id)
+        tiers = self._live_counts()
+        for position, kind, value in self._matches(entry_id):
+            if kind == TOMBSTONE_KIND:
+                return None
+            if operation in (None, value[1]):
+                earlier = sum(self._live(counts, operation) for _, counts in tiers[:position])
+                rows = self._live_rows(position, operation)
+                return earlier + next(index for index, row in enumerate(rows) if row[0] == entry_id)
+        return None
+
+    def newest_id(self):
+        """Returns the ID of the newest live entry, or 0 when there is none."""
+        live = {footer["path"]: self._live(counts) for footer, counts in self._live_counts()[:-1]}
+        removed = set()
+        for kind, value in self._newest_first(lambda footer: live[footer["path"]] > 0):
+            if kind == TOMBSTONE_KIND:
+                removed.add(value)
+            elif value[0] not in removed:
+                return value[0]
+        return 0
+
+    def find(self, entry_id):
+        """Returns the live entry with ``entry_id``, decompressing only segments whose ID range holds it."""
+        for _, kind, value in self._matches(int(entry_id)):
+            return None if kind == TOMBSTONE_KIND else value
+        return None
+
+    def rows(self, operation=None):
+        """Returns the live entries (optionally of one operation), oldest first, skipping segments without any."""
+        removed = set()
+        matches = []
+        for kind, value in self._newest_first(lambda footer: operation is None or operation in footer["operations"]):
+            if kind == TOMBSTONE_KIND:
+                removed.add(value)
+            elif value[0] not in removed and (operation is None or value[1] == operation):
+                matches.append(value)
+        matches.reverse()
+        return matches
@@ -0,0 +1,107 @@
+"""
+SQLite History Store - Persists calculation history in a SQLite database.
+
+Rows live in a table keyed by an ``INTEGER PRIMARY KEY`` ID, so inserts and
+deletes by ID are B-tree operations instead of full-file rewrites. The database
+runs in WAL mode and every statement is a fixed, parameterised SQL string so
+sqlite3 reuses its prepared statement cache.
+"""
+
+import ast
+import logging
+import sqlite3
+
+logger = logging.getLogger("calculator_logger")
+
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS history ("
+    "ID INTEGER PRIMARY KEY, Operation TEXT NOT NULL, Operands TEXT NOT NULL, Result)"
+)
+_SELECT_ALL = "SELECT ID, Operation, Operands, Result FROM history ORDER BY ID"
+_INSERT = "INSERT OR REPLACE INTO history (ID, Operation, Operands, Result) VALUES (?, ?, ?, ?)"
+_DELETE = "DELETE FROM history WHERE ID = ?"
+_DELETE_ALL = "DELETE FROM history"
+
+
+def _serialize(row):
+    """Formats a row for binding, storing operands as a Python list literal."""
+    entry_id, operation, operands, result = row
+    return int(entry_id), operation, str(list(operands)), result
+
+
+def database_path(database_url):
+    """Extracts the file path from a ``sqlite:///`` database URL."""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"⚠️ Unsupported DATABASE_URL '{database_url}'. Expected '{prefix}<path>'.")
+    return database_url[len(prefix):]
+
+
+class SQLiteHistoryStore:
+    """Reads and writes history rows in a SQLite table."""
+
+    incremental = True  # ✅ Every change is a single indexed statement
+    lazy = False  # Queries are answered from the rows loaded into memory
+    garbage = 0
+
+    def __init__(self, database_url):
+        self.path = database_path(database_url)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_CREATE_TABLE)
+        self._connection.commit()
+        self._data_version = None
+
+    def load(self):
+        """Returns the stored rows as ``(ID, Operation, Operands, Result)`` tuples."""
+        self._data_version = self._read_data_version()
+        cursor = self._connection.execute(_SELECT_ALL)
+        return [(entry_id, operation, ast.literal_eval(operands), result) for entry_id, operation, operands, result in cursor]
+
+    @staticmethod
+    def as_loaded(row):
+        """Returns ``row`` as ``load`` would read it back."""
+        entry_id, operation, operands, result = row
+        return int(entry_id), operation, operands, result
+
+    def load_changes(self):
+        """Returns ``[]`` when no other connection has committed since the last load, else ``None`` (reload)."""
+        return [] if self._read_data_version() == self._data_version else None
+
+    def _read_data_version(self):
+        """Returns SQLite's counter of commits made by other connections."""
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def append(self, rows):
+        """Inserts the given rows in a single transaction."""
+        with self._connection:
+            self._connection.executemany(_INSERT, map(_serialize, rows))
+
+    def remove(self, entry_id, removed_count=1):  # pylint: disable=unused-argument
+        """Deletes the row with ``entry_id``."""
+        with self._connection:
+            self._connection.execute(_DELETE, (int(entry_id),))
+
+    def clear(self):
+        """Deletes every row."""
+        with self._connection:
+            self._connection.execute(_DELETE_ALL)
+
+    def rewrite(self, rows):
+        """Replaces the table contents with the given rows."""
+        with self._connection:
+            self._connection.execute(_DELETE_ALL)
+            self._connection.executemany(_INSERT, map(_serialize, rows))
+
+    def sync(self):
+        """Checkpoints the write-ahead log so committed rows are forced into the database file."""
+        self._connection.execute("PRAGMA wal_checkpoint(FULL)")
+
+    def needs_compaction(self, live_count):  # pylint: disable=unused-argument
+        """SQLite reclaims deleted rows itself, so no compaction is needed."""
+        return False
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
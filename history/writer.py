@@ -0,0 +1,192 @@
+"""
+Write-Behind History Writer - Persists history entries on a background thread.
+
+``submit`` queues rows and returns at once. A background thread takes
+everything queued and writes it as one group through the store's ``append``
+once ``batch_size`` rows are waiting, ``interval`` seconds after the oldest
+one was queued, or when ``flush`` or ``close`` is called. ``close`` runs at
+interpreter exit through ``atexit``.
+
+``durability`` sets what happens after each group is written:
+
+- ``flush``: the group is handed to the operating system. Every store flushes
+  its file (or commits its transaction) in ``append``, so there is no weaker
+  mode.
+- ``fsync``: the store's ``sync`` forces the group to disk.
+
+A group that fails to write goes back to the head of the queue and is retried
+after ``retry_delay`` seconds, doubling up to ``max_retry_delay`` while the
+failures last, so no row is dropped. ``flush`` raises the error when a write
+fails while it waits, and ``close`` gives up after ``CLOSE_ATTEMPTS`` failures
+in a row and raises it, leaving the unwritten rows in the queue.
+
+Group write latencies are recorded under ``history.write_group`` (see
+``config.metrics``), and ``stats`` reports the queue depth and failed writes.
+"""
+
+import atexit
+import logging
+import threading
+from time import monotonic, perf_counter
+
+from config.metrics import metrics
+
+logger = logging.getLogger("calculator_logger")
+
+DURABILITY_MODES = ("flush", "fsync")
+CLOSE_ATTEMPTS = 3  # Failed writes in a row after which close stops retrying
+
+
+class WriteBehindWriter:
+    """Batches history rows on a background thread and writes each batch as a single group."""
+
+    def __init__(self, store, batch_size=256, interval=0.05, durability="flush", retry_delay=0.05, max_retry_delay=5.0):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"⚠️ Unknown durability '{durability}'. Expected one of: {', '.join(DURABILITY_MODES)}.")
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self.interval = interval
+        self.durability = durability
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_depth = 0
+        self.errors = 0
+        self.groups = 0
+        self.last_group_rows = 0
+        self.last_group_seconds = 0.0
+        self._pending = []
+        self._condition = threading.Condition()
+        self._writing = False
+        self._flush_waiters = 0
+        self._closed = False
+        self._failures = 0  # Failed writes in a row
+        self._last_error = None
+        self._retry_at = None  # When the failed group at the head of the queue is retried
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def depth(self):
+        """Rows queued but not yet written."""
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, rows):
+        """Queues ``(ID, Operation, Operands, Result)`` rows to be written in the background."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("⚠️ The history writer is closed.")
+            self._pending.extend(rows)
+            self.max_depth = max(self.max_depth, len(self._pending))
+            self._condition.notify_all()
+
+    def flush(self):
+        """Blocks until every queued row has been written; raises the error if a write fails meanwhile."""
+        with self._condition:
+            self._flush_waiters += 1
+            errors = self.errors
+            self._condition.notify_all()
+            try:
+                while (self._pending or self._writing) and self._thread.is_alive():
+                    if self.errors > errors:
+                        raise self._last_error  # ✅ The rows stay queued and are retried
+                    self._condition.wait()
+                if self._pending:
+                    raise self._last_error  # Closed after giving up on them
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self):
+        """Writes whatever is queued and stops the background thread; raises the error if rows are left."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+        with self._condition:
+            if self._pending:
+                logger.error(f"❌ {len(self._pending)} history entries were not written: {self._last_error}")
+                raise self._last_error
+
+    def stats(self):
+        """Returns the queue depth, the size and latency of the last group written and the failed writes."""
+        with self._condition:
+            return {
+                "depth": len(self._pending),
+                "max_depth": self.max_depth,
+                "groups": self.groups,
+                "last_group_rows": self.last_group_rows,
+                "last_group_seconds": self.last_group_seconds,
+                "errors": self.errors,
+                "last_error": None if self._last_error is None else str(self._last_error),
+                "durability": self.durability,
+            }
+
+    def _next_group(self):
+        """Waits until a group is due and takes it from the queue (``None`` once closed and drained)."""
+        with self._condition:
+            deadline = None
+            while self._retry_at is not None:
+                if self._closed and self._failures >= CLOSE_ATTEMPTS:
+                    return None  # ✅ Give up; close raises with the rows still queued
+                remaining = self._retry_at - monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            while self._retry_at is None and not (
+                    self._closed or len(self._pending) >= self.batch_size or (self._pending and self._flush_waiters)):
+                if not self._pending:
+                    deadline = None
+                    self._condition.wait()
+                    continue
+                deadline = deadline or monotonic() + self.interval
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._pending:
+                return None  # Closed with nothing left to write
+            group, self._pending = self._pending, []
+            self._writing = True
+            return group
+
+    def _run(self):
+        """Background loop: writes groups until closed and drained."""
+        while True:
+            group = self._next_group()
+            if group is None:
+                return
+            self._write(group)
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def _write(self, group):
+        """Writes one group through the store and applies the durability mode; requeues it on failure."""
+        started = perf_counter()
+        error = None
+        try:
+            self.store.append(group)
+            if self.durability == "fsync":
+                self.store.sync()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error = e  # ✅ Keep the writer alive; the group is retried
+            logger.error(f"❌ Could not write {len(group)} history entries: {e}")
+        seconds = perf_counter() - started
+        with self._condition:
+            self.groups += 1
+            self.last_group_rows = len(group)
+            self.last_group_seconds = seconds
+            if error is None:
+                self._failures, self._retry_at = 0, None
+            else:
+                self._pending[:0] = group  # 🔹 Back at the head, ahead of rows queued meanwhile
+                self.errors += 1
+                self._failures += 1
+                self._last_error = error
+                delay = min(self.retry_delay * 2 ** (self._failures - 1), self.max_retry_delay)
+                self._retry_at = monotonic() + delay
+        metrics.record("history", "write_group", seconds, error is not None)
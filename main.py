@@ -2,13 +2,17 @@
 Main entry point for the interactive command-line calculator.
 """
 
+import argparse
 import sys
 import logging
-from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
-
+from time import perf_counter
 from history.history import History
-from mappings.operations_map import operation_mapping
+from app.evaluator import EXPRESSION_OPERATION, CommandError, evaluate, is_expression, parse_command
+from app.expressions import compile_expression
 from app.menu import Menu
+from config.env import SERVER_CONCURRENCY, SERVER_EXECUTOR, SERVER_HOST, SERVER_PORT, SERVER_SOCKET
+from config.metrics import metrics
+from mappings.engines import ENGINES, get_engine, set_engine
 
 # ✅ Logging setup: Write logs to a file instead of the console
 logging.basicConfig(
@@ -32,29 +36,51 @@ class CalculatorREPL:
 
         try:
             while True:
-                command = input("\n📝 Enter command: ").strip().lower()
+                command = input("\n📝 Enter command: ").strip()
+                keyword = command.lower()  # Operand file paths keep their case
 
-                if command == "exit":
+                if keyword == "exit":
+                    saved = CalculatorREPL.close_history()  # ✅ Persist queued history before leaving
                     print("👋 Exiting calculator.")
                     logger.info("👋 Exiting calculator.")
-                    sys.exit(0)
-                elif command == "menu":
+                    sys.exit(0 if saved else 1)
+                elif keyword == "menu":
                     Menu.show_menu()
-                elif command in {"1", "2", "3", "4", "5"}:
+                elif keyword in {"1", "2", "3", "4", "5"}:
                     # ✅ Route menu selections to Menu.handle_choice
                     Menu.handle_choice(command)
-                elif command == "help":
+                elif keyword == "history" or keyword.startswith("history "):
+                    Menu.view_history(keyword[len("history"):].strip() or None)
+                elif keyword == "help":
                     CalculatorREPL.display_instructions()
+                elif keyword == "cache":
+                    CalculatorREPL.display_cache_info()
+                elif keyword == "engine" or keyword.startswith("engine "):
+                    CalculatorREPL.select_engine(keyword[len("engine"):].strip())
+                elif keyword == "stats" or keyword.startswith("stats "):
+                    CalculatorREPL.display_stats(command[len("stats"):].strip())
                 else:
                     CalculatorREPL.process_calculation(command)
 
         except KeyboardInterrupt:
+            saved = CalculatorREPL.close_history()
             print("\n👋 Exiting calculator.")
-            sys.exit(0)
+            sys.exit(0 if saved else 1)
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
             logger.error(f"Unexpected error: {e}")
 
+    @staticmethod
+    def close_history():
+        """Writes queued history entries; reports a failure and returns False instead of raising."""
+        try:
+            History.close_writer()
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"❌ History could not be saved: {e}")
+            logger.error(f"❌ History could not be saved: {e}")
+            return False
+
     @staticmethod
     def display_instructions():
         """Displays usage instructions for the REPL."""
@@ -63,37 +89,101 @@ class CalculatorREPL:
         print("🔹 Type 'exit' to quit the calculator.")
         print("🔹 To perform calculations, enter: `<operation> <num1> <num2>` (e.g., `add 2 3`).")
         print("🔹 To use statistical operations, enter: `<operation> <num1> <num2> <num3> ...` (e.g., `mean 10 20 30`).")
+        print("🔹 Statistics can read operands from a file: `mean @data.csv` or `mean @data.csv:column`.")
+        print("🔹 Formulas work too: `(2 + 3) * mean(4, 5, 6) / 7`.")
         print("🔹 Type 'history' to view past calculations.")
+        print("🔹 Type 'history <operation>' to view one operation's calculations (e.g., `history mean`).")
         print("🔹 Type 'clear' to erase calculation history.")
+        print("🔹 Type 'cache' to see result cache hits and misses.")
+        print(f"🔹 Type 'engine <name>' to switch numeric engine ({', '.join(ENGINES)}).")
+        print("🔹 Type 'stats' for call counts and latencies ('stats export <file>' writes Prometheus or .json).")
         print("🔹 Type 'help' to display this message again.")
 
     @staticmethod
-    def process_calculation(command):
-        """Processes user commands for calculations."""
-        parts = command.split()
+    def display_cache_info():
+        """Prints the result cache counters."""
+        from mappings.result_cache import result_cache
 
-        if not parts:
-            print("⚠️ Invalid format. Expected: <operation> <num1> <num2> ...")
-            return
+        info = result_cache.info()
+        lookups = info.hits + info.disk_hits + info.misses
+        hit_rate = (info.hits + info.disk_hits) / lookups if lookups else 0.0
+        print(f"🗃️ Result cache: {info.hits} hits, {info.disk_hits} disk hits, {info.misses} misses "
+              f"({hit_rate:.0%} hit rate), {info.size}/{info.maxsize} entries, {info.evictions} evictions.")
 
-        operation_name = parts[0]
+    @staticmethod
+    def select_engine(name):
+        """Switches the session's numeric engine, or shows the current one when ``name`` is empty."""
+        if name:
+            try:
+                set_engine(name)
+            except ValueError as e:
+                print(str(e))
+                return
+            logger.info(f"🔢 Numeric engine set to '{name}'.")
+        print(f"🔢 Numeric engine: {get_engine().name} (available: {', '.join(ENGINES)}).")
 
-        # 🔹 Check for unknown operations before processing numbers
-        if operation_name not in operation_mapping:
-            print(f"❌ Unknown operation: '{operation_name}'. Type 'menu' for options.")
+    @staticmethod
+    def display_stats(argument=""):
+        """Prints calls, errors and latency percentiles, or handles ``export <file>`` and ``reset``."""
+        if not metrics.enabled:
+            print("📊 Metrics are disabled (set METRICS_ENABLED=true to collect them).")
+            return
+        action, _, path = argument.partition(" ")
+        if action.lower() == "export" and path.strip():
+            try:
+                export_format = metrics.export(path.strip())
+            except OSError as e:
+                print(f"❌ Could not export metrics: {e}")
+                return
+            print(f"📊 Metrics written to {path.strip()} ({export_format}).")
+            return
+        if action.lower() == "reset":
+            metrics.reset()
+            print("📊 Metrics reset.")
             return
+        if action:
+            print("⚠️ Usage: stats | stats export <file> | stats reset")
+            return
+
+        snapshot = metrics.snapshot()
+        if not snapshot:
+            print("📊 No calls recorded yet.")
+        else:
+            print(f"{'':<24}{'calls':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+            for family, labels in snapshot.items():
+                for label, summary in labels.items():
+                    print(f"{family + '.' + label:<24}{summary['calls']:>8}{summary['errors']:>8}"
+                          + "".join(f"{summary[key] * 1000:>10.3f}" for key in ("p50", "p95", "p99")))
+
+        writer = History.writer_stats()
+        if writer is not None:
+            print(f"🗃️ History writer ({writer['durability']}): {writer['depth']} queued (max {writer['max_depth']}), "
+                  f"{writer['groups']} groups, last {writer['last_group_rows']} rows in "
+                  f"{writer['last_group_seconds'] * 1000:.3f} ms")
 
+    @staticmethod
+    def process_calculation(command):
+        """Processes user commands for calculations."""
+        plan = None
+        started = perf_counter()
         try:
-            numbers = [Decimal(num) for num in parts[1:]]
-            if len(numbers) < 2:  # Ensure at least two numbers for valid operations
-                raise ValueError("⚠️ Expected at least two numbers for this operation.")
-        except (InvalidOperation, ValueError):
-            print("⚠️ Invalid number format. Ensure all values are numeric.")
+            if is_expression(command):
+                # ✅ Infix formulas compile once per source text; only the final result is rounded
+                plan = compile_expression(command.strip())
+                operation_name, numbers = EXPRESSION_OPERATION, [command.strip()]
+            else:
+                operation_name, numbers = parse_command(command)
+        except CommandError as e:
+            metrics.record("calculation", "invalid", perf_counter() - started, error=True)
+            print(str(e))
             return
 
         try:
-            result = operation_mapping[operation_name](*numbers)
-            formatted_result = result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            # ✅ Dispatch is timed per operation; the history write is timed separately by History
+            if plan:
+                formatted_result = metrics.call("calculation", operation_name, plan.evaluate)
+            else:
+                formatted_result = metrics.call("calculation", operation_name, evaluate, operation_name, numbers)
 
             print(f"✅ Result: {formatted_result}")
 
@@ -108,5 +198,53 @@ class CalculatorREPL:
             logger.error(f"Error during calculation ({command}): {e}")
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """Parses command-line flags and starts the requested mode."""
+    parser = argparse.ArgumentParser(description="Interactive command-line calculator.")
+    parser.add_argument("--import-time", action="store_true",
+                        help="report how long the calculator takes to import, then exit")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="evaluate commands from FILE ('-' for stdin) without prompting")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv",
+                        help="batch output format (default: csv)")
+    parser.add_argument("--output", metavar="FILE", help="write batch results to FILE instead of stdout")
+    parser.add_argument("--no-history", action="store_true", help="do not record batch or server results in history")
+    parser.add_argument("--serve", action="store_true",
+                        help="serve line-delimited JSON requests over TCP or a Unix socket")
+    parser.add_argument("--host", default=SERVER_HOST, help=f"server host (default: {SERVER_HOST})")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help=f"server port (default: {SERVER_PORT})")
+    parser.add_argument("--socket", metavar="PATH", default=SERVER_SOCKET, help="serve on a Unix socket instead of TCP")
+    parser.add_argument("--concurrency", type=int, default=SERVER_CONCURRENCY,
+                        help=f"requests evaluated at once (default: {SERVER_CONCURRENCY})")
+    parser.add_argument("--executor", choices=["process", "thread"], default=SERVER_EXECUTOR,
+                        help=f"where statistics and batches run (default: {SERVER_EXECUTOR})")
+    parser.add_argument("--engine", choices=list(ENGINES), default=get_engine().name,
+                        help=f"numeric engine for this session (default: {get_engine().name})")
+    args = parser.parse_args(argv)
+    set_engine(args.engine)
+
+    if args.import_time:
+        from app.startup import import_time_report  # ✅ Diagnostics are not needed on the normal path
+        print(import_time_report())
+        return
+
+    if args.serve:
+        from app.server import serve
+        serve(args.host, args.port, args.socket, args.concurrency, args.executor, record_history=not args.no_history)
+        return
+
+    if args.batch:
+        from app.batch import run_batch
+        try:
+            run_batch(args.batch, args.output, args.format, record_history=not args.no_history)
+        except OSError as e:
+            print(f"❌ Batch failed: {e}", file=sys.stderr)
+            logger.error(f"Batch failed: {e}")
+            sys.exit(1)
+        return
+
     CalculatorREPL.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+"""
+Numeric Engines - Interchangeable number representations behind the operations.
+
+An engine converts operands into its own representation, runs the built-in
+operations on them and rounds the final result into a ``Decimal`` for display
+and history. The engine is chosen per session (``NUMERIC_ENGINE``, ``--engine``
+or the REPL's ``engine <name>``) or per call (``evaluate(..., engine="float")``,
+or ``"engine"`` in a server request).
+
+Precision guarantees:
+
+- ``decimal`` (default): today's behaviour. Operands are exact ``Decimal``
+  values, arithmetic follows the Decimal context (28 significant digits) and
+  statistics use the exact kernel; results are rounded half-up to 0.01.
+- ``float``: IEEE-754 float64. Sums, means and variances are computed with
+  ``math.fsum``, so every sum is correctly rounded however many values there
+  are; each other step adds at most half an ulp (about 1e-16 relative). About
+  15 significant digits survive, and results are rounded half-up to 0.01
+  through their shortest ``repr``.
+- ``fixed``: integers counting units of ``10 ** -FIXED_POINT_DECIMALS``.
+  Operands are rounded half-up to that scale on entry; addition, subtraction
+  and every sum are exact, and multiply, divide, mean, median, variance and
+  standard deviation round half-up once, to the scale. Python integers never
+  overflow. Results carry exactly ``FIXED_POINT_DECIMALS`` decimals.
+
+The ``float`` and ``fixed`` engines parse operand files straight from text (or,
+for ``float``, from the mapped buffer of a binary file), skipping ``Decimal``
+entirely, and fold them chunk by chunk into running aggregates (``fsum``
+partials with Chan-merged squared deviations for ``float``, exact integer
+power sums for ``fixed``), so memory stays flat however long the file is.
+Median still needs every value. Operations they do not implement natively -
+plugins, and arithmetic on vectors - run through the ``decimal`` engine and
+are converted back.
+"""
+
+import logging
+import math
+import operator
+import statistics
+from abc import ABC, abstractmethod
+from itertools import chain, repeat
+from decimal import Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN, ROUND_HALF_UP
+
+from config.env import FIXED_POINT_DECIMALS, NUMERIC_ENGINE
+from mappings.operations_map import operation_mapping
+
+logger = logging.getLogger("calculator_logger")
+
+RESULT_PRECISION = Decimal("0.01")
+
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)  # Never rounds while rescaling operands
+
+# ✅ Values copied out of a memory-mapped file per block by the float engine
+_BLOCK_SIZE = 1 << 16
+
+# ✅ Chunk sums kept by ``FloatMoments`` before they are folded into one (sum, residual) pair
+_MAX_PARTIALS = 64
+
+# ✅ Scaled values below this are exact after a float round trip (error < 1/4 unit)
+_FLOAT_SCALED_LIMIT = 1 << 50
+
+
+# ✅ Operands converted by ``convert``; vectors and operand files are expanded instead
+_SCALARS = (Decimal, int, float, str)
+
+
+class NumericEngine(ABC):
+    """Base class: converts operands, runs operations and rounds the final result."""
+
+    name = None
+    native = object  # Type of the engine's scalar values
+
+    # operation name -> engine method; anything else falls back to the decimal engine
+    ARITHMETIC = {"add": "add", "subtract": "subtract", "multiply": "multiply", "divide": "divide"}
+    STATISTICS = {"mean": "mean", "median": "median", "std_dev": "stdev", "variance": "variance"}
+
+    @abstractmethod
+    def convert(self, number):
+        """Converts a Decimal (or int) operand to the engine's representation."""
+
+    @abstractmethod
+    def from_text(self, text):
+        """Parses one operand-file cell."""
+
+    @abstractmethod
+    def to_decimal(self, value):
+        """Converts a native value back to an exact Decimal."""
+
+    @abstractmethod
+    def finish(self, value):
+        """Rounds a native result into the Decimal that is displayed and recorded."""
+
+    @abstractmethod
+    def apply(self, operation_name, operands):
+        """Runs one operation on native scalars (or vectors / operand files) and returns a native result."""
+
+    def evaluate(self, operation_name, numbers):
+        """Runs an operation on parsed operands and returns the rounded Decimal result."""
+        operands = [self.convert(number) if isinstance(number, _SCALARS) else number for number in numbers]
+        return self.finish(self.apply(operation_name, operands))
+
+
+class NativeEngine(NumericEngine):
+    """Runs the built-in operations on the engine's own values, falling back to the decimal engine.
+
+    Mean, variance and standard deviation fold operands chunk by chunk into a
+    running aggregate (``moments``), so operand files are never held in memory
+    whole; median needs every value and reads them all.
+    """
+
+    def __init__(self):
+        self._arithmetic = {name: getattr(self, method) for name, method in self.ARITHMETIC.items()}
+        self._statistics = {name: getattr(self, method) for name, method in self.STATISTICS.items()}
+
+    @staticmethod
+    def add(a, b):
+        """Returns ``a + b``."""
+        return a + b
+
+    @staticmethod
+    def subtract(a, b):
+        """Returns ``a - b``."""
+        return a - b
+
+    @abstractmethod
+    def multiply(self, a, b):
+        """Returns ``a * b``."""
+
+    @abstractmethod
+    def divide(self, a, b):
+        """Returns ``a / b``, raising ``ZeroDivisionError`` for a zero divisor."""
+
+    @abstractmethod
+    def moments(self, chunks):
+        """Folds chunks (lists) of native values into the engine's running aggregate."""
+
+    @abstractmethod
+    def mean(self, moments):
+        """Returns the arithmetic mean of the aggregated values."""
+
+    @abstractmethod
+    def variance(self, moments):
+        """Returns the sample variance of the aggregated values (0 for a single value)."""
+
+    @abstractmethod
+    def stdev(self, moments):
+        """Returns the sample standard deviation of the aggregated values."""
+
+    @abstractmethod
+    def median(self, values):
+        """Returns the median of a list of native values."""
+
+    def chunks(self, operands):
+        """Yields the operands as lists of native values, expanding vectors and operand files."""
+        scalars = []
+        for operand in operands:
+            if isinstance(operand, tuple):
+                yield list(map(self.convert, operand))
+            elif hasattr(operand, "chunks"):
+                yield from operand.chunks(self.from_text)
+            else:
+                scalars.append(operand)
+        if scalars:
+            yield scalars
+
+    def values(self, operands):
+        """Yields every operand as a native value, expanding vectors and operand files."""
+        for chunk in self.chunks(operands):
+            yield from chunk
+
+    def apply(self, operation_name, operands):
+        arithmetic = self._arithmetic.get(operation_name)
+        if (arithmetic is not None and len(operands) == 2
+                and isinstance(operands[0], self.native) and isinstance(operands[1], self.native)):
+            return arithmetic(*operands)
+        statistic = self._statistics.get(operation_name)
+        if operation_name == "median":
+            return statistic(list(self.values(operands)))  # Selection needs every value
+        if statistic is not None:
+            return statistic(self.moments(self.chunks(operands)))
+        result = DECIMAL.apply(operation_name, [
+            self.to_decimal(operand) if isinstance(operand, self.native) else operand for operand in operands])
+        return self.convert(result) if isinstance(result, Decimal) else result  # A Vector stays a Vector
+
+
+class DecimalEngine(NumericEngine):
+    """Exact Decimal arithmetic through the registered operations."""
+
+    name = "decimal"
+    native = Decimal
+
+    def convert(self, number):
+        return number
+
+    def from_text(self, text):
+        return Decimal(text)
+
+    def to_decimal(self, value):
+        return value
+
+    def finish(self, value):
+        return value.quantize(RESULT_PRECISION, rounding=ROUND_HALF_UP)
+
+    def apply(self, operation_name, operands):
+        if operation_name in self.STATISTICS:
+            from operations.statistics import EXACT  # ✅ Unrounded kernels; only the final result is rounded
+
+            return EXACT[operation_name](*operands)
+        return operation_mapping[operation_name](*operands)
+
+    def evaluate(self, operation_name, numbers):
+        return self.finish(operation_mapping[operation_name](*numbers))
+
+
+class FloatMoments:
+    """Running float aggregates: the count, the sum as ``fsum`` partials and Chan-merged squared deviations."""
+
+    __slots__ = ("count", "partials", "center", "squares")
+
+    def __init__(self):
+        self.count = 0
+        self.partials = []  # Each chunk's correctly rounded sum and its residual
+        self.center = 0.0
+        self.squares = 0.0
+
+    def add(self, chunk):
+        """Folds one list of floats in and returns ``self``."""
+        n = len(chunk)
+        if not n:
+            return self
+        total = math.fsum(chunk)
+        center = total / n
+        deviations = list(map(operator.sub, chunk, repeat(center)))
+        # ✅ Two-pass with the rounding error of ``center`` corrected by the second term
+        squares = max(math.fsum(map(operator.mul, deviations, deviations)) - math.fsum(deviations) ** 2 / n, 0.0)
+
+        self.partials += (total, math.fsum(chain(chunk, (-total,))))
+        if len(self.partials) > _MAX_PARTIALS:
+            total_so_far = math.fsum(self.partials)
+            self.partials = [total_so_far, math.fsum(chain(self.partials, (-total_so_far,)))]
+
+        combined = self.count + n
+        delta = center - self.center
+        self.squares += squares + delta * delta * self.count * n / combined  # Chan's pairwise update
+        self.center += delta * n / combined
+        self.count = combined
+        return self
+
+    def total(self):
+        """Returns the correctly rounded sum of every value folded in so far."""
+        return math.fsum(self.partials)
+
+
+class FloatEngine(NativeEngine):
+    """Float64 arithmetic with compensated (``math.fsum``) summation."""
+
+    name = "float"
+    native = float
+
+    def convert(self, number):
+        if isinstance(number, bool):
+            raise TypeError(f"⚠️ Invalid input: {repr(number)} ({type(number).__name__}) - Invalid type.")
+        return float(number)
+
+    from_text = float
+
+    def to_decimal(self, value):
+        return Decimal(repr(value))
+
+    def finish(self, value):
+        if not isinstance(value, float):  # A Vector from the decimal fallback
+            return DECIMAL.finish(value)
+        if not math.isfinite(value):
+            raise OverflowError(f"⚠️ Result {value!r} is outside the float engine's range.")
+        return self.to_decimal(value).quantize(RESULT_PRECISION, rounding=ROUND_HALF_UP)
+
+    def chunks(self, operands):
+        for operand in operands:
+            if hasattr(operand, "array"):  # A memory-mapped BinarySource: read the buffer block by block
+                array = operand.array()
+                for start in range(0, len(array), _BLOCK_SIZE):
+                    yield array[start:start + _BLOCK_SIZE].tolist()
+            else:
+                yield from super().chunks([operand])
+
+    def multiply(self, a, b):
+        return a * b
+
+    def divide(self, a, b):
+        if b == 0:
+            raise ZeroDivisionError("❌ Division by zero is not allowed.")
+        return a / b
+
+    def moments(self, chunks):
+        moments = FloatMoments()
+        for chunk in chunks:
+            moments.add(chunk)
+        return moments
+
+    def mean(self, moments):
+        if not moments.count:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return moments.total() / moments.count
+
+    def median(self, values):
+        if not values:
+            raise statistics.StatisticsError("no median for empty data")
+        ordered = sorted(values)
+        middle = len(ordered) // 2
+        return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+    def variance(self, moments):
+        if moments.count == 1:
+            return 0.0
+        if moments.count < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        return moments.squares / (moments.count - 1)
+
+    def stdev(self, moments):
+        if moments.count < 2:
+            raise statistics.StatisticsError("stdev requires at least two data points")
+        return math.sqrt(self.variance(moments))
+
+
+def _round_divide(numerator, denominator):
+    """Integer quotient rounded half away from zero, like ``ROUND_HALF_UP``."""
+    quotient, remainder = divmod(abs(numerator), abs(denominator))
+    if 2 * remainder >= abs(denominator):
+        quotient += 1
+    return quotient if (numerator < 0) == (denominator < 0) else -quotient
+
+
+class FixedPointEngine(NativeEngine):
+    """Scaled-integer arithmetic at a fixed number of decimal places."""
+
+    name = "fixed"
+    native = int
+
+    def __init__(self, decimals=FIXED_POINT_DECIMALS):
+        super().__init__()
+        self.decimals = decimals
+        self.scale = 10 ** decimals
+
+    def convert(self, number):
+        if isinstance(number, bool):
+            raise TypeError(f"⚠️ Invalid input: {repr(number)} ({type(number).__name__}) - Invalid type.")
+        if not isinstance(number, Decimal):
+            number = Decimal(repr(number) if isinstance(number, float) else number)
+        if not number.is_finite():
+            raise ValueError(f"⚠️ The fixed engine only accepts finite numbers, got {number}.")
+        return int(number.scaleb(self.decimals, context=_EXACT).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def from_text(self, text):
+        try:
+            value = float(text)
+            scaled = round(value * self.scale)
+        except (ValueError, OverflowError):  # Not a finite float: let Decimal parse or reject it
+            return self.convert(Decimal(text))
+        # ✅ Exact when the float round-trips and is far from float64's integer limit; otherwise rescale in Decimal
+        if -_FLOAT_SCALED_LIMIT < scaled < _FLOAT_SCALED_LIMIT and scaled / self.scale == value:
+            return scaled
+        return self.convert(Decimal(text))
+
+    def to_decimal(self, value):
+        return Decimal(value).scaleb(-self.decimals, context=_EXACT)
+
+    def finish(self, value):
+        if not isinstance(value, int):  # A Vector from the decimal fallback
+            return DECIMAL.finish(value)
+        return self.to_decimal(value)
+
+    def multiply(self, a, b):
+        return _round_divide(a * b, self.scale)
+
+    def divide(self, a, b):
+        if b == 0:
+            raise ZeroDivisionError("❌ Division by zero is not allowed.")
+        return _round_divide(a * self.scale, b)
+
+    def moments(self, chunks):
+        """Returns the exact power sums ``(count, Σx, Σx²)`` in scaled units."""
+        count = total = total_of_squares = 0
+        for chunk in chunks:
+            count += len(chunk)
+            total += sum(chunk)
+            total_of_squares += sum(map(operator.mul, chunk, chunk))
+        return count, total, total_of_squares
+
+    def mean(self, moments):
+        count, total, _ = moments
+        if not count:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return _round_divide(total, count)
+
+    def median(self, values):
+        if not values:
+            raise statistics.StatisticsError("no median for empty data")
+        ordered = sorted(values)
+        middle = len(ordered) // 2
+        return ordered[middle] if len(ordered) % 2 else _round_divide(ordered[middle - 1] + ordered[middle], 2)
+
+    @staticmethod
+    def _scaled_variance(moments):
+        """Returns the exact sample variance, in squared units, as ``(numerator, denominator)``."""
+        count, total, total_of_squares = moments
+        return count * total_of_squares - total * total, count * (count - 1)
+
+    def variance(self, moments):
+        if moments[0] == 1:
+            return 0
+        if moments[0] < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        numerator, denominator = self._scaled_variance(moments)
+        return _round_divide(numerator, denominator * self.scale)
+
+    def stdev(self, moments):
+        if moments[0] < 2:
+            raise statistics.StatisticsError("stdev requires at least two data points")
+        numerator, denominator = self._scaled_variance(moments)
+        # ✅ round(sqrt(n / d)) half-up is the largest x with (2x - 1)² <= 4n / d
+        return (math.isqrt(4 * numerator // denominator) + 1) // 2
+
+
+DECIMAL = DecimalEngine()
+
+ENGINES = {engine.name: engine for engine in (DECIMAL, FloatEngine(), FixedPointEngine())}
+
+_session = {"engine": DECIMAL}
+
+
+def get_engine(name=None):
+    """Returns the named engine, or the session's engine when ``name`` is ``None``."""
+    if name is None:
+        return _session["engine"]
+    if isinstance(name, NumericEngine):
+        return name
+    try:
+        return ENGINES[name.lower()]
+    except KeyError:
+        raise ValueError(f"⚠️ Unknown numeric engine '{name}'. Expected one of: {', '.join(ENGINES)}.") from None
+
+
+def set_engine(name):
+    """Selects the engine used for the rest of the session and returns it."""
+    _session["engine"] = get_engine(name)
+    return _session["engine"]
+
+
+def _set_default_engine(name):
+    """Selects the configured engine at import, falling back to decimal when the name is unknown."""
+    try:
+        return set_engine(name)
+    except ValueError as e:
+        # 🔹 A typo in NUMERIC_ENGINE must not stop every entry point from importing
+        logger.warning(f"{e} Falling back to 'decimal'.")
+        return set_engine(DECIMAL.name)
+
+
+_set_default_engine(NUMERIC_ENGINE)
@@ -0,0 +1,120 @@
+"""
+Plugin Manifest - Caches which module and class implement each operation.
+
+The manifest is a small JSON file recording, for every registered operation,
+its module, class and arity, together with the size and modification time of
+every source file in the plugin package. Startup only stats those files and
+reads the manifest; plugin modules are imported (and the manifest rewritten)
+only when a source file changed or the manifest is missing.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import pkgutil
+
+from config.env import PLUGIN_DIRECTORY, PLUGIN_MANIFEST_PATH
+
+logger = logging.getLogger("calculator_logger")
+
+MANIFEST_VERSION = 1
+
+
+def package_directory(package=PLUGIN_DIRECTORY):
+    """Returns the directory of the plugin package without importing it."""
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError(f"❌ Plugin package '{package}' not found.")
+    return list(spec.submodule_search_locations)[0]
+
+
+def source_fingerprints(package=PLUGIN_DIRECTORY):
+    """Returns ``{file name: [mtime_ns, size]}`` for every module in the plugin package."""
+    fingerprints = {}
+    with os.scandir(package_directory(package)) as entries:
+        for entry in entries:
+            if entry.name.endswith(".py") and entry.is_file():
+                stat = entry.stat()
+                fingerprints[entry.name] = [stat.st_mtime_ns, stat.st_size]
+    return fingerprints
+
+
+def operation_arity(operation_class):
+    """Returns how many operands ``execute`` takes, or ``None`` if it is variadic."""
+    parameters = inspect.signature(operation_class.execute).parameters.values()
+    if any(parameter.kind is inspect.Parameter.VAR_POSITIONAL for parameter in parameters):
+        return None
+    return sum(
+        1 for parameter in parameters
+        if parameter.name != "self" and parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
+
+
+def build_manifest(package=PLUGIN_DIRECTORY):
+    """Imports every plugin module and describes the operations they registered."""
+    from operations.operation_base import Operation  # ✅ Only needed when (re)building
+
+    package_module = importlib.import_module(package)
+    for _, module_name, _ in pkgutil.iter_modules(package_module.__path__, package + "."):
+        importlib.import_module(module_name)
+
+    operations = {}
+    for name, operation_class in sorted(Operation._registry.items()):  # pylint: disable=protected-access
+        if not operation_class.__module__.startswith(package + "."):
+            continue
+        operations[name] = {
+            "module": operation_class.__module__,
+            "class": operation_class.__name__,
+            "arity": operation_arity(operation_class),
+        }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "package": package,
+        "sources": source_fingerprints(package),
+        "operations": operations,
+    }
+
+
+def read_manifest(path=PLUGIN_MANIFEST_PATH, package=PLUGIN_DIRECTORY):
+    """Returns the cached manifest if it is still current, otherwise ``None``."""
+    try:
+        with open(path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("package") != package:
+        return None
+    if manifest.get("sources") != source_fingerprints(package):
+        logger.info("🔄 Plugin sources changed; manifest is stale.")
+        return None
+    return manifest
+
+
+def write_manifest(manifest, path=PLUGIN_MANIFEST_PATH):
+    """Writes the manifest atomically so a concurrent reader never sees a partial file."""
+    temporary_path = f"{path}.tmp"
+    try:
+        with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(temporary_path, path)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write plugin manifest '{path}': {e}")
+
+
+def load_manifest(path=PLUGIN_MANIFEST_PATH, package=PLUGIN_DIRECTORY, refresh=False):
+    """Returns a current manifest, rebuilding and persisting it when stale or when ``refresh`` is set."""
+    manifest = None if refresh else read_manifest(path, package)
+    if manifest is None:
+        manifest = build_manifest(package)
+        if manifest["operations"]:
+            write_manifest(manifest, path)
+            logger.info(f"✅ Plugin manifest rebuilt with {len(manifest['operations'])} operations.")
+        else:
+            logger.warning("⚠️ No operations registered; plugin manifest not written.")
+    return manifest
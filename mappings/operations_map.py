@@ -1,21 +1,78 @@
 """
 Operation Mapping - Maps operation names to their respective classes.
+
+Names come from the cached plugin manifest (see ``mappings.manifest``); an
+operation's module is imported and its class instantiated only the first time
+that operation is looked up. Operations marked ``cacheable`` are wrapped with
+the shared result cache (see ``mappings.result_cache``).
 """
 
-from operations.addition import Add
-from operations.subtraction import Subtract
-from operations.multiplication import Multiply
-from operations.division import Divide
-from operations.statistics import Mean, Median, StandardDeviation, Variance
+import importlib
+from collections.abc import MutableMapping
+
+from mappings.manifest import load_manifest
+from mappings.result_cache import result_cache
+
+
+class LazyOperationMapping(MutableMapping):
+    """Dictionary of operation names to ``execute`` callables that imports plugins on first use."""
+
+    def __init__(self, specs=None):
+        self._specs = dict(specs or {})  # name -> {"module", "class", "arity"} or None when set directly
+        self._resolved = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._resolved[name]
+        except KeyError:
+            spec = self._specs[name]
+        operation_class = getattr(importlib.import_module(spec["module"]), spec["class"])
+        execute = operation_class().execute
+        if getattr(operation_class, "cacheable", False) and result_cache.enabled:
+            execute = result_cache.wrap(name, execute)
+        self._resolved[name] = execute
+        return execute
+
+    def __setitem__(self, name, execute):
+        self._specs.setdefault(name, None)
+        self._resolved[name] = execute
+
+    def __delitem__(self, name):
+        del self._specs[name]
+        self._resolved.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._specs  # ✅ Membership never imports a plugin
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def copy(self):
+        """Returns a shallow copy that keeps unresolved entries lazy."""
+        duplicate = LazyOperationMapping(self._specs)
+        duplicate._resolved.update(self._resolved)  # pylint: disable=protected-access
+        return duplicate
+
+    def update(self, other=(), /, **kwargs):
+        """Merges another mapping, keeping entries lazy when it is a ``LazyOperationMapping``."""
+        if isinstance(other, LazyOperationMapping):
+            self._specs.update(other._specs)  # pylint: disable=protected-access
+            self._resolved.update(other._resolved)  # pylint: disable=protected-access
+            other = ()
+        super().update(other, **kwargs)
+
+    def arity(self, name):
+        """Returns the number of operands ``name`` takes, or ``None`` if it accepts any number."""
+        spec = self._specs[name]
+        return spec["arity"] if spec else None
+
+    def is_loaded(self, name):
+        """True once the operation's module has been imported through this mapping."""
+        return name in self._resolved
+
 
 # ✅ Dictionary mapping operation names to their corresponding functions
-operation_mapping = {
-    "add": Add().execute,
-    "subtract": Subtract().execute,
-    "multiply": Multiply().execute,
-    "divide": Divide().execute,
-    "mean": Mean().execute,
-    "median": Median().execute,
-    "std_dev": StandardDeviation().execute,
-    "variance": Variance().execute,
-}
+operation_mapping = LazyOperationMapping(load_manifest()["operations"])
@@ -0,0 +1,158 @@
+"""
+Result Cache - Memoizes the results of deterministic operations.
+
+Results are keyed by the operation name and a digest of its normalized Decimal
+operands (``1.50`` and ``1.5`` share an entry). The in-memory tier is an LRU
+bounded to ``RESULT_CACHE_SIZE`` entries; setting ``RESULT_CACHE_PATH`` adds a
+SQLite tier that survives restarts. Only operations whose class sets
+``cacheable = True`` are wrapped, and calls with non-scalar operands (vectors,
+operand files) always run the operation.
+"""
+
+import functools
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from decimal import Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN
+from typing import NamedTuple
+
+from config.env import RESULT_CACHE_PATH, RESULT_CACHE_SIZE
+
+logger = logging.getLogger("calculator_logger")
+
+_KEY_SEPARATOR = "\x1f"
+_NORMALIZE_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)  # Never rounds long operands
+
+
+class CacheInfo(NamedTuple):
+    """Counters describing cache effectiveness, like ``functools``' ``cache_info``."""
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def _normalized(operand):
+    """Returns the canonical text of a scalar operand, or ``None`` if it cannot be cached."""
+    if isinstance(operand, bool) or not isinstance(operand, (Decimal, int, str)):
+        return None
+    try:
+        return str(_NORMALIZE_CONTEXT.normalize(Decimal(operand)))
+    except ArithmeticError:
+        return None
+
+
+class ResultCache:
+    """LRU cache of operation results with an optional SQLite tier."""
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE, path=RESULT_CACHE_PATH):
+        self.maxsize = maxsize
+        self.path = path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    @property
+    def enabled(self):
+        """True when results are cached in memory or on disk."""
+        return self.maxsize > 0 or bool(self.path)
+
+    @staticmethod
+    def key(operation_name, operands):
+        """Returns the cache key for a call, or ``None`` when an operand is not a cacheable scalar."""
+        parts = [operation_name]
+        for operand in operands:
+            text = _normalized(operand)
+            if text is None:
+                return None
+            parts.append(text)
+        return hashlib.blake2b(_KEY_SEPARATOR.join(parts).encode(), digest_size=20).digest()
+
+    def _database(self):
+        """Opens the SQLite tier on first use."""
+        if self._connection is None:
+            import sqlite3  # ✅ Only needed when persistence is configured
+
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, result TEXT NOT NULL)")
+        return self._connection
+
+    def get(self, key):
+        """Returns the cached result for ``key`` or ``None``, counting hits and misses."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            if self.path:
+                row = self._database().execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    result = Decimal(row[0])
+                    self._remember(key, result)
+                    self.disk_hits += 1
+                    return result
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        """Stores a result in memory and, if configured, on disk."""
+        if not isinstance(result, Decimal):
+            return
+        with self._lock:
+            self._remember(key, result)
+            if self.path:
+                with self._database() as connection:
+                    connection.execute("INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                                       (key, str(result)))
+
+    def _remember(self, key, result):
+        """Adds an entry to the in-memory LRU, evicting the least recently used beyond ``maxsize``."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def wrap(self, operation_name, execute):
+        """Returns ``execute`` wrapped so results for repeated operands come from the cache."""
+        @functools.wraps(execute)
+        def cached_execute(*operands):
+            key = self.key(operation_name, operands)
+            if key is None:
+                return execute(*operands)
+            result = self.get(key)
+            if result is None:
+                result = execute(*operands)
+                self.put(key, result)
+            return result
+        cached_execute.cache_info = self.info
+        return cached_execute
+
+    def info(self):
+        """Returns the current ``CacheInfo`` counters."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.disk_hits, self.evictions,
+                             len(self._entries), self.maxsize)
+
+    def clear(self, persistent=False):
+        """Empties the in-memory tier (and the SQLite tier when ``persistent``) and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+            if persistent and self.path:
+                with self._database() as connection:
+                    connection.execute("DELETE FROM results")
+        logger.info("🧹 Result cache cleared.")
+
+
+# ✅ Shared by every operation looked up through ``operation_mapping``
+result_cache = ResultCache()
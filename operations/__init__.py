@@ -1,7 +1,22 @@
-from .addition import Add
-from .subtraction import Subtract
-from .multiplication import Multiply
-from .division import Divide
-from .statistics import Mean, Median, StandardDeviation, Variance
+"""Calculator operation plugins, imported lazily on first attribute access."""
+import importlib
+
+_EXPORTS = {
+    "Add": "addition",
+    "Subtract": "subtraction",
+    "Multiply": "multiplication",
+    "Divide": "division",
+    "Mean": "statistics",
+    "Median": "statistics",
+    "StandardDeviation": "statistics",
+    "Variance": "statistics",
+}
 
 __all__ = ["Add", "Subtract", "Multiply", "Divide", "Mean", "Median", "StandardDeviation", "Variance"]
+
+
+def __getattr__(name):
+    """Imports the module defining ``name`` the first time it is accessed."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,232 @@
+"""
+Decimal Statistics Kernel - Exact mean, variance, standard deviation and median.
+
+The stdlib ``statistics`` module converts every ``Decimal`` to a ``Fraction``
+before summing, which dominates the run time for large inputs. This kernel
+instead sums the Decimals (and their squares) directly under a context wide
+enough that no addition or multiplication ever rounds, and only rounds once,
+in the caller's context, when the final quotient or square root is taken.
+Because both approaches round the same exact rational, the results are
+identical to ``statistics.mean``, ``variance`` and ``stdev``.
+
+``Moments`` keeps the same exact sums as a mergeable running aggregate, so
+chunked or partitioned input produces the same results as a single list.
+
+``median`` finds the middle element(s) by quickselect in expected O(n) time
+instead of sorting the whole list. Non-finite inputs (NaN, Infinity) are handed
+to the stdlib functions so their special-value semantics are kept.
+"""
+
+import operator
+import random
+import statistics
+from decimal import (
+    Context, Decimal, Inexact, InvalidOperation, MAX_EMAX, MAX_PREC, MIN_EMIN, Rounded, localcontext,
+)
+
+StatisticsError = statistics.StatisticsError
+
+# ✅ Wide enough that sums and products of Decimals never round; the traps prove it
+EXACT_CONTEXT = Context(
+    prec=MAX_PREC,
+    Emax=MAX_EMAX,
+    Emin=MIN_EMIN,
+    traps=[InvalidOperation, Inexact, Rounded],
+)
+
+_ZERO = Decimal(0)
+
+
+def exact_sums(values):
+    """Returns the exact ``(Σx, Σx²)`` of Decimal ``values``, or ``None`` if the sums are not finite."""
+    try:
+        with localcontext(EXACT_CONTEXT):
+            total = sum(values, _ZERO)
+            total_of_squares = sum(map(operator.mul, values, values), _ZERO)
+    except InvalidOperation:  # Infinity - Infinity, or a NaN operand
+        return None
+    if not (total.is_finite() and total_of_squares.is_finite()):
+        return None
+    return total, total_of_squares
+
+
+def _scaled_deviations(count, total, total_of_squares):
+    """Returns ``n * Σ(x - mean)²`` exactly from the power sums."""
+    with localcontext(EXACT_CONTEXT):
+        return count * total_of_squares - total * total
+
+
+def _sum_of_squared_deviations(values):
+    """Returns ``n * Σ(x - mean)²`` exactly (as a Decimal), or ``None`` for non-finite data."""
+    sums = exact_sums(values)
+    if sums is None:
+        return None
+    return _scaled_deviations(len(values), *sums)
+
+
+def _divide(exact, count):
+    """Rounds ``exact / count`` once in the caller's context, as an integer ratio like the stdlib does."""
+    numerator, denominator = exact.as_integer_ratio()
+    return Decimal(numerator) / Decimal(denominator * count)
+
+
+def mean(values):
+    """Returns the arithmetic mean, identical to ``statistics.mean`` for Decimals."""
+    if not values:
+        raise StatisticsError("mean requires at least one data point")
+    sums = exact_sums(values)
+    if sums is None:
+        return statistics.mean(values)
+    return _divide(sums[0], len(values))
+
+
+def variance(values):
+    """Returns the sample variance, identical to ``statistics.variance`` for Decimals."""
+    n = len(values)
+    if n < 2:
+        raise StatisticsError("variance requires at least two data points")
+    scaled = _sum_of_squared_deviations(values)
+    if scaled is None:
+        return statistics.variance(values)
+    return _divide(scaled, n * (n - 1))
+
+
+def _stdev_of(scaled, n):
+    """Returns the correctly rounded sample standard deviation from ``n * Σ(x - mean)²``."""
+    numerator, denominator = scaled.as_integer_ratio()
+    return sqrt_of_fraction(numerator, denominator * n * (n - 1))
+
+
+def stdev(values):
+    """Returns the sample standard deviation, identical to ``statistics.stdev`` for Decimals."""
+    n = len(values)
+    if n < 2:
+        raise StatisticsError("stdev requires at least two data points")
+    scaled = _sum_of_squared_deviations(values)
+    if scaled is None:
+        return statistics.stdev(values)
+    return _stdev_of(scaled, n)
+
+
+def sqrt_of_fraction(numerator, denominator):
+    """Returns ``sqrt(numerator / denominator)`` correctly rounded in the current context."""
+    if numerator <= 0:
+        if not numerator:
+            return Decimal("0.0")
+        numerator, denominator = -numerator, -denominator
+
+    root = (Decimal(numerator) / Decimal(denominator)).sqrt()  # May be off by one ulp
+    root_n, root_d = root.as_integer_ratio()
+
+    plus = root.next_plus()
+    plus_n, plus_d = plus.as_integer_ratio()
+    # 🔹 Round up if the fraction lies above the midpoint between root and its successor
+    if 4 * numerator * (root_d * plus_d) ** 2 > denominator * (root_d * plus_n + plus_d * root_n) ** 2:
+        return plus
+
+    minus = root.next_minus()
+    minus_n, minus_d = minus.as_integer_ratio()
+    if 4 * numerator * (root_d * minus_d) ** 2 < denominator * (root_d * minus_n + minus_d * root_n) ** 2:
+        return minus
+
+    return root
+
+
+class Moments:
+    """Exact, mergeable running aggregates: count, Σx, Σx², minimum and maximum.
+
+    Exact power sums combine by plain addition (the exact counterpart of Chan's
+    pairwise update), so chunks of a stream or partitions of a large input can
+    be folded in any order. Their size grows only with the digits of the data,
+    not with the number of values.
+    """
+
+    __slots__ = ("count", "total", "total_of_squares", "minimum", "maximum")
+
+    def __init__(self, count=0, total=_ZERO, total_of_squares=_ZERO, minimum=None, maximum=None):
+        self.count = count
+        self.total = total
+        self.total_of_squares = total_of_squares
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @classmethod
+    def of(cls, values):
+        """Returns the moments of one list of Decimals."""
+        return cls().add(values)
+
+    def add(self, values):
+        """Folds a chunk of Decimal values in and returns ``self``."""
+        if not values:
+            return self
+        sums = exact_sums(values)
+        if sums is None:
+            raise ValueError("⚠️ Streaming statistics require finite numbers.")
+        return self.merge(Moments(len(values), sums[0], sums[1], min(values), max(values)))
+
+    def merge(self, other):
+        """Folds another ``Moments`` in and returns ``self``."""
+        if not other.count:
+            return self
+        with localcontext(EXACT_CONTEXT):
+            self.total += other.total
+            self.total_of_squares += other.total_of_squares
+        self.count += other.count
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+        return self
+
+    def mean(self):
+        """Returns the mean, identical to ``mean`` over the same values."""
+        if not self.count:
+            raise StatisticsError("mean requires at least one data point")
+        return _divide(self.total, self.count)
+
+    def variance(self):
+        """Returns the sample variance, identical to ``variance`` over the same values."""
+        if self.count < 2:
+            raise StatisticsError("variance requires at least two data points")
+        return _divide(_scaled_deviations(self.count, self.total, self.total_of_squares), self.count * (self.count - 1))
+
+    def stdev(self):
+        """Returns the sample standard deviation, identical to ``stdev`` over the same values."""
+        if self.count < 2:
+            raise StatisticsError("stdev requires at least two data points")
+        return _stdev_of(_scaled_deviations(self.count, self.total, self.total_of_squares), self.count)
+
+
+def select(values, k):
+    """Returns the ``k``-th and ``k + 1``-th smallest values (0-based) using quickselect.
+
+    The second item is ``None`` when ``k`` is the last position.
+    """
+    rng = random.Random(len(values))  # Deterministic pivots keep timings reproducible
+    candidates = values
+    ceiling = None  # Smallest value known to sit above every remaining candidate
+    while True:
+        pivot = sorted(rng.choice(candidates) for _ in range(3))[1]
+        lower = [value for value in candidates if value < pivot]
+        if k < len(lower):
+            candidates, ceiling = lower, pivot
+            continue
+        upper = [value for value in candidates if value > pivot]
+        equal_end = len(candidates) - len(upper)
+        if k < equal_end:
+            if k + 1 < equal_end:
+                return pivot, pivot
+            return pivot, min(upper) if upper else ceiling
+        candidates, k = upper, k - equal_end
+
+
+def median(values):
+    """Returns the median, identical to ``statistics.median`` but without sorting."""
+    n = len(values)
+    if n == 0:
+        raise StatisticsError("no median for empty data")
+    if not all(value.is_finite() for value in values):
+        return statistics.median(values)
+    middle = n // 2
+    if n % 2:
+        return select(values, middle)[0]
+    low, high = select(values, middle - 1)
+    return (low + high) / 2
@@ -0,0 +1,186 @@
+"""
+Memory-Mapped Operands - Binary operand files read through ``numpy.memmap``.
+
+``@data.npy`` (a 1-D NumPy array), ``@data.f64`` (raw little-endian float64)
+and ``@data.i64`` (raw little-endian int64) are mapped rather than parsed, so
+statistics and vector arithmetic run directly over the file's pages without
+creating a Python object per value:
+
+- ``fast`` mode (default, ``BINARY_OPERAND_MODE``): float64 statistics folded
+  block by block with Chan's pairwise update, and NumPy ufuncs for vectors.
+- ``exact`` mode (``@data.f64:exact``): the precision guard. Values are
+  converted to ``Decimal`` in chunks and take the exact kernel, matching what
+  the same numbers typed as text would give.
+"""
+
+import statistics
+from decimal import Decimal
+
+from config.env import BINARY_OPERAND_MODE, OPERAND_CHUNK_SIZE
+from operations.sources import OperandSource, OperandSourceError
+
+BINARY_MODES = ("fast", "exact")
+_RAW_DTYPES = {".f64": "<f8", ".i64": "<i8"}
+
+# ✅ Values folded per NumPy call in fast mode; bounds temporaries, not the file size
+BLOCK_SIZE = 1 << 20
+
+
+class BinarySource(OperandSource):
+    """A memory-mapped binary file of operands."""
+
+    __slots__ = ("mode", "_array")
+
+    vectorizable = True
+
+    def __init__(self, path, mode=None, chunk_size=OPERAND_CHUNK_SIZE):
+        mode = (mode or BINARY_OPERAND_MODE).lower()
+        if mode not in BINARY_MODES:
+            raise OperandSourceError(f"⚠️ Unknown binary operand mode '{mode}'. Expected 'fast' or 'exact'.")
+        super().__init__(path, mode, chunk_size)
+        self.mode = mode
+        self._array = None
+
+    @property
+    def exact(self):
+        """True when the precision guard routes this operand through Decimals."""
+        return self.mode == "exact"
+
+    def array(self):
+        """Returns the read-only memory-mapped array, opening it on first use."""
+        if self._array is None:
+            import numpy as np  # ✅ Only imported once a binary operand is actually used
+
+            suffix = self.path[self.path.rfind("."):].lower()
+            if suffix == ".npy":
+                array = np.load(self.path, mmap_mode="r")
+            else:
+                array = np.memmap(self.path, dtype=_RAW_DTYPES[suffix], mode="r")
+            if array.ndim != 1 or array.dtype.kind not in "iuf":
+                raise ValueError(f"⚠️ '{self.path}' must hold a one-dimensional numeric array.")
+            self._array = array
+        return self._array
+
+    def __len__(self):
+        return len(self.array())
+
+    def chunks(self, convert=Decimal):
+        """Yields lists of at most ``chunk_size`` operands from the mapped buffer, each value's text parsed by ``convert``."""
+        if convert is Decimal:
+            return decimal_chunks(self.array(), self.chunk_size)
+        array = self.array()
+        return (
+            [convert(repr(value)) for value in array[start:start + self.chunk_size].tolist()]
+            for start in range(0, len(array), self.chunk_size)
+        )
+
+
+def decimal_chunks(array, chunk_size=OPERAND_CHUNK_SIZE):
+    """Yields an array's values as lists of Decimals, ``chunk_size`` at a time."""
+    to_decimal = _float_to_decimal if array.dtype.kind == "f" else Decimal
+    for start in range(0, len(array), chunk_size):
+        yield [to_decimal(value) for value in array[start:start + chunk_size].tolist()]
+
+
+def _float_to_decimal(value):
+    """Converts a float through its shortest repr, as if it had been typed."""
+    return Decimal(repr(value))
+
+
+def is_binary_source(value):
+    """True for memory-mapped binary operands."""
+    return isinstance(value, BinarySource)
+
+
+class FloatMoments:
+    """Float64 count, mean, M2 (sum of squared deviations), minimum and maximum, merged with Chan's update."""
+
+    __slots__ = ("count", "_mean", "m2", "minimum", "maximum")
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, minimum=None, maximum=None):
+        self.count = count
+        self._mean = mean
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @classmethod
+    def of_array(cls, array):
+        """Folds a (possibly memory-mapped) array in blocks of ``BLOCK_SIZE`` values."""
+        moments = cls()
+        for start in range(0, len(array), BLOCK_SIZE):
+            block = array[start:start + BLOCK_SIZE]
+            block_mean = float(block.mean(dtype="f8"))
+            deviations = block.astype("f8") - block_mean
+            moments.merge(cls(len(block), block_mean, float(deviations @ deviations),
+                              float(block.min()), float(block.max())))
+        return moments
+
+    def merge(self, other):
+        """Folds another ``FloatMoments`` in and returns ``self``."""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self._mean, self.m2 = other.count, other._mean, other.m2  # pylint: disable=protected-access
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other._mean - self._mean  # pylint: disable=protected-access
+        self._mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def mean(self):
+        """Returns the mean as a Decimal."""
+        if not self.count:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return _float_to_decimal(self._mean)
+
+    def variance(self):
+        """Returns the sample variance as a Decimal."""
+        if self.count < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        return _float_to_decimal(self.m2 / (self.count - 1))
+
+    def stdev(self):
+        """Returns the sample standard deviation as a Decimal."""
+        if self.count < 2:
+            raise statistics.StatisticsError("stdev requires at least two data points")
+        return _float_to_decimal((self.m2 / (self.count - 1)) ** 0.5)
+
+
+def _fast_sources(args):
+    """Returns the binary sources if every operand is one in fast mode, otherwise ``None``."""
+    if args and all(is_binary_source(arg) and not arg.exact for arg in args):
+        return args
+    return None
+
+
+def fast_moments(args):
+    """Returns merged ``FloatMoments`` over fast-mode binary operands, or ``None`` if any operand needs exact handling."""
+    sources = _fast_sources(args)
+    if sources is None:
+        return None
+    from operations.parallel_stats import array_moments  # ✅ Splits huge arrays across processes
+
+    moments = FloatMoments()
+    for source in sources:
+        moments.merge(array_moments(source.array()))
+    return moments
+
+
+def fast_median(args):
+    """Returns the float64 median of fast-mode binary operands, or ``None`` if any operand needs exact handling."""
+    sources = _fast_sources(args)
+    if sources is None:
+        return None
+    import numpy as np
+
+    arrays = [source.array() for source in sources]
+    values = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+    if not len(values):
+        raise statistics.StatisticsError("no median for empty data")
+    return _float_to_decimal(float(np.median(values)))  # Partitions a private copy of the values
@@ -8,32 +8,62 @@ from decimal import Decimal, InvalidOperation
 
 logger = logging.getLogger(__name__)
 
+
+def _from_other(value):
+    """Converts any other type through its string form."""
+    return Decimal(str(value))
+
+
+# ✅ Type-dispatch table: exact operand type -> Decimal conversion (Decimals pass through untouched)
+_CONVERTERS = {
+    Decimal: lambda value: value,
+    int: Decimal,
+    str: Decimal,
+    float: _from_other,  # Shortest repr, so 0.1 stays 0.1
+}
+
+
 class Operation(ABC):
     """Base class for all operations."""
 
     _registry = {}  # Stores registered operations
+    cacheable = False  # ✅ Deterministic operations set this to have their results memoized
 
     @abstractmethod
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """Performs the operation."""
 
+    # 🔹 Validation policy; ``ArithmeticOperation`` tightens it for the two-operand plugins
+    rejected_types = (bool,)
+    rejected_reason = "Boolean values are not allowed."
+    per_operand_errors = False
+
     @classmethod
     def validate_numbers(cls, a, b) -> tuple[Decimal, Decimal]:
         """Convert inputs to Decimals or raise TypeError for invalid inputs."""
-    
-        # 🚨 Explicitly reject booleans
-        if isinstance(a, bool) or isinstance(b, bool):
-            error_msg = f"⚠️ Invalid input: {repr(a)} ({type(a).__name__}) or {repr(b)} ({type(b).__name__}) - Boolean values are not allowed."
+
+        # ✅ Fast path: the evaluator already hands over Decimals
+        if type(a) is Decimal and type(b) is Decimal:
+            return a, b
+
+        # 🚨 Explicitly reject booleans (and, for arithmetic, lists and dictionaries)
+        if isinstance(a, cls.rejected_types) or isinstance(b, cls.rejected_types):
+            error_msg = f"⚠️ Invalid input: {repr(a)} ({type(a).__name__}) or {repr(b)} ({type(b).__name__}) - {cls.rejected_reason}"
             logger.error(error_msg)
             raise TypeError(error_msg)
 
+        return cls._convert(a, "a", a, b), cls._convert(b, "b", a, b)
+
+    @classmethod
+    def _convert(cls, value, name, a, b) -> Decimal:
+        """Converts one operand through the type-dispatch table."""
         try:
-            validated_a = Decimal(str(a))
-            validated_b = Decimal(str(b))
-            logger.debug(f"✅ Validated inputs: {validated_a}, {validated_b}")
-            return validated_a, validated_b
+            return _CONVERTERS.get(type(value), _from_other)(value)
         except (InvalidOperation, ValueError, TypeError) as exc:
-            error_msg = f"⚠️ Invalid input: {repr(a)} ({type(a).__name__}) or {repr(b)} ({type(b).__name__}) - Expected a number."
+            if cls.per_operand_errors:
+                error_msg = f"⚠️ Invalid input for '{name}': {repr(value)} ({type(value).__name__}) - Expected a number."
+            else:
+                error_msg = f"⚠️ Invalid input: {repr(a)} ({type(a).__name__}) or {repr(b)} ({type(b).__name__}) - Expected a number."
             logger.error(error_msg)
             raise TypeError(error_msg) from exc
 
@@ -58,3 +88,16 @@ class Operation(ABC):
             logger.error(f"❌ Operation '{operation_name}' not found.")
             raise KeyError(f"⚠️ Operation '{operation_name}' not found.")
         return cls._registry[operation_name]
+
+
+class ArithmeticOperation(Operation):
+    """Base class for two-operand arithmetic with stricter type checks and per-operand error messages."""
+
+    rejected_types = (bool, list, dict)
+    rejected_reason = "Invalid type."
+    per_operand_errors = True
+
+    @staticmethod
+    @abstractmethod
+    def compute(a: Decimal, b: Decimal) -> Decimal:
+        """Applies the operation to operands already validated as Decimals (the trusted batch entry point)."""
@@ -0,0 +1,127 @@
+"""
+Parallel Statistics - Map-reduce of one huge statistic across worker processes.
+
+The values are copied once into a ``multiprocessing.shared_memory`` block and
+every worker attaches to it by name and reduces its own slice to a partial
+aggregate (count, sum, M2, minimum, maximum); only those small partials travel
+back. Partials are merged exactly:
+
+- ``exact`` partials are ``Moments`` (exact Decimal power sums), so the merged
+  result is identical to the sequential kernel.
+- float64 partials are ``FloatMoments``; their means and M2s are combined with
+  Chan's formula in ``Fraction`` arithmetic, so merging adds no rounding of its
+  own and the result matches the sequential path after quantization.
+
+Arrays shorter than ``STATS_PARALLEL_MIN_VALUES`` (or with one worker) are
+reduced in-process.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from multiprocessing import shared_memory
+
+from config.env import STATS_PARALLEL_MIN_VALUES, STATS_WORKERS
+from operations.decimal_stats import Moments
+from operations.mapped import FloatMoments, decimal_chunks
+
+
+def stats_workers():
+    """Returns the configured worker count (``STATS_WORKERS``, or one per CPU)."""
+    return STATS_WORKERS or os.cpu_count() or 1
+
+
+def partition(length, parts):
+    """Splits ``range(length)`` into at most ``parts`` contiguous ``(start, stop)`` slices of near-equal size."""
+    parts = max(1, min(parts, length))
+    size, extra = divmod(length, parts)
+    bounds, start = [], 0
+    for index in range(parts):
+        stop = start + size + (index < extra)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def reduce_slice(array, exact):
+    """Reduces one slice to its partial aggregate."""
+    if exact:
+        moments = Moments()
+        for chunk in decimal_chunks(array):
+            moments.add(chunk)
+        return moments
+    return FloatMoments.of_array(array)
+
+
+def _reduce_shared(task):
+    """Worker entry point: reduces ``array[start:stop]`` read straight from shared memory."""
+    import numpy as np
+
+    name, dtype, length, start, stop, exact = task
+    block = shared_memory.SharedMemory(name=name)  # Workers share the parent's resource tracker
+    try:
+        view = np.ndarray((length,), dtype=dtype, buffer=block.buf)
+        partial = reduce_slice(view[start:stop], exact)
+        del view  # Release the buffer export before closing the block
+        return partial
+    finally:
+        block.close()
+
+
+def merge_float_partials(partials):
+    """Merges ``FloatMoments`` partials with Chan's formula in exact rational arithmetic."""
+    partials = [partial for partial in partials if partial.count]
+    if not partials:
+        return FloatMoments()
+    count = sum(partial.count for partial in partials)
+    means = [Fraction(partial._mean) for partial in partials]  # pylint: disable=protected-access
+    mean = sum(partial.count * partial_mean for partial, partial_mean in zip(partials, means)) / count
+    m2 = sum(
+        Fraction(partial.m2) + partial.count * (partial_mean - mean) ** 2
+        for partial, partial_mean in zip(partials, means)
+    )
+    return FloatMoments(
+        count, float(mean), float(m2),
+        min(partial.minimum for partial in partials), max(partial.maximum for partial in partials),
+    )
+
+
+def merge_partials(partials, exact):
+    """Merges partial aggregates from every slice."""
+    if exact:
+        merged = Moments()
+        for partial in partials:
+            merged.merge(partial)
+        return merged
+    return merge_float_partials(partials)
+
+
+def array_moments(array, exact=False, workers=None, min_values=None):
+    """
+    Returns the ``Moments`` (``exact``) or ``FloatMoments`` of a 1-D numeric array.
+
+    Large arrays are split across ``workers`` processes sharing one memory block;
+    small arrays, or a single worker, are reduced in-process.
+    """
+    import numpy as np
+
+    workers = workers or stats_workers()
+    min_values = STATS_PARALLEL_MIN_VALUES if min_values is None else min_values
+    if workers < 2 or len(array) < max(min_values, 2):
+        return reduce_slice(array, exact)
+
+    block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    try:
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        shared[:] = array
+        del shared
+        tasks = [
+            (block.name, array.dtype.str, len(array), start, stop, exact)
+            for start, stop in partition(len(array), workers)
+        ]
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            partials = list(executor.map(_reduce_shared, tasks))
+    finally:
+        block.close()
+        block.unlink()
+    return merge_partials(partials, exact)
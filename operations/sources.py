@@ -0,0 +1,140 @@
+"""
+Operand Sources - Operands read from a file instead of the command line.
+
+``mean @data.csv`` reads every number in ``data.csv``; ``mean @data.csv:price``
+(or ``:2`` for the third column) reads a single column. A first row that is not
+numeric is treated as a header. Binary ``.npy``, ``.f64`` and ``.i64`` files are
+memory-mapped instead (see ``operations.mapped``). Files are read in chunks of
+``OPERAND_CHUNK_SIZE`` values, so statistics that fold chunks into running
+aggregates use constant memory however large the file is.
+"""
+
+import csv
+import os
+from decimal import Decimal, InvalidOperation
+from itertools import chain, islice
+
+from config.env import OPERAND_CHUNK_SIZE
+
+BINARY_SUFFIXES = (".npy", ".f64", ".i64")
+
+# ✅ Characters read per block when every cell of a file is wanted
+READ_BLOCK_SIZE = 1 << 20
+
+
+class OperandSourceError(ValueError):
+    """Raised when an operand file reference is malformed."""
+
+
+class OperandSource:
+    """A CSV (or one-number-per-line) file of operands, optionally restricted to one column."""
+
+    __slots__ = ("path", "column", "chunk_size")
+
+    vectorizable = False  # True for sources arithmetic can consume as vectors
+
+    def __init__(self, path, column=None, chunk_size=OPERAND_CHUNK_SIZE):
+        self.path = path
+        self.column = column
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def parse(cls, token):
+        """Parses ``@path`` or ``@path:column`` into a source, checking that the file exists."""
+        body = token[1:]
+        path, column = body, None
+        if not os.path.isfile(body) and ":" in body:
+            path, _, column = body.rpartition(":")
+        if not path or not os.path.isfile(path):
+            raise FileNotFoundError(f"❌ Operand file not found: '{path or body}'.")
+        if path.lower().endswith(BINARY_SUFFIXES):
+            from operations.mapped import BinarySource  # ✅ Binary files are memory-mapped, not parsed
+
+            return BinarySource(path, column or None)
+        return cls(path, column or None)
+
+    def __str__(self):
+        return f"@{self.path}" + (f":{self.column}" if self.column else "")
+
+    __repr__ = __str__
+
+    def __eq__(self, other):
+        return isinstance(other, OperandSource) and (self.path, self.column) == (other.path, other.column)
+
+    def __hash__(self):
+        return hash((self.path, self.column))
+
+    def _column_index(self, first_row):
+        """Returns ``(index or None, is_header)`` for the configured column given the first row."""
+        is_header = any(cell.strip() and not _is_number(cell) for cell in first_row)
+        if self.column is None:
+            return None, is_header
+        if self.column.isdigit():
+            return int(self.column), is_header
+        names = [cell.strip().lower() for cell in first_row]
+        if not is_header or self.column.lower() not in names:
+            raise ValueError(f"⚠️ Column '{self.column}' not found in '{self.path}'.")
+        return names.index(self.column.lower()), True
+
+    def chunks(self, convert=Decimal):
+        """Yields lists of at most ``chunk_size`` operands, in file order, each cell parsed by ``convert``."""
+        with open(self.path, newline="", encoding="utf-8") as operand_file:
+            reader = csv.reader(operand_file)
+            first_row = next(reader, None)
+            if first_row is None:
+                return
+            index, is_header = self._column_index(first_row)
+            if index is None:
+                cells = chain([] if is_header else first_row, _split_cells(operand_file))
+            else:
+                rows = reader if is_header else chain([first_row], reader)
+                cells = (row[index] for row in rows if len(row) > index)
+
+            cells = filter(str.strip, cells)  # ✅ Blank cells are skipped without a Python-level loop
+            while chunk := list(islice(cells, self.chunk_size)):
+                yield self._to_numbers(chunk, convert)
+
+    def _to_numbers(self, cells, convert):
+        """Converts a chunk of text cells, naming the first bad value on failure."""
+        try:
+            return list(map(convert, cells))
+        except (InvalidOperation, ValueError):
+            bad = next(cell for cell in cells if not _is_number(cell, convert))
+            raise ValueError(f"⚠️ Non-numeric value {bad.strip()!r} in '{self.path}'.") from None
+
+    def __iter__(self):
+        return chain.from_iterable(self.chunks())
+
+
+def _split_cells(operand_file, block_size=READ_BLOCK_SIZE):
+    """
+    Yields every remaining cell of a CSV file, splitting blocks of text with str methods.
+
+    Quoted cells may contain commas or line breaks, so once a block holds a
+    quote the rest of the file is handed to the ``csv`` module.
+    """
+    carry = ""
+    while block := operand_file.read(block_size):
+        block = carry + block
+        if '"' in block:
+            lines = chain((block + operand_file.readline()).splitlines(keepends=True), operand_file)
+            yield from chain.from_iterable(csv.reader(lines))
+            return
+        cut = block.rfind("\n") + 1
+        carry = block[cut:]
+        yield from block[:cut].replace(",", "\n").splitlines()
+    yield from carry.replace(",", "\n").splitlines()
+
+
+def _is_number(text, convert=Decimal):
+    """True if ``text`` parses with ``convert`` (as a Decimal by default)."""
+    try:
+        convert(text)
+    except (InvalidOperation, ValueError):
+        return False
+    return True
+
+
+def is_source(value):
+    """True for operands read from a file."""
+    return isinstance(value, OperandSource)
@@ -1,49 +1,124 @@
 """
 Statistical Operations for the Calculator.
+
+Operands may include ``OperandSource`` files (``mean @data.csv``). Mean,
+variance and standard deviation fold such files chunk by chunk into exact
+running moments, so memory stays constant; median needs every value and
+reads them all into memory. When every operand is a memory-mapped binary file
+in fast mode, NumPy computes the statistic directly over the mapped buffers.
+Binary files large enough (``STATS_PARALLEL_MIN_VALUES``) are reduced across
+``STATS_WORKERS`` processes; see ``operations.parallel_stats``.
 """
 
 from decimal import Decimal, ROUND_HALF_UP
-import statistics
+from operations import decimal_stats, mapped
 from operations.operation_base import Operation
+from operations.sources import is_source
+
+
+def _stream_moments(args):
+    """Folds all operands into one ``Moments``, or ``FloatMoments`` when every operand is a fast binary file."""
+    fast = mapped.fast_moments(args)
+    if fast is not None:
+        return fast
+    moments = decimal_stats.Moments.of([Decimal(arg) for arg in args if not is_source(arg)])
+    for source in filter(is_source, args):
+        if mapped.is_binary_source(source):
+            from operations.parallel_stats import array_moments  # ✅ Splits huge arrays across processes
+
+            moments.merge(array_moments(source.array(), exact=True))
+            continue
+        for chunk in source.chunks():
+            moments.add(chunk)
+    return moments
+
+
+def _all_numbers(args):
+    """Returns every operand as a Decimal, expanding operand sources."""
+    return [number for arg in args for number in (arg if is_source(arg) else (Decimal(arg),))]
+
+
+def exact_mean(*args) -> Decimal:
+    """Returns the unrounded mean of the given numbers."""
+    if any(map(is_source, args)):
+        return _stream_moments(args).mean()
+    return decimal_stats.mean([Decimal(arg) for arg in args])
+
+
+def exact_median(*args) -> Decimal:
+    """Returns the unrounded median of the given numbers."""
+    result = mapped.fast_median(args)
+    if result is None:
+        result = decimal_stats.median(_all_numbers(args))  # Selection needs every value in memory
+    return Decimal(str(result))
+
+
+def exact_stdev(*args) -> Decimal:
+    """Returns the unrounded standard deviation of the given numbers."""
+    if any(map(is_source, args)):
+        return _stream_moments(args).stdev()
+    return decimal_stats.stdev([Decimal(arg) for arg in args])
+
+
+def exact_variance(*args) -> Decimal:
+    """Returns the unrounded variance of the given numbers (0 for a single value)."""
+    if any(map(is_source, args)):
+        moments = _stream_moments(args)
+        return Decimal(0) if moments.count == 1 else Decimal(str(moments.variance()))
+    numbers = [Decimal(arg) for arg in args]
+    if len(numbers) == 1:
+        return Decimal(0)  # Avoids StatisticsError for single values
+    return Decimal(str(decimal_stats.variance(numbers)))
+
+
+# ✅ Operation name -> unrounded kernel, for callers that round only a final result (see ``app.expressions``)
+EXACT = {"mean": exact_mean, "median": exact_median, "std_dev": exact_stdev, "variance": exact_variance}
 
 
 class Mean(Operation):
     """Computes the mean (average) of a list of numbers."""
 
+    cacheable = True
+
     @staticmethod
     def execute(*args) -> Decimal:
         """Returns the mean of the given numbers."""
-        numbers = [Decimal(arg) for arg in args]
-        return Decimal(statistics.mean(numbers)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return exact_mean(*args).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 class Median(Operation):
     """Computes the median of a list of numbers."""
 
+    cacheable = True
+
     @staticmethod
     def execute(*args) -> Decimal:
         """Returns the median of the given numbers."""
-        numbers = [Decimal(arg) for arg in args]
-        result = statistics.median(numbers)
-        return Decimal(str(result)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return exact_median(*args).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
 class StandardDeviation(Operation):
     """Computes the standard deviation of a list of numbers."""
 
+    cacheable = True
+
     @staticmethod
     def execute(*args) -> Decimal:
         """Returns the standard deviation of the given numbers."""
-        numbers = [Decimal(arg) for arg in args]
-        return Decimal(statistics.stdev(numbers)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return exact_stdev(*args).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 class Variance(Operation):
     """Computes the variance of a list of numbers."""
 
+    cacheable = True
+
     @staticmethod
     def execute(*args) -> Decimal:
         """Returns the variance of the given numbers."""
-        numbers = [Decimal(arg) for arg in args]
-        if len(numbers) == 1:
-            return Decimal(0)  # Avoids StatisticsError for single values
-        result = statistics.variance(numbers)
-        return Decimal(str(result)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return exact_variance(*args).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+# ✅ Register the operations
+Operation.register("mean", Mean)
+Operation.register("median", Median)
+Operation.register("std_dev", StandardDeviation)
+Operation.register("variance", Variance)
@@ -0,0 +1,145 @@
+"""
+Vectorized Arithmetic - Element-wise operations over operand vectors using NumPy.
+
+A ``Vector`` operand switches ``Add``, ``Subtract``, ``Multiply`` and ``Divide``
+onto this path: two operands are combined element-wise (a scalar or a
+one-element vector broadcasts against the other side) and a single vector is
+reduced left to right (``add [1,2,3]`` is ``1 + 2 + 3``).
+
+Two modes are available:
+
+- ``fast`` (default): float64 arrays, results converted back through their
+  shortest ``repr`` before rounding.
+- ``precise``: object arrays of ``Decimal``, giving exactly the scalar
+  operations' Decimal semantics with NumPy only handling broadcasting.
+
+Memory-mapped binary operand files (``operations.mapped.BinarySource``) are
+accepted wherever a vector is: fast mode hands the mapped buffer straight to
+the ufunc, and a source in exact mode forces the precise path.
+
+As with scalars, any zero divisor raises ``ZeroDivisionError``.
+"""
+
+import functools
+from decimal import Decimal, InvalidOperation
+
+from config.env import VECTOR_MODE
+
+# operation name -> NumPy ufunc name
+_UFUNCS = {
+    "add": "add",
+    "subtract": "subtract",
+    "multiply": "multiply",
+    "divide": "true_divide",
+}
+
+
+class Vector(tuple):
+    """An immutable vector of Decimal operands, printed as ``[1, 2, 3]``."""
+
+    def __new__(cls, values=()):
+        return super().__new__(cls, (_as_decimal(value) for value in values))
+
+    def __str__(self):
+        return "[" + ", ".join(str(value) for value in self) + "]"
+
+    __repr__ = __str__
+
+    def quantize(self, exp, rounding=None):
+        """Quantizes every element, mirroring ``Decimal.quantize``."""
+        return Vector(value.quantize(exp, rounding=rounding) for value in self)
+
+    @classmethod
+    def parse(cls, text):
+        """Parses ``[1,2,3]`` (spaces allowed) into a Vector."""
+        body = text.strip()
+        if not (body.startswith("[") and body.endswith("]")):
+            raise ValueError(f"⚠️ Invalid vector: {text!r}")
+        items = [item for item in body[1:-1].replace(",", " ").split()]
+        return cls(Decimal(item) for item in items)
+
+
+def _as_decimal(value):
+    """Converts a scalar operand to Decimal, rejecting booleans like the scalar operations do."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (bool, list, dict, tuple)):
+        raise TypeError(f"⚠️ Invalid input: {repr(value)} ({type(value).__name__}) - Invalid type.")
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError) as exc:
+        raise TypeError(f"⚠️ Invalid input: {repr(value)} ({type(value).__name__}) - Expected a number.") from exc
+
+
+def is_vector(value):
+    """True for operands that should take the vectorized path."""
+    return isinstance(value, Vector) or getattr(value, "vectorizable", False)
+
+
+def _to_array(np, operand, precise):
+    """Builds a float64 or Decimal object array (0-d for scalars)."""
+    if hasattr(operand, "array"):  # A memory-mapped BinarySource
+        if not precise:
+            return operand.array()
+        operand = Vector(value for chunk in operand.chunks() for value in chunk)
+    values = operand if is_vector(operand) else _as_decimal(operand)
+    if precise:
+        if is_vector(values):
+            array = np.empty(len(values), dtype=object)
+            array[:] = list(values)
+            return array
+        return np.array(values, dtype=object)
+    if is_vector(values):
+        return np.fromiter((float(value) for value in values), dtype=np.float64, count=len(values))
+    return np.float64(float(values))
+
+
+def _to_decimal(value):
+    """Converts one result element back to Decimal."""
+    return value if isinstance(value, Decimal) else Decimal(repr(float(value)))
+
+
+def execute(operation_name, *operands, precise=None):
+    """Runs ``operation_name`` element-wise (two operands) or as a reduction (one vector)."""
+    import numpy as np  # ✅ Only imported once a vector is actually used
+
+    if precise is None:
+        precise = VECTOR_MODE == "precise" or any(getattr(operand, "exact", False) for operand in operands)
+    ufunc = getattr(np, _UFUNCS[operation_name])
+
+    if len(operands) == 1:
+        vector = operands[0]
+        if not is_vector(vector) or not len(vector):
+            raise TypeError("⚠️ A reduction needs one non-empty vector.")
+        array = _to_array(np, vector, precise)
+        if operation_name == "divide" and (array[1:] == 0).any():
+            raise ZeroDivisionError("❌ Division by zero is not allowed.")
+        return _to_decimal(ufunc.reduce(array))
+
+    if len(operands) != 2:
+        raise TypeError(f"⚠️ '{operation_name}' takes two operands or one vector, got {len(operands)}.")
+
+    left, right = (_to_array(np, operand, precise) for operand in operands)
+    try:
+        np.broadcast_shapes(np.shape(left), np.shape(right))
+    except ValueError:
+        raise ValueError(f"⚠️ Vector lengths differ: {len(operands[0])} and {len(operands[1])}.") from None
+    if operation_name == "divide" and (np.asarray(right) == 0).any():
+        raise ZeroDivisionError("❌ Division by zero is not allowed.")
+
+    result = ufunc(left, right)
+    if np.ndim(result) == 0:
+        return _to_decimal(result.item() if hasattr(result, "item") else result)
+    return Vector(_to_decimal(value) for value in result.tolist())
+
+
+def vectorizable(operation_name):
+    """Decorates an arithmetic ``execute`` so vector operands take the vectorized path."""
+    def decorate(scalar_execute):
+        @functools.wraps(scalar_execute)
+        def execute_any(*operands):
+            if any(is_vector(operand) for operand in operands):
+                return execute(operation_name, *operands)
+            return scalar_execute(*operands)
+        return execute_any
+    return decorate
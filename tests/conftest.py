@@ -9,6 +9,15 @@ def setup_and_teardown():
     yield
     History.clear_history()
 
+@pytest.fixture(scope="function")
+def isolated_history(monkeypatch, tmp_path):
+    """Points History at a fresh CSV file inside a temporary directory."""
+    history_file = tmp_path / "history.csv"
+    monkeypatch.setattr(History, "_history_file", str(history_file))
+    monkeypatch.setattr(History, "_loaded", False)
+    yield history_file
+    History._loaded = False  # pylint: disable=protected-access
+
 @pytest.fixture(scope="function")
 def monkeypatch_input(monkeypatch):
     """Helper to patch input for user input prompts."""
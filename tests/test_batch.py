@@ -0,0 +1,98 @@
+"""
+Unit tests for the non-interactive batch mode.
+"""
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.batch import BatchRunner, run_batch
+from history.history import History
+from main import main
+
+COMMANDS = ["add 2 3", "", "# a comment", "divide 1 0", "mean 10 20 30", "unknown_op 1 2"]
+
+
+def test_batch_csv_output(isolated_history):
+    """Ensure each command yields one CSV record with its result or error."""
+    output = io.StringIO()
+    runner = BatchRunner(output, "csv", record_history=False)
+    assert runner.run(COMMANDS) == 4
+
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "line,command,result,error"
+    assert lines[1] == "1,add 2 3,5.00,"
+    assert lines[2] == "4,divide 1 0,,❌ Division by zero is not allowed."
+    assert lines[3] == "5,mean 10 20 30,20.00,"
+    assert "Unknown operation" in lines[4]
+    assert runner.errors == 2
+
+
+def test_batch_jsonl_output():
+    """Ensure JSON Lines output carries null results for failed commands."""
+    output = io.StringIO()
+    BatchRunner(output, "jsonl", record_history=False).run(["multiply 3 3", "add x y"])
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[0] == {"line": 1, "command": "multiply 3 3", "result": "9.00", "error": None}
+    assert records[1]["result"] is None and "Invalid number format" in records[1]["error"]
+
+
+def test_batch_records_history_in_bulk(isolated_history):
+    """Ensure successful results are persisted with one bulk write per flush."""
+    with patch.object(History, "add_entries", wraps=History.add_entries) as mock_add_entries:
+        BatchRunner(io.StringIO(), history_flush_size=2).run(["add 1 1", "add 2 2", "add 3 3", "divide 1 0"])
+
+    assert mock_add_entries.call_count == 2, "Two entries per flush plus the final partial flush."
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [1, 2, 3]
+    assert list(history_df["Result"]) == [2.0, 4.0, 6.0]
+
+
+def test_batch_rejects_unknown_format():
+    """Ensure an unsupported output format is rejected."""
+    with pytest.raises(ValueError, match="Unknown output format"):
+        BatchRunner(io.StringIO(), "xml")
+
+
+def test_run_batch_from_file(tmp_path, capsys):
+    """Ensure run_batch streams a file to an output file and reports throughput."""
+    source = tmp_path / "commands.txt"
+    source.write_text("add 1 2\nsubtract 5 3\n", encoding="utf-8")
+    destination = tmp_path / "results.jsonl"
+
+    runner = run_batch(str(source), str(destination), "jsonl", record_history=False)
+
+    assert runner.processed == 2
+    assert len(destination.read_text(encoding="utf-8").splitlines()) == 2
+    assert "lines/s" in capsys.readouterr().err
+
+
+def test_main_batch_flag(tmp_path):
+    """Ensure `--batch` runs the batch instead of starting the REPL."""
+    with patch("app.batch.run_batch") as mock_run_batch:
+        main(["--batch", "commands.txt", "--format", "jsonl", "--no-history"])
+    mock_run_batch.assert_called_once_with("commands.txt", None, "jsonl", record_history=False)
+
+
+def test_main_batch_reports_unreadable_files(tmp_path, capsys):
+    """Ensure a missing input or output path prints one error line and exits non-zero."""
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--batch", str(tmp_path / "missing.txt"), "--no-history"])
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().err.startswith("❌ Batch failed:")
+
+    source = tmp_path / "commands.txt"
+    source.write_text("add 1 2\n", encoding="utf-8")
+    opened = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        opened.append(handle)
+        return handle
+
+    with patch("builtins.open", side_effect=tracking_open), pytest.raises(SystemExit):
+        main(["--batch", str(source), "--output", str(tmp_path / "missing" / "out.csv"), "--no-history"])
+    assert opened and all(handle.closed for handle in opened), "The input file should be closed."
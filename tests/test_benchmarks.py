@@ -0,0 +1,54 @@
+"""
+Unit tests for the benchmark suite's runners, JSON report and baseline comparison.
+"""
+import json
+
+from benchmarks import suite
+from history.history import History
+
+
+def _report(**seconds):
+    """Builds a minimal report with the given per-benchmark seconds."""
+    return {"meta": {}, "benchmarks": {name: {"seconds": value} for name, value in seconds.items()}}
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    """Ensure benchmarks are compared by name and only large slowdowns are flagged."""
+    rows = suite.compare(_report(fast=1.0, slow=1.5, new=2.0), _report(fast=1.2, slow=1.0, gone=1.0))
+    assert sorted(rows) == [("fast", 1.2, 1.0, 1.0 / 1.2 - 1), ("slow", 1.0, 1.5, 0.5)]
+    assert suite.regressions(rows, threshold=0.25) == [("slow", 1.0, 1.5, 0.5)]
+    assert not suite.regressions(rows, threshold=0.6)
+
+
+def test_operation_and_history_benchmarks_run():
+    """Ensure the in-process groups produce timings and leave History's configuration untouched."""
+    history_file = History._history_file  # pylint: disable=protected-access
+    results = suite.bench_operations(operand_counts=(3,), repeat=1, number=1)
+    results.update(suite.bench_history(sizes=(20,), repeat=1))
+    assert {"operations.add[2]", "operations.mean[3]", "history.add_entry[20]", "history.reload[20]",
+            "history.remove_entry[20]"} <= set(results)
+    assert all(result["seconds"] > 0 for result in results.values())
+    assert History._history_file == history_file  # pylint: disable=protected-access
+
+
+def test_main_writes_json_and_fails_on_regression(monkeypatch, tmp_path, capsys):
+    """Ensure results are written as JSON, recorded as a baseline and compared on the next run."""
+    timings = iter([1.0, 2.0])
+    monkeypatch.setattr(suite, "run", lambda groups, quick, repeat: _report(**{"operations.add[2]": next(timings)}))
+    baseline, output = tmp_path / "baseline.json", tmp_path / "results.json"
+
+    assert suite.main(["--baseline", str(baseline), "--update-baseline"]) == 0
+    assert suite.main(["--baseline", str(baseline), "--output", str(output), "--threshold", "0.5"]) == 1
+    assert json.loads(output.read_text(encoding="utf-8"))["benchmarks"]["operations.add[2]"]["seconds"] == 2.0
+    assert "⚠️ regression" in capsys.readouterr().out
+
+
+def test_missing_baseline_is_reported(monkeypatch, tmp_path, capsys):
+    """Ensure a run without a baseline says that nothing was compared, and --quick uses the committed one."""
+    monkeypatch.setattr(suite, "run", lambda groups, quick, repeat: _report(**{"operations.add[2]": 1.0}))
+
+    assert suite.main(["--baseline", str(tmp_path / "missing.json")]) == 0
+    assert "Nothing was compared" in capsys.readouterr().out
+
+    with open(suite.QUICK_BASELINE_PATH, encoding="utf-8") as baseline:
+        assert json.load(baseline)["meta"]["quick"] is True
@@ -0,0 +1,147 @@
+"""
+Unit tests for the binary history store and its CSV converters.
+"""
+import os
+
+import pytest
+
+from history.binary_store import BinaryHistoryStore, binary_to_csv, csv_to_binary
+from history.csv_store import CSVHistoryStore
+from history.history import History
+from history.records import HistoryRecords
+
+ROWS = [
+    (1, "add", ["2", "3"], "5.00"),
+    (2, "mean", [1, 2.5, "4"], 2.5),
+    (3, "expr", ["(2 + 3) * " + "1 + " * 100 + "1"], "105.00"),
+]
+
+_ROWS_BY_OPERATION = [(entry_id, ("add", "divide", "mean")[entry_id % 3], [str(entry_id)], f"{entry_id}.00")
+                      for entry_id in range(1, 13)]
+
+
+
+@pytest.fixture
+def binary_history(monkeypatch, tmp_path):
+    """Points History at a fresh binary history file inside a temporary directory."""
+    monkeypatch.setattr(History, "_backend", "binary")
+    monkeypatch.setattr(History, "_history_file", str(tmp_path / "history.csv"))
+    monkeypatch.setattr(History, "_loaded", False)
+    yield tmp_path / "history.bin"
+    History._store = None  # pylint: disable=protected-access
+    History._loaded = False  # pylint: disable=protected-access
+
+
+def test_round_trip_keeps_operand_types(tmp_path):
+    """Ensure ints, floats, text and long values read back unchanged."""
+    store = BinaryHistoryStore(str(tmp_path / "history.bin"))
+    store.append(ROWS)
+    assert BinaryHistoryStore(store.path).load() == ROWS
+
+
+def test_find_and_tail_use_the_index(tmp_path):
+    """Ensure entries are read by ID and from the tail, skipping removed ones."""
+    store = BinaryHistoryStore(str(tmp_path / "history.bin"))
+    store.append(ROWS)
+    store.remove(3)
+
+    assert store.find(2) == ROWS[1]
+    assert store.find(3) is None and store.find(42) is None
+    assert store.tail(5) == ROWS[:2]
+
+    os.remove(store.index_path)  # ✅ A missing index is rebuilt from the records
+    assert store.find(3) is None and store.tail(1) == [ROWS[1]]
+
+
+def test_load_changes_reads_only_new_records(tmp_path):
+    """Ensure records appended by another writer are read incrementally."""
+    store = BinaryHistoryStore(str(tmp_path / "history.bin"))
+    store.append(ROWS[:1])
+    assert store.load() == ROWS[:1]
+
+    other = BinaryHistoryStore(store.path)
+    other.append(ROWS[1:2])
+    other.remove(1)
+    assert store.load_changes() == [ROWS[1], (1, "__removed__", [], "")]
+    assert store.load_changes() == []
+
+    other.rewrite(ROWS[2:])
+    assert store.load_changes() is None, "A rewritten file needs a full load."
+
+
+def test_csv_converters(tmp_path):
+    """Ensure CSV and binary histories convert both ways."""
+    csv_path, binary_path = str(tmp_path / "history.csv"), str(tmp_path / "history.bin")
+    CSVHistoryStore(csv_path).rewrite(ROWS[:2])
+
+    assert csv_to_binary(csv_path, binary_path) == 2
+    assert BinaryHistoryStore(binary_path).load() == CSVHistoryStore(csv_path).load()
+    assert binary_to_csv(binary_path, str(tmp_path / "copy.csv")) == 2
+    assert CSVHistoryStore(str(tmp_path / "copy.csv")).load() == CSVHistoryStore(csv_path).load()
+
+
+def test_history_binary_backend(binary_history):
+    """Ensure the History facade persists adds and removals through the binary backend."""
+    History.add_entry("add", ["2", "3"], "5.00")
+    History.add_entry("divide", ["8", "2"], "4.00")
+    History.remove_entry(1)
+
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [2]
+    assert history_df.iloc[0]["Result"] == "4.00"
+    assert binary_history.exists()
+
+
+def test_index_queries_match_the_in_memory_records(tmp_path):
+    """Ensure count, window and position read from the index agree with a full load."""
+    store = BinaryHistoryStore(str(tmp_path / "history.bin"))
+    rows = [(entry_id, ("add", "divide", "mean")[entry_id % 3], [str(entry_id)], f"{entry_id}.00")
+            for entry_id in range(1, 61)]
+    store.append(rows)
+    for entry_id in (1, 2, 9, 30, 31, 60):
+        store.remove(entry_id)
+    records = HistoryRecords.from_rows(store.load())
+
+    for operation in (None, "add", "divide", "missing"):
+        assert store.count(operation) == records.count(operation)
+        for offset in range(0, 60, 7):
+            assert store.window(offset, 5, operation) == records.window(offset, 5, operation)
+        for entry_id in (3, 9, 32, 59):
+            assert store.position(entry_id, operation) == records.position(entry_id, operation)
+    assert store.newest_id() == 59
+
+
+def test_history_queries_do_not_load_the_binary_file(binary_history, monkeypatch):
+    """Ensure History pages, finds and numbers entries from the index instead of decoding every record."""
+    History.add_entries([("add", ["1", "1"], "2.00"), ("divide", ["8", "2"], "4.00"), ("add", ["2", "2"], "4.00")])
+    History.reload()
+
+    def fail_load(self):
+        raise AssertionError("The binary history should not be loaded whole.")
+
+    monkeypatch.setattr(BinaryHistoryStore, "load", fail_load)
+    History.remove_entry(3)
+    History.add_entry("mean", ["1", "3"], "2.00")
+
+    assert History.count() == 3 and History.count("add") == 1
+    assert History.entries(1, 5) == [(2, "divide", ["8", "2"], "4.00"), (3, "mean", ["1", "3"], "2.00")]
+    assert History.find(3) == (3, "mean", ["1", "3"], "2.00") and History.find(4) is None
+    assert History.position(3) == 2 and History.position(2, "divide") == 0
+    assert binary_history.exists()
+
+
+def test_filtered_counts_after_the_file_is_rewritten(tmp_path):
+    """Ensure cached slots are dropped when the file is replaced, even when its inode is reused."""
+    store = BinaryHistoryStore(str(tmp_path / "history.bin"))
+    store.append(_ROWS_BY_OPERATION)
+    assert store.count("add") == 4 and store.count() == 12
+
+    for rewriter in (store, BinaryHistoryStore(store.path)):  # ✅ This store, then another process
+        inode = os.stat(store.path).st_ino
+        for _ in range(10):  # Replacing the file a few times hands its first inode back on most filesystems
+            rewriter.rewrite(_ROWS_BY_OPERATION[:3])
+            if os.stat(store.path).st_ino == inode:
+                break
+        rewriter.append(_ROWS_BY_OPERATION[3:5])
+        assert store.count("add") == 1 and store.count("divide") == 2 and store.count() == 5
+        assert store.window(0, 5, "divide") == [row for row in _ROWS_BY_OPERATION[:5] if row[1] == "divide"]
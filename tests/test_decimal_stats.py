@@ -0,0 +1,72 @@
+"""
+Unit tests for the exact Decimal statistics kernel.
+"""
+import random
+import statistics
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from operations import decimal_stats
+from operations.statistics import Mean, Median, StandardDeviation, Variance
+
+
+def _random_samples(count=300, seed=7):
+    """Yields Decimal lists with mixed scales, magnitudes and duplicates."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        size = rng.randint(2, 40)
+        values = [
+            Decimal(rng.randint(-10 ** rng.randint(1, 25), 10 ** rng.randint(1, 25))).scaleb(-rng.randint(0, 12))
+            for _ in range(size)
+        ]
+        if rng.random() < 0.3:
+            values = [rng.choice(values[:3]) for _ in values]
+        yield values
+
+
+@pytest.mark.parametrize("name", ["mean", "median", "variance", "stdev"])
+def test_matches_stdlib_exactly(name):
+    """Ensure every kernel function returns exactly what the stdlib returns."""
+    for values in _random_samples():
+        expected = getattr(statistics, name)(values)
+        result = getattr(decimal_stats, name)(values)
+        assert str(result) == str(expected), values
+
+
+def test_select_returns_neighbouring_order_statistics():
+    """Ensure quickselect finds the k-th and (k+1)-th smallest values."""
+    values = [Decimal(value) for value in [5, 1, 4, 1, 3, 9, 2, 6]]
+    ordered = sorted(values)
+    for k in range(len(values)):
+        following = ordered[k + 1] if k + 1 < len(values) else None
+        assert decimal_stats.select(values, k) == (ordered[k], following)
+
+
+def test_non_finite_values_fall_back_to_stdlib():
+    """Ensure NaN and Infinity keep the stdlib's special-value results."""
+    assert decimal_stats.mean([Decimal(1), Decimal("Infinity")]) == Decimal("Infinity")
+    with pytest.raises(InvalidOperation):
+        decimal_stats.variance([Decimal("Infinity"), Decimal("-Infinity")])
+    assert decimal_stats.median([Decimal(1), Decimal("Infinity"), Decimal(2)]) == Decimal(2)
+
+
+@pytest.mark.parametrize("function", [
+    decimal_stats.mean, decimal_stats.median, decimal_stats.variance, decimal_stats.stdev,
+])
+def test_empty_data_raises(function):
+    """Ensure empty input raises StatisticsError like the stdlib."""
+    with pytest.raises(statistics.StatisticsError):
+        function([])
+
+
+def test_operations_use_kernel_results():
+    """Ensure the operations keep their quantized outputs and single-value behaviour."""
+    numbers = [Decimal(value) for value in ["1.5", "2.25", "7", "-3.125"]]
+    assert Mean.execute(*numbers) == Decimal("1.91")
+    assert Median.execute(*numbers) == Decimal("1.88")
+    assert StandardDeviation.execute(*numbers) == Decimal("4.14")
+    assert Variance.execute(*numbers) == Decimal("17.18")
+    assert Variance.execute(5) == Decimal(0)
+    with pytest.raises(statistics.StatisticsError):
+        StandardDeviation.execute(5)
@@ -0,0 +1,135 @@
+"""
+Unit tests for the decimal, float and fixed-point numeric engines.
+"""
+from decimal import Decimal
+from statistics import StatisticsError
+from unittest.mock import patch
+
+import pytest
+
+from app.evaluator import evaluate, evaluate_command, evaluate_many, parse_command
+from app.expressions import evaluate_expression
+from main import CalculatorREPL
+from mappings import engines
+from mappings.engines import ENGINES, FixedPointEngine, NativeEngine, NumericEngine, get_engine, set_engine
+from operations.vectorized import Vector
+
+
+@pytest.fixture
+def session_engine():
+    """Restores the session's engine after a test switches it."""
+    original = get_engine()
+    yield
+    set_engine(original)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("command, expected", [
+    ("add 0.1 0.2", "0.30"),
+    ("subtract 2.50 7.25", "-4.75"),
+    ("multiply 1.25 3.5", "4.38"),
+    ("divide 1 3", "0.33"),
+    ("mean 1 2 4", "2.33"),
+    ("median 4 1 3 2", "2.50"),
+    ("variance 1 2 3 4", "1.67"),
+    ("std_dev 2 4 4 4 5 5 7 9", "2.14"),
+    ("(2 + 3) * mean(4, 5, 6) / 7", "3.57"),
+])
+def test_engines_agree_on_two_decimal_input(engine, command, expected):
+    """Ensure every engine gives today's results for everyday input."""
+    assert evaluate_command(command, engine).result == Decimal(expected)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_engines_report_errors_like_decimal(engine):
+    """Ensure division by zero and too few values raise the same exceptions."""
+    assert isinstance(evaluate_command("divide 1 0", engine).error, ZeroDivisionError)
+    with pytest.raises(StatisticsError):
+        get_engine(engine).apply("std_dev", [get_engine(engine).convert(Decimal(1))])
+
+
+def test_float_engine_uses_compensated_summation():
+    """Ensure fsum keeps the small term that naive float summation loses."""
+    assert evaluate("mean", [Decimal("1e16"), Decimal(1), Decimal("-1e16")], "float") == Decimal("0.33")
+    with pytest.raises(OverflowError, match="outside the float engine's range"):
+        evaluate("multiply", [Decimal("1e308"), Decimal(10)], "float")
+
+
+def test_fixed_engine_rounds_operands_on_entry():
+    """Ensure operands are rounded half-up to the scale before the operation."""
+    assert evaluate("add", [Decimal("1.005"), Decimal("1.005")], "decimal") == Decimal("2.01")
+    assert evaluate("add", [Decimal("1.005"), Decimal("1.005")], "fixed") == Decimal("2.02")
+    assert evaluate("multiply", [Decimal("-1.5"), Decimal("0.01")], "fixed") == Decimal("-0.02")
+
+
+def test_fixed_engine_scale_is_configurable():
+    """Ensure results carry exactly the configured number of decimals."""
+    engine = FixedPointEngine(decimals=4)
+    assert str(engine.evaluate("divide", [Decimal(1), Decimal(3)])) == "0.3333"
+    assert str(engine.evaluate("std_dev", [Decimal(1), Decimal(2), Decimal(3), Decimal(4)])) == "1.2910"
+    assert [engine.from_text(text) for text in ("2.5", "-.00005", "1e2", " 7 ")] == [25000, -1, 1000000, 70000]
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_engines_read_operand_files(tmp_path, engine):
+    """Ensure statistics over files parse cells with each engine and match the decimal engine."""
+    path = tmp_path / "values.csv"
+    path.write_text("value\n" + "\n".join(f"{i * 1.25:.2f}" for i in range(1, 201)) + "\n", encoding="utf-8")
+    for operation in ("mean", "median", "variance", "std_dev"):
+        operation_name, numbers = parse_command(f"{operation} @{path}")
+        assert evaluate(operation_name, numbers, engine) == evaluate(operation_name, numbers, "decimal")
+
+
+@pytest.mark.parametrize("engine", ["float", "fixed"])
+def test_statistics_fold_operand_files_chunk_by_chunk(tmp_path, engine):
+    """Ensure running aggregates over many small chunks match the decimal engine."""
+    path = tmp_path / "values.csv"
+    path.write_text("\n".join(f"{(i * 7919) % 1000 - 500.25:.2f}" for i in range(1, 1001)) + "\n", encoding="utf-8")
+    for operation in ("mean", "variance", "std_dev"):
+        operation_name, numbers = parse_command(f"{operation} @{path}")
+        numbers[0].chunk_size = 7
+        chunks = list(get_engine(engine).chunks(numbers))
+        assert len(chunks) == 143 and max(map(len, chunks)) == 7
+        assert evaluate(operation_name, numbers, engine) == evaluate(operation_name, numbers, "decimal")
+
+
+def test_engine_base_classes_are_abstract():
+    """Ensure engines must implement every conversion and operation hook."""
+    with pytest.raises(TypeError):
+        NumericEngine()  # pylint: disable=abstract-class-instantiated
+    with pytest.raises(TypeError):
+        NativeEngine()  # pylint: disable=abstract-class-instantiated
+
+
+def test_unsupported_operations_fall_back_to_decimal():
+    """Ensure vector arithmetic keeps working on the fast engines."""
+    assert evaluate("add", [Vector([1, 2]), Decimal("0.5")], "fixed") == Vector([Decimal("1.50"), Decimal("2.50")])
+    assert evaluate_expression("add(1, 2) * 2", "float") == Decimal("6.00")
+
+
+def test_session_engine_and_unknown_names(session_engine):
+    """Ensure the session engine applies by default and unknown names are rejected."""
+    set_engine("fixed")
+    assert evaluate("add", [Decimal("1.005"), Decimal(1)]) == Decimal("2.01")
+    assert [evaluation.result for evaluation in evaluate_many(["add 1.005 1"], workers=1)] == [Decimal("2.01")]
+    with pytest.raises(ValueError, match="Unknown numeric engine 'quad'"):
+        set_engine("quad")
+
+
+def test_unknown_configured_engine_falls_back_to_decimal(session_engine):
+    """Ensure a bad NUMERIC_ENGINE is logged and replaced by decimal instead of failing the import."""
+    set_engine("float")
+    with patch.object(engines, "logger") as mock_logger:
+        assert engines._set_default_engine("quad") is ENGINES["decimal"]  # pylint: disable=protected-access
+    assert get_engine() is ENGINES["decimal"]
+    assert "Unknown numeric engine 'quad'" in mock_logger.warning.call_args.args[0]
+
+
+@patch("builtins.print")
+def test_repl_engine_command(mock_print, session_engine):
+    """Ensure 'engine <name>' switches the session and bad names are reported."""
+    CalculatorREPL.select_engine("float")
+    assert get_engine().name == "float"
+    mock_print.assert_called_with("🔢 Numeric engine: float (available: decimal, float, fixed).")
+    CalculatorREPL.select_engine("quad")
+    assert get_engine().name == "float"
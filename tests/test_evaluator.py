@@ -0,0 +1,60 @@
+"""
+Unit tests for the shared command evaluator and the parallel batch API.
+"""
+from decimal import Decimal
+
+import pytest
+
+import app.evaluator as evaluator
+from app.evaluator import CommandError, auto_chunk_size, describe_error, evaluate_command, evaluate_many, parse_command
+from history.history import History
+
+COMMANDS = ["add 2 3", "divide 1 0", "variance 2 4 6 8", "nope 1 2", "multiply 1.5 2"]
+
+
+def test_parse_command():
+    """Ensure commands are split into an operation name and Decimal operands."""
+    assert parse_command("add 2 3.5") == ("add", [Decimal("2"), Decimal("3.5")])
+    with pytest.raises(CommandError, match="Unknown operation"):
+        parse_command("nope 1 2")
+    with pytest.raises(CommandError, match="Invalid number format"):
+        parse_command("add 1")
+
+
+def test_evaluate_command_captures_errors():
+    """Ensure evaluation errors are returned rather than raised."""
+    evaluation = evaluate_command("divide 1 0")
+    assert evaluation.result is None
+    assert isinstance(evaluation.error, ZeroDivisionError)
+    assert describe_error(evaluation.error) == "❌ Division by zero is not allowed."
+    assert evaluate_command("add 2 3").result == Decimal("5.00")
+
+
+def test_auto_chunk_size():
+    """Ensure chunks give every worker several pieces of work and stay bounded."""
+    assert auto_chunk_size(1000, 4) == 63
+    assert auto_chunk_size(10, 4) == 1
+    assert auto_chunk_size(10_000_000, 2) == evaluator.MAX_CHUNK_SIZE
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_evaluate_many_preserves_order_and_errors(monkeypatch, workers):
+    """Ensure results keep input order and per-item errors both in-process and across workers."""
+    monkeypatch.setattr(evaluator, "PARALLEL_MIN_BATCH", 2)
+    results = evaluate_many(COMMANDS * 3, workers=workers, chunk_size=2)
+
+    assert [evaluation.command for evaluation in results] == COMMANDS * 3
+    assert [evaluation.result for evaluation in results[:5]] == [
+        Decimal("5.00"), None, Decimal("6.67"), None, Decimal("3.00")]
+    assert isinstance(results[1].error, ZeroDivisionError)
+    assert isinstance(results[3].error, CommandError)
+
+
+def test_evaluate_many_records_history_in_input_order(monkeypatch, isolated_history):
+    """Ensure history IDs follow input order regardless of worker scheduling."""
+    monkeypatch.setattr(evaluator, "PARALLEL_MIN_BATCH", 2)
+    evaluate_many(COMMANDS, workers=2, chunk_size=1, record_history=True)
+
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [1, 2, 3]
+    assert list(history_df["Operation"]) == ["add", "variance", "multiply"]
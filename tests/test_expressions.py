@@ -0,0 +1,120 @@
+"""
+Unit tests for infix expression parsing, compilation and evaluation.
+"""
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from app.evaluator import evaluate_command, is_expression
+from app.expressions import Call, ExpressionError, Number, compile_expression, evaluate_expression, parse_expression
+from history.history import History
+from main import CalculatorREPL
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("(2 + 3) * mean(4,5,6) / 7", "3.57"),
+    ("2 + 3 * 4", "14.00"),
+    ("(2 + 3) * 4", "20.00"),
+    ("10 - 4 - 3", "3.00"),
+    ("-2 * -(3 + 1)", "8.00"),
+    ("1 / 3 * 3", "1.00"),
+    ("variance(2, 4, 6, 8) + median(1, 9, 5)", "11.67"),
+    ("ADD(1.5, 2.25)", "3.75"),
+])
+def test_evaluate_expression(source, expected):
+    """Ensure precedence, associativity, unary minus and calls evaluate correctly."""
+    assert evaluate_expression(source) == Decimal(expected)
+
+
+def test_parse_builds_ast():
+    """Ensure operators map onto the registered operations."""
+    assert parse_expression("1 + 2 * 3") == Call("add", (
+        Number(Decimal(1)), Call("multiply", (Number(Decimal(2)), Number(Decimal(3))))))
+
+
+def test_common_subexpressions_compile_once():
+    """Ensure repeated subtrees and constants share one slot."""
+    plan = compile_expression("(2 + 3) * (2 + 3) + mean(2, 3)")
+    assert plan.constants == (Decimal(2), Decimal(3))
+    assert [operation for operation, _ in plan.steps] == ["add", "multiply", "mean", "add"]
+    assert plan.evaluate() == Decimal("27.50")
+
+
+def test_plans_are_cached_by_source():
+    """Ensure the same source text reuses the compiled plan."""
+    assert compile_expression("4 * (1 + 1)") is compile_expression("4 * (1 + 1)")
+
+
+def test_only_final_result_is_rounded():
+    """Ensure intermediate quotients keep full precision."""
+    assert evaluate_expression("(1 / 3) * 3000") == Decimal("1000.00")
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("std_dev(1, 2) * 100", "70.71"),
+    ("mean(1, 2, 2) * 3", "5.00"),
+    ("variance(1, 2, 4) * 3", "7.00"),
+    ("median(1, 2) * 3", "4.50"),
+])
+def test_statistic_steps_are_not_rounded(source, expected):
+    """Ensure statistics inside a formula keep full precision until the final result."""
+    assert evaluate_expression(source) == Decimal(expected)
+    assert evaluate_expression(source, engine="float") == Decimal(expected)
+
+
+@pytest.mark.parametrize("source, message", [
+    ("2 +", "end of input"),
+    ("(1 + 2", r"expected '\)'"),
+    ("2 $ 3", "position 3"),
+    ("foo(1)", "Unknown operation: 'foo'"),
+    ("add(1)", "expects exactly 2 arguments"),
+    ("mean()", "at least one argument"),
+])
+def test_syntax_errors(source, message):
+    """Ensure malformed expressions raise ExpressionError with a useful message."""
+    with pytest.raises(ExpressionError, match=message):
+        compile_expression(source)
+
+
+def test_is_expression_heuristic():
+    """Ensure prefix commands keep working and formulas are recognised."""
+    assert is_expression("(2 + 3) * 4")
+    assert is_expression("mean(1,2) / 2")
+    assert not is_expression("add -2 3")
+    assert not is_expression("mean 1 2 3")
+
+
+def test_evaluate_command_handles_expressions():
+    """Ensure batch evaluation records expressions under the 'expr' operation."""
+    evaluation = evaluate_command("2 * (3 + 4)")
+    assert (evaluation.operation, evaluation.operands, evaluation.result) == ("expr", ["2 * (3 + 4)"], Decimal("14.00"))
+    assert isinstance(evaluate_command("1 / 0").error, ZeroDivisionError)
+
+
+@patch("builtins.print")
+def test_repl_evaluates_expression_and_records_history(mock_print):
+    """Ensure the REPL prints and records one history entry per formula."""
+    with patch.object(History, "add_entry") as mock_add_entry:
+        CalculatorREPL.process_calculation("(2 + 3) * mean(4,5,6) / 7")
+    mock_print.assert_any_call("✅ Result: 3.57")
+    mock_add_entry.assert_called_once_with("expr", ["(2 + 3) * mean(4,5,6) / 7"], "3.57")
+
+
+@pytest.mark.parametrize("source", [
+    "(" * 3000 + "1" + ")" * 3000,
+    "-" * 3000 + "1",
+    "mean(" * 3000 + "1" + ")" * 3000,
+])
+def test_deep_nesting_is_a_syntax_error(source):
+    """Ensure deeply nested input is rejected instead of exhausting the recursion limit."""
+    with pytest.raises(ExpressionError, match="nested more than"):
+        compile_expression(source)
+    assert evaluate_expression("(" * 50 + "1 + 1" + ")" * 50) == Decimal("2.00")
+
+
+@patch("builtins.print")
+def test_repl_reports_deeply_nested_input(mock_print):
+    """Ensure the REPL reports deeply nested input and keeps running."""
+    CalculatorREPL.process_calculation("(" * 3000 + "1" + ")" * 3000)
+    assert any("nested more than" in str(call.args[0]) for call in mock_print.call_args_list)
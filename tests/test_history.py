@@ -3,7 +3,7 @@ Unit tests for the History module.
 Tests cover adding, removing, clearing, and retrieving calculation history.
 """
 import pytest
-from history.history import History
+from history.history import History, TOMBSTONE
 
 
 def test_add_entry():
@@ -62,3 +62,129 @@ def test_reload_history():
 
     except TypeError as e:
         pytest.fail(f"Unexpected error occurred: {e}")
+
+
+def test_journal_appends_without_rewriting(isolated_history):
+    """Ensure journal mode appends one row per entry instead of rewriting the file."""
+    History.add_entry("add", [1, 2], 3)
+    first_write = isolated_history.read_text(encoding="utf-8")
+    History.add_entry("add", [2, 2], 4)
+
+    content = isolated_history.read_text(encoding="utf-8")
+    assert content.startswith(first_write), "Existing rows should be left untouched."
+    assert content.count("\n") == 3, "Header plus one row per entry expected."
+    assert b"\r" not in isolated_history.read_bytes(), "Rows should end with a bare newline."
+
+
+def test_journal_remove_writes_tombstone(isolated_history):
+    """Ensure removals are journaled as tombstones and hidden on reload."""
+    History.add_entry("add", [1, 2], 3)
+    History.add_entry("multiply", [2, 3], 6)
+    History.remove_entry(1)
+
+    assert TOMBSTONE in isolated_history.read_text(encoding="utf-8")
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [2], "Tombstoned entry should not be reloaded."
+
+
+def test_journal_reused_id_survives_earlier_tombstone(isolated_history):
+    """Ensure a tombstone only cancels rows written before it."""
+    History.add_entry("add", [1, 2], 3)
+    History.remove_entry(1)
+    History.add_entry("subtract", [5, 1], 4)
+
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [1]
+    assert history_df.iloc[0]["Operation"] == "subtract"
+
+
+def test_journal_compaction(isolated_history, monkeypatch):
+    """Ensure the journal is rewritten once the garbage threshold is reached."""
+    monkeypatch.setattr(History._get_store(), "compact_min_garbage", 4)  # pylint: disable=protected-access
+    for value in range(4):
+        History.add_entry("add", [value, 1], value + 1)
+    History.remove_entry(1)
+    assert TOMBSTONE in isolated_history.read_text(encoding="utf-8")
+
+    History.remove_entry(2)  # ✅ Four dead rows against two live ones triggers compaction
+    assert TOMBSTONE not in isolated_history.read_text(encoding="utf-8")
+    assert list(History.get_history()["ID"]) == [3, 4]
+    assert b"\r" not in isolated_history.read_bytes(), "Compaction should keep bare newlines."
+
+
+def test_clear_history_truncates_journal(isolated_history):
+    """Ensure clearing truncates the journal down to its header."""
+    History.add_entry("add", [1, 2], 3)
+    History.clear_history()
+    assert isolated_history.read_text(encoding="utf-8").strip() == "ID,Operation,Operands,Result"
+
+
+def test_reload_reads_only_appended_rows(isolated_history, monkeypatch):
+    """Ensure reload applies rows and tombstones appended by another writer without a full load."""
+    History.add_entry("add", [1, 2], 3)
+    History.add_entry("add", [2, 2], 4)
+    with open(isolated_history, "a", newline="", encoding="utf-8") as journal:
+        journal.write(f"3,mean,\"['1', '3']\",2\r\n1,{TOMBSTONE},,\r\n")
+
+    store = History._get_store()  # pylint: disable=protected-access
+    monkeypatch.setattr(store, "load", lambda: pytest.fail("A full load should not be needed."))
+    History.reload()
+    assert [row[0] for row in History.entries(0, 10)] == [2, 3]
+    assert History.find(3) == (3, "mean", ["1", "3"], 2)
+    assert store.load_changes() == [], "Nothing new should be read twice."
+
+
+def test_reload_falls_back_when_rewritten(isolated_history):
+    """Ensure a file rewritten or replaced behind the store's back is fully reloaded."""
+    History.add_entry("add", [1, 2], 3)
+    History.add_entry("add", [2, 2], 4)
+    isolated_history.write_text("ID,Operation,Operands,Result\n7,multiply,\"[2, 3]\",6\n8,add,\"[1, 1]\",2\n"
+                                "9,add,\"[4, 4]\",8\n", encoding="utf-8")
+
+    History.reload()
+    assert [row[0] for row in History.entries(0, 10)] == [7, 8, 9]
+    assert History._records.next_id == 10  # pylint: disable=protected-access
+
+
+@pytest.fixture
+def sqlite_history(monkeypatch, tmp_path):
+    """Points History at a fresh SQLite database inside a temporary directory."""
+    monkeypatch.setattr(History, "_backend", "sqlite")
+    monkeypatch.setattr(History, "_database_url", f"sqlite:///{tmp_path / 'calculator.db'}")
+    yield
+    History._get_store().close()  # pylint: disable=protected-access
+    History._store = None  # pylint: disable=protected-access
+
+
+def test_sqlite_backend_round_trip(sqlite_history):
+    """Ensure the SQLite backend persists adds and removals by ID."""
+    History.add_entry("add", [2, 3], 5)
+    History.add_entry("divide", ["8", "2"], "4.00")
+    History.remove_entry(1)
+
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [2]
+    assert history_df.iloc[0]["Operands"] == ["8", "2"]
+    assert history_df.iloc[0]["Result"] == "4.00"
+
+
+def test_sqlite_backend_clear(sqlite_history):
+    """Ensure clearing the SQLite backend removes every row."""
+    History.add_entry("multiply", [2, 5], 10)
+    History.clear_history()
+    assert History.get_history().empty
+
+
+def test_sqlite_backend_uses_wal(sqlite_history):
+    """Ensure the SQLite backend runs in WAL journaling mode."""
+    store = History._get_store()  # pylint: disable=protected-access
+    assert store._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"  # pylint: disable=protected-access
+
+
+def test_unknown_backend_rejected(monkeypatch):
+    """Ensure an unknown backend name raises a ValueError."""
+    monkeypatch.setattr(History, "_backend", "parquet")
+    with pytest.raises(ValueError, match="Unknown history backend"):
+        History.get_history()
+    monkeypatch.undo()
+    History._store = None  # pylint: disable=protected-access
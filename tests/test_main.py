@@ -3,8 +3,7 @@ Unit tests for the main interactive calculator (REPL).
 """
 
 from decimal import Decimal, ROUND_HALF_UP
-from unittest.mock import patch
-import pandas as pd
+from unittest.mock import MagicMock, patch
 import pytest
 from app.menu import Menu
 from history.history import History
@@ -64,6 +63,19 @@ def test_repl_exit(mock_exit, mock_input, mock_print):
     mock_print.assert_any_call("👋 Exiting calculator.")
     mock_exit.assert_called_once()
 
+
+@patch("builtins.print")
+@patch("builtins.input", side_effect=["exit"])
+@patch("sys.exit", autospec=True)
+@patch("main.History.close_writer", side_effect=OSError("disk full"))
+def test_repl_exit_reports_unsaved_history(mock_close, mock_exit, mock_input, mock_print):
+    """Ensure a history write failure on exit is reported and gives a non-zero exit status."""
+    CalculatorREPL.start()
+
+    mock_close.assert_called_once()
+    mock_print.assert_any_call("❌ History could not be saved: disk full")
+    mock_exit.assert_called_once_with(1)
+
 @patch("builtins.print")
 def test_repl_welcome_message(mock_print):
     """Ensure REPL displays the welcome message."""
@@ -96,19 +108,12 @@ def test_repl_instructions(mock_exit, mock_input, mock_print):
     mock_exit.assert_called_once()
 
 @patch("builtins.print")
-@patch("builtins.input", side_effect=["1", "5"])  # Simulate user input
+@patch("builtins.input", side_effect=[""])  # Leave the history pager
 @patch("sys.exit", autospec=True)  # Prevent the test from exiting
 def test_menu_handle_choice(mock_exit, mock_input, mock_print):
     """Ensure menu handles user choices correctly."""
 
-    # ✅ **Mock history with a DataFrame (not a list)**
-    mock_history_df = pd.DataFrame({
-        "Operation": ["add"],
-        "Operands": [[2, 3]],
-        "Result": [5]
-    })
-
-    with patch.object(History, "get_history", return_value=mock_history_df):
+    with patch.multiple(History, count=MagicMock(return_value=1), entries=MagicMock(return_value=[(1, "add", [2, 3], 5)])):
         Menu.handle_choice("1")  # Show history
         Menu.handle_choice("5")  # Exit program
 
@@ -143,3 +148,20 @@ def test_repl_welcome_on_start(mock_exit, mock_input, mock_print):
     CalculatorREPL.start()
     mock_print.assert_any_call("\n✨ Welcome to the Interactive Calculator! ✨")
     mock_exit.assert_called_once_with(0)
+
+
+@patch("builtins.print")
+def test_process_calculation_wrong_arity(mock_print):
+    """Ensure binary operations reject extra operands using the manifest arity."""
+    CalculatorREPL.process_calculation("add 1 2 3")
+    mock_print.assert_any_call("⚠️ 'add' expects exactly 2 numbers.")
+
+
+@patch("builtins.print")
+@patch("builtins.input", side_effect=["history mean", "exit"])
+@patch("sys.exit", autospec=True, side_effect=SystemExit)
+def test_repl_history_command_filters_by_operation(mock_exit, mock_input, mock_print):
+    """Ensure 'history <operation>' opens the history view filtered to that operation."""
+    with patch.object(Menu, "view_history") as mock_view, pytest.raises(SystemExit):
+        CalculatorREPL.start()
+    mock_view.assert_called_once_with("mean")
@@ -0,0 +1,61 @@
+"""
+Unit tests for the cached plugin manifest and the lazy operation mapping.
+"""
+import json
+import subprocess
+import sys
+
+from app.startup import PROJECT_ROOT
+from mappings.manifest import build_manifest, load_manifest, read_manifest, write_manifest
+from mappings.operations_map import LazyOperationMapping, operation_mapping
+
+
+def test_build_manifest_describes_operations():
+    """Ensure the manifest records module, class and arity for each operation."""
+    manifest = build_manifest()
+    assert manifest["operations"]["add"] == {"module": "operations.addition", "class": "Add", "arity": 2}
+    assert manifest["operations"]["std_dev"]["arity"] is None, "Statistics accept any number of operands."
+    assert "addition.py" in manifest["sources"]
+
+
+def test_manifest_round_trip_and_staleness(tmp_path):
+    """Ensure a written manifest is read back until a source fingerprint changes."""
+    path = tmp_path / "manifest.json"
+    write_manifest(build_manifest(), str(path))
+    assert read_manifest(str(path)) is not None
+
+    stale = json.loads(path.read_text(encoding="utf-8"))
+    stale["sources"]["addition.py"][0] -= 1
+    path.write_text(json.dumps(stale), encoding="utf-8")
+    assert read_manifest(str(path)) is None, "A changed mtime should invalidate the manifest."
+
+    load_manifest(str(path))
+    assert read_manifest(str(path)) is not None, "Loading a stale manifest should rewrite it."
+
+
+def test_lazy_mapping_imports_on_first_use():
+    """Ensure looking up names does not import plugins until an operation is fetched."""
+    mapping = LazyOperationMapping({"add": {"module": "operations.addition", "class": "Add", "arity": 2}})
+    assert "add" in mapping and list(mapping) == ["add"]
+    assert not mapping.is_loaded("add")
+    assert mapping["add"](2, 3) == 5
+    assert mapping.is_loaded("add")
+    assert mapping.arity("add") == 2
+
+
+def test_lazy_mapping_copy_stays_lazy():
+    """Ensure copies and merges keep unresolved entries lazy."""
+    mapping = LazyOperationMapping({"mean": {"module": "operations.statistics", "class": "Mean", "arity": None}})
+    duplicate = mapping.copy()
+    duplicate.clear()
+    duplicate.update(mapping)
+    assert list(duplicate) == ["mean"] and not duplicate.is_loaded("mean")
+
+
+def test_startup_does_not_import_plugins():
+    """Ensure importing the calculator reads the manifest without importing any operation module."""
+    probe = "import sys, main; print(sorted(m for m in sys.modules if m.startswith('operations')))"
+    completed = subprocess.run([sys.executable, "-c", probe], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "[]"
+    assert sorted(operation_mapping) == ["add", "divide", "mean", "median", "multiply", "std_dev", "subtract", "variance"]
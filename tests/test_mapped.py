@@ -0,0 +1,72 @@
+"""
+Unit tests for memory-mapped binary operand files.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.evaluator import CommandError, evaluate, parse_command
+from operations.mapped import BinarySource, FloatMoments
+from operations.statistics import Mean, Median, StandardDeviation, Variance
+
+
+@pytest.fixture
+def values():
+    """Two-decimal-place values, as they would be typed."""
+    return [round(i * 0.37 - 40, 2) for i in range(1, 501)]
+
+
+@pytest.fixture
+def float_file(tmp_path, values):
+    """A raw float64 file."""
+    path = tmp_path / "values.f64"
+    np.asarray(values, dtype="<f8").tofile(path)
+    return str(path)
+
+
+def test_npy_and_raw_files_are_memory_mapped(tmp_path, float_file):
+    """Ensure .npy, .f64 and .i64 files open as read-only memory maps."""
+    npy_path = tmp_path / "values.npy"
+    np.save(npy_path, np.arange(10, dtype=np.int64))
+    int_path = tmp_path / "values.i64"
+    np.arange(10, dtype="<i8").tofile(int_path)
+
+    for path in (float_file, str(npy_path), str(int_path)):
+        array = BinarySource(path, "fast").array()
+        assert isinstance(array, np.memmap) and not array.flags.writeable
+    assert list(BinarySource(str(int_path), "exact")) == [Decimal(i) for i in range(10)]
+
+
+@pytest.mark.parametrize("operation", [Mean, Median, StandardDeviation, Variance])
+def test_fast_mode_matches_exact_after_rounding(float_file, values, operation):
+    """Ensure float64 statistics over the mapped buffer round to the exact results."""
+    expected = operation.execute(*[Decimal(str(value)) for value in values])
+    assert operation.execute(BinarySource(float_file, "fast")) == expected
+    assert operation.execute(BinarySource(float_file, "exact")) == expected
+
+
+def test_float_moments_merge_blocks(monkeypatch):
+    """Ensure block-wise Chan merging gives the same variance as one pass."""
+    monkeypatch.setattr("operations.mapped.BLOCK_SIZE", 7)
+    array = np.linspace(-3, 11, 100)
+    moments = FloatMoments.of_array(array)
+    assert moments.count == 100
+    assert float(moments.variance()) == pytest.approx(float(np.var(array, ddof=1)))
+    assert (moments.minimum, moments.maximum) == (-3.0, 11.0)
+
+
+def test_arithmetic_over_binary_files(tmp_path):
+    """Ensure arithmetic reduces or combines binary files like vectors."""
+    path = tmp_path / "small.i64"
+    np.array([1, 2, 3], dtype="<i8").tofile(path)
+
+    assert evaluate(*parse_command(f"add @{path}")) == Decimal("6.00")
+    assert str(evaluate(*parse_command(f"multiply @{path} 2"))) == "[2.00, 4.00, 6.00]"
+    assert str(evaluate(*parse_command(f"divide @{path}:exact 3"))) == "[0.33, 0.67, 1.00]"
+
+
+def test_unknown_mode_is_rejected(float_file):
+    """Ensure only the fast and exact modes are accepted."""
+    with pytest.raises(CommandError, match="Unknown binary operand mode"):
+        parse_command(f"mean @{float_file}:sloppy")
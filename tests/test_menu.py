@@ -9,12 +9,23 @@ These tests cover:
 - Exiting the program
 - Handling invalid menu selections
 """
-import pandas as pd
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from app.menu import Menu
 from history.history import History
 from mappings.operations_map import operation_mapping
 
+MOCK_ROWS = [(1, "add", [2, 3], 5)]
+
+
+def mock_history(rows):
+    """Patches the paged History API to serve the given rows."""
+    return patch.multiple(
+        History,
+        count=MagicMock(return_value=len(rows)),
+        entries=MagicMock(return_value=rows),
+        find=MagicMock(side_effect=lambda entry_id: next((row for row in rows if row[0] == entry_id), None)),
+    )
+
 
 @patch("builtins.print")
 def test_show_menu(mock_print):
@@ -37,20 +48,12 @@ def test_show_menu(mock_print):
         assert any(operation in call for call in print_calls), f"Operation '{operation}' missing from menu."
 
 @patch("builtins.print")
-@patch("builtins.input", side_effect=["1", "5"])  # Simulate user input
+@patch("builtins.input", side_effect=[""])  # Leave the history pager
 @patch("sys.exit", autospec=True)  # Prevent the test from exiting
 def test_handle_choice(mock_exit, mock_input, mock_print):
     """Ensure Menu handles user choices correctly."""
 
-    # ✅ **Mock history with a DataFrame (not a list)**
-    mock_history_df = pd.DataFrame({
-        "ID": [1],
-        "Operation": ["add"],
-        "Operands": ["[2, 3]"],
-        "Result": [5]
-    })
-
-    with patch.object(History, "get_history", return_value=mock_history_df):
+    with mock_history(MOCK_ROWS):
         Menu.handle_choice("1")  # Show history
         Menu.handle_choice("5")  # Exit program
 
@@ -67,21 +70,16 @@ def test_handle_choice(mock_exit, mock_input, mock_print):
 @patch("builtins.print")
 def test_view_history_empty(mock_print):
     """Ensure Menu.view_history() handles empty history."""
-    with patch.object(History, "get_history", return_value=pd.DataFrame()):
+    with mock_history([]):
         Menu.view_history()
     mock_print.assert_any_call("\n⚠️ No calculations found.")
 
 
 @patch("builtins.print")
-def test_view_history_with_data(mock_print):
+@patch("builtins.input", side_effect=[""])
+def test_view_history_with_data(mock_input, mock_print):
     """Ensure Menu.view_history() displays history when present."""
-    mock_history_df = pd.DataFrame({
-        "ID": [1],
-        "Operation": ["add"],
-        "Operands": ["[2, 3]"],
-        "Result": [5]
-    })
-    with patch.object(History, "get_history", return_value=mock_history_df):
+    with mock_history(MOCK_ROWS):
         Menu.view_history()
     mock_print.assert_any_call("\n📜 Calculation History:")
 
@@ -110,7 +108,7 @@ def test_clear_history_cancel(mock_input, mock_print):
 @patch("builtins.input", side_effect=["2"])
 def test_remove_nonexistent_entry(mock_input, mock_print):
     """Ensure Menu.remove_entry() handles missing entries correctly."""
-    with patch.object(History, "get_history", return_value=pd.DataFrame()):
+    with mock_history([]):
         Menu.remove_entry()
     mock_print.assert_any_call("\n⚠️ No history available to remove.")
 
@@ -119,13 +117,7 @@ def test_remove_nonexistent_entry(mock_input, mock_print):
 @patch("builtins.input", side_effect=["3"])
 def test_remove_entry_invalid(mock_input, mock_print):
     """Ensure Menu.remove_entry() handles invalid IDs correctly."""
-    mock_history_df = pd.DataFrame({
-        "ID": [1],
-        "Operation": ["add"],
-        "Operands": ["[2, 3]"],
-        "Result": [5]
-    })
-    with patch.object(History, "get_history", return_value=mock_history_df):
+    with mock_history(MOCK_ROWS):
         Menu.remove_entry()
     mock_print.assert_any_call("\n⚠️ Entry with ID 3 not found.")
 
@@ -134,13 +126,7 @@ def test_remove_entry_invalid(mock_input, mock_print):
 @patch("builtins.input", side_effect=["1"])
 def test_remove_entry_valid(mock_input, mock_print):
     """Ensure Menu.remove_entry() removes valid entry."""
-    mock_history_df = pd.DataFrame({
-        "ID": [1],
-        "Operation": ["add"],
-        "Operands": ["[2, 3]"],
-        "Result": [5]
-    })
-    with patch.object(History, "get_history", return_value=mock_history_df):
+    with mock_history(MOCK_ROWS):
         with patch.object(History, "remove_entry") as mock_remove:
             Menu.remove_entry()
             mock_remove.assert_called_once_with(1)
@@ -149,8 +135,8 @@ def test_remove_entry_valid(mock_input, mock_print):
 
 @patch("builtins.print")
 def test_reload_history(mock_print):
-    """Ensure Menu.reload_history() calls get_history()."""
-    with patch.object(History, "get_history") as mock_reload:
+    """Ensure Menu.reload_history() calls History.reload()."""
+    with patch.object(History, "reload") as mock_reload:
         Menu.reload_history()
         mock_reload.assert_called_once()
     mock_print.assert_any_call("\n🔄 History reloaded successfully.")
@@ -172,3 +158,32 @@ def test_invalid_choice(mock_print):
     """Ensure invalid menu selections are handled."""
     Menu.invalid_choice()
     mock_print.assert_any_call("\n❌ Invalid selection. Please try again.")
+
+
+@patch("builtins.print")
+@patch("builtins.input", side_effect=["p", "g 3", "f multiply", "n", ""])
+def test_browse_history_pages(mock_input, mock_print, isolated_history):
+    """Ensure the pager starts at the tail and supports paging, jumping and filtering."""
+    for value in range(1, 46):
+        History.add_entry("add" if value % 5 else "multiply", [value, 1], value + 1)
+
+    Menu.browse_history(page_size=20)
+
+    prompts = [call_arg.args[0] for call_arg in mock_input.call_args_list]
+    assert "Page 3/3 -" in prompts[0], "Pager should open on the last page."
+    assert "Page 2/3 -" in prompts[1]
+    assert "Page 1/3 -" in prompts[2], "Jumping to ID 3 should land on the first page."
+    assert "Page 1/1 [multiply]" in prompts[3]
+
+    tables = [call_arg.args[0] for call_arg in mock_print.call_args_list if call_arg.args and "Operation" in call_arg.args[0]]
+    assert len(tables[0].splitlines()) == 6, "The tail page should only render the 5 newest rows."
+    assert all("multiply" in line for line in tables[3].splitlines()[1:])
+
+
+@patch("builtins.print")
+@patch("builtins.input", side_effect=["g 999", ""])
+def test_browse_history_missing_id(mock_input, mock_print, isolated_history):
+    """Ensure jumping to an unknown ID keeps the current page."""
+    History.add_entry("add", [1, 1], 2)
+    Menu.browse_history()
+    mock_print.assert_any_call("\n⚠️ Entry with ID 999 not found.")
@@ -0,0 +1,112 @@
+"""
+Unit tests for the runtime metrics and the REPL 'stats' command.
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from config.metrics import LatencyHistogram, Metrics, metrics
+from history.history import History
+from main import CalculatorREPL
+
+
+@pytest.fixture
+def fresh_metrics():
+    """Starts each test with empty, enabled shared metrics."""
+    enabled = metrics.enabled
+    metrics.enabled = True
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+    metrics.enabled = enabled
+
+
+def test_histogram_quantiles_are_within_one_bucket():
+    """Ensure estimated percentiles land within 20% of the exact ones."""
+    histogram = LatencyHistogram()
+    for millisecond in range(1, 1001):
+        histogram.observe(millisecond / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.2)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.2)
+    assert histogram.quantile(1.0) <= histogram.maximum == 1.0
+
+
+def test_timed_counts_calls_and_errors():
+    """Ensure decorated calls are counted and exceptions are flagged as errors."""
+    registry = Metrics(enabled=True)
+
+    @registry.timed("calculation", "divide")
+    def divide(a, b):
+        return a / b
+
+    assert divide(6, 3) == 2
+    with pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+
+    summary = registry.snapshot()["calculation"]["divide"]
+    assert (summary["calls"], summary["errors"]) == (2, 1)
+    assert summary["p50"] <= summary["p95"] <= summary["p99"] <= summary["seconds_max"]
+
+
+def test_disabled_metrics_record_nothing():
+    """Ensure a disabled registry passes calls through without recording them."""
+    registry = Metrics(enabled=False)
+    timed_add = registry.timed("calculation", "add")(lambda a, b: a + b)
+
+    assert timed_add(2, 3) == 5
+    assert registry.call("calculation", "add", timed_add, 1, 1) == 2
+    assert registry.snapshot() == {}
+
+
+def test_repl_and_history_are_instrumented(fresh_metrics, isolated_history):  # pylint: disable=redefined-outer-name,unused-argument
+    """Ensure REPL dispatch and history writes are recorded per operation and method."""
+    with patch("builtins.print"):
+        CalculatorREPL.process_calculation("add 2 3")
+        CalculatorREPL.process_calculation("divide 1 0")
+        CalculatorREPL.process_calculation("add two three")
+    History.clear_history()
+
+    snapshot = fresh_metrics.snapshot()
+    assert snapshot["calculation"]["add"]["calls"] == 1
+    assert snapshot["calculation"]["divide"]["errors"] == 1
+    assert snapshot["calculation"]["invalid"]["errors"] == 1
+    assert snapshot["history"]["add_entry"]["calls"] == 1
+    assert snapshot["history"]["clear_history"]["calls"] == 1
+
+
+def test_export_prometheus_and_json(fresh_metrics, tmp_path):  # pylint: disable=redefined-outer-name
+    """Ensure exports pick their format from the file extension."""
+    fresh_metrics.record("calculation", "mean", 0.002)
+    fresh_metrics.record("calculation", "mean", 0.004, error=True)
+
+    assert fresh_metrics.export(str(tmp_path / "metrics.json")) == "json"
+    exported = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert exported["calculation"]["mean"]["calls"] == 2
+
+    assert fresh_metrics.export(str(tmp_path / "metrics.prom")) == "prometheus"
+    text = (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+    assert "# TYPE calculator_calculation_seconds summary" in text
+    assert 'calculator_calculation_seconds{operation="mean",quantile="0.99"}' in text
+    assert 'calculator_calculation_seconds_count{operation="mean"} 2' in text
+    assert 'calculator_calculation_errors_total{operation="mean"} 1' in text
+
+
+@patch("builtins.print")
+def test_stats_command(mock_print, fresh_metrics, tmp_path):  # pylint: disable=redefined-outer-name
+    """Ensure 'stats' prints a row per label and 'stats export' writes the file."""
+    fresh_metrics.record("calculation", "add", 0.001)
+    CalculatorREPL.display_stats()
+    printed = [call.args[0] for call in mock_print.call_args_list]
+    assert any(line.startswith("calculation.add") for line in printed)
+
+    path = tmp_path / "stats.prom"
+    CalculatorREPL.display_stats(f"export {path}")
+    assert path.exists()
+    mock_print.assert_any_call(f"📊 Metrics written to {path} (prometheus).")
+
+    fresh_metrics.enabled = False
+    CalculatorREPL.display_stats()
+    mock_print.assert_any_call("📊 Metrics are disabled (set METRICS_ENABLED=true to collect them).")
@@ -54,11 +54,11 @@ def get_registry(cls):
     """Returns a copy of the operation registry."""
     return cls._registry.copy()
 
-def test_register_duplicate_operation():
+def test_register_duplicate_operation(monkeypatch):
     """Ensure duplicate registration raises ValueError."""
 
-    # Clear the registry before testing
-    Operation._registry.clear()  # pylint: disable=protected-access
+    # Start from an empty registry without discarding the real operations
+    monkeypatch.setattr(Operation, "_registry", {})
 
     # Register once
     Operation.register("mock", MockOperation)
@@ -83,3 +83,25 @@ def test_get_nonexistent_operation():
     """Ensure getting a non-existent operation raises KeyError."""
     with pytest.raises(KeyError, match="Operation 'unknown' not found"):
         Operation.get_operation("unknown")
+
+
+def test_validate_numbers_passes_decimals_through():
+    """Ensure Decimal operands are returned as-is without conversion."""
+    a, b = Decimal("1.50"), Decimal("-2")
+    validated_a, validated_b = Operation.validate_numbers(a, b)
+    assert validated_a is a and validated_b is b
+    assert Operation.validate_numbers(0.1, 2) == (Decimal("0.1"), Decimal("2"))
+
+
+def test_arithmetic_validation_messages():
+    """Ensure arithmetic operations keep their stricter checks and per-operand messages."""
+    from operations.addition import Add
+    from operations.division import Divide
+
+    with pytest.raises(TypeError, match=r"\[\] \(list\) or \{\} \(dict\) - Invalid type\."):
+        Add.validate_numbers([], {})
+    with pytest.raises(TypeError, match="Invalid input for 'b': 'x' \\(str\\) - Expected a number."):
+        Divide.validate_numbers(Decimal(1), "x")
+    assert Add.compute(Decimal("2.5"), Decimal("0.5")) == Decimal("3.0")
+    with pytest.raises(ZeroDivisionError):
+        Divide.compute(Decimal(1), Decimal(0))
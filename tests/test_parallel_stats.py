@@ -0,0 +1,57 @@
+"""
+Unit tests for multi-process statistics over shared memory.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from operations import parallel_stats
+from operations.mapped import BinarySource, FloatMoments
+from operations.statistics import Mean, StandardDeviation, Variance
+
+
+@pytest.fixture
+def array():
+    """Two-decimal-place values with a large offset, which stresses float accuracy."""
+    rng = np.random.default_rng(3)
+    return np.round(rng.normal(1_000_000, 25, 20_001), 2)
+
+
+def test_partition_covers_every_index():
+    """Ensure slices are contiguous, near-equal and cover the whole range."""
+    bounds = parallel_stats.partition(10, 3)
+    assert bounds == [(0, 4), (4, 7), (7, 10)]
+    assert parallel_stats.partition(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_exact_partials_match_sequential_kernel(array):
+    """Ensure exact partials from worker processes merge to the sequential result."""
+    parallel = parallel_stats.array_moments(array, exact=True, workers=3, min_values=0)
+    sequential = parallel_stats.array_moments(array, exact=True, workers=1)
+    assert (parallel.count, parallel.total, parallel.total_of_squares) == (
+        sequential.count, sequential.total, sequential.total_of_squares)
+    assert parallel.variance() == sequential.variance()
+    assert (parallel.minimum, parallel.maximum) == (sequential.minimum, sequential.maximum)
+
+
+def test_float_partials_merge_exactly(array):
+    """Ensure float partials merged in rational arithmetic round to the same results."""
+    parallel = parallel_stats.array_moments(array, workers=4, min_values=0)
+    sequential = FloatMoments.of_array(array)
+    assert parallel.count == sequential.count
+    assert float(parallel.variance()) == pytest.approx(float(sequential.variance()), rel=1e-12)
+    assert (parallel.minimum, parallel.maximum) == (array.min(), array.max())
+
+
+@pytest.mark.parametrize("mode", ["fast", "exact"])
+@pytest.mark.parametrize("operation", [Mean, StandardDeviation, Variance])
+def test_operations_match_sequential_after_quantization(tmp_path, monkeypatch, array, operation, mode):
+    """Ensure the parallel path gives the sequential quantized outputs."""
+    path = tmp_path / "values.f64"
+    array.astype("<f8").tofile(path)
+    expected = operation.execute(*[Decimal(repr(value)) for value in array.tolist()])
+
+    monkeypatch.setattr(parallel_stats, "STATS_PARALLEL_MIN_VALUES", 0)
+    monkeypatch.setattr(parallel_stats, "STATS_WORKERS", 2)
+    assert operation.execute(BinarySource(str(path), mode)) == expected
@@ -17,7 +17,9 @@ def mock_logger():
 
 @patch("config.plugins.importlib.import_module")
 @patch("config.plugins.pkgutil.iter_modules")
-def test_load_plugins(mock_iter_modules, mock_import_module, caplog):
+@patch("config.plugins.write_manifest")  # ✅ Patched before import_module, which patch() itself relies on
+@patch("config.plugins.build_manifest")
+def test_load_plugins(mock_build_manifest, mock_write_manifest, mock_iter_modules, mock_import_module, caplog):
     """Ensure load_plugins() correctly loads modules dynamically."""
 
     _loaded_plugins.clear()  # ✅ Clear globally before running the test
@@ -33,7 +35,7 @@ def test_load_plugins(mock_iter_modules, mock_import_module, caplog):
 
     # ✅ Capture logs to verify log behavior
     with caplog.at_level(logging.INFO):
-        load_plugins()
+        load_plugins(refresh=True)
 
     # ✅ Validate modules were imported
     mock_import_module.assert_any_call("operations.addition")
@@ -43,6 +45,9 @@ def test_load_plugins(mock_iter_modules, mock_import_module, caplog):
     assert "✅ Successfully loaded plugin: operations.addition" in caplog.text
     assert "✅ Successfully loaded plugin: operations.subtraction" in caplog.text
 
+    # ✅ Ensure the rescan refreshed the manifest
+    mock_write_manifest.assert_called_once_with(mock_build_manifest.return_value)
+
 
 @patch("config.plugins.importlib.import_module")
 def test_load_plugin_success(mock_import_module, caplog):
@@ -109,3 +114,14 @@ def test_main_loads_plugins_once(mock_register_operations, mock_load_plugins):
     # Ensure plugins and operations were loaded once
     mock_load_plugins.assert_called_once()
     mock_register_operations.assert_called_once()
+
+
+@patch("config.plugins.importlib.import_module")
+@patch("config.plugins.read_manifest", return_value={"operations": {}})
+def test_load_plugins_uses_current_manifest(mock_read_manifest, mock_import_module, caplog):
+    """Ensure load_plugins() imports nothing while the manifest is current."""
+    with caplog.at_level(logging.INFO):
+        load_plugins()
+
+    mock_import_module.assert_not_called()
+    assert "✅ Plugin manifest is current" in caplog.text
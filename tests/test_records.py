@@ -0,0 +1,93 @@
+"""
+Unit tests for the compact in-memory history records.
+"""
+from history.records import HistoryRecords
+
+
+def test_append_and_rows_preserve_order():
+    """Ensure rows come back in insertion order with their operands intact."""
+    records = HistoryRecords()
+    records.append(1, "add", ["2", "3"], "5.00")
+    records.append(2, "mean", ["1", "2", "3"], "2.00")
+
+    assert list(records.rows()) == [
+        (1, "add", ["2", "3"], "5.00"),
+        (2, "mean", ["1", "2", "3"], "2.00"),
+    ]
+    assert len(records) == 2
+    assert records.next_id == 3
+
+
+def test_operation_names_are_interned():
+    """Ensure repeated operation names share a single interned code."""
+    records = HistoryRecords.from_rows((i, "add", [i, i], i * 2) for i in range(1, 101))
+    assert records._op_names == ["add"]  # pylint: disable=protected-access
+
+
+def test_remove_hides_rows_and_reuses_newest_id():
+    """Ensure removed rows disappear and the next ID follows the newest live row."""
+    records = HistoryRecords.from_rows([(1, "add", [1, 2], 3), (2, "subtract", [5, 1], 4)])
+
+    assert records.remove(2) == 1
+    assert records.remove(2) == 0, "Removing twice should be a no-op."
+    assert [row[0] for row in records.rows()] == [1]
+    assert records.next_id == 2
+
+
+def test_compaction_keeps_live_rows():
+    """Ensure dropping dead rows keeps the live ones and their operands aligned."""
+    records = HistoryRecords.from_rows((i, "multiply", [i, 2], i * 2) for i in range(1, 11))
+    for entry_id in range(1, 9):
+        records.remove(entry_id)
+
+    assert list(records.rows()) == [(9, "multiply", [9, 2], 18), (10, "multiply", [10, 2], 20)]
+    assert len(records._ids) < 10, "Dead rows should have been dropped."  # pylint: disable=protected-access
+
+
+def test_to_dataframe():
+    """Ensure a DataFrame is built with the standard history columns."""
+    history_df = HistoryRecords.from_rows([(1, "add", [2, 3], 5)]).to_dataframe()
+    assert list(history_df.columns) == ["ID", "Operation", "Operands", "Result"]
+    assert history_df.iloc[0]["Operands"] == [2, 3]
+    assert HistoryRecords().to_dataframe().empty
+
+
+def test_indexes_follow_appends_and_removals():
+    """Ensure ID lookups, per-operation counts and positions stay in sync with removals."""
+    operations = ["add", "mean", "divide"]
+    records = HistoryRecords.from_rows((i, operations[i % 3], [i], i) for i in range(1, 31))
+    for entry_id in (3, 4, 5, 12):
+        records.remove(entry_id)
+
+    assert records.get(4) is None and records.get(7) == (7, "mean", [7], 7)
+    assert records.count("mean") == len(list(records.rows("mean"))) == 9
+    for operation in (None, "add", "mean"):
+        ids = [row[0] for row in records.rows(operation)]
+        assert [records.position(entry_id, operation) for entry_id in ids] == list(range(len(ids)))
+        assert records.window(2, 3, operation) == list(records.rows(operation))[2:5]
+    assert records.position(7, "add") is None
+    assert records.count("unknown") == 0 and records.window(0, 5, "unknown") == []
+
+
+def test_duplicate_ids_are_all_removed():
+    """Ensure every live row sharing an ID is found first-to-last and removed together."""
+    records = HistoryRecords.from_rows([(1, "add", [1], 1), (2, "add", [2], 2), (1, "mean", [3], 3)])
+
+    assert records.get(1) == (1, "mean", [3], 3), "The newest row with the ID should win."
+    assert records.position(1) == 0 and records.position(1, "mean") == 0
+    assert records.remove(1) == 2
+    assert list(records.rows()) == [(2, "add", [2], 2)]
+    assert records.next_id == 3
+
+
+def test_windows_after_removals_match_a_full_scan():
+    """Ensure every window with removed rows in and around it matches slicing the live rows."""
+    operations = ["add", "mean", "divide"]
+    records = HistoryRecords.from_rows((i, operations[i % 3], [i], i) for i in range(1, 201))
+    for entry_id in range(1, 201, 7):
+        records.remove(entry_id)
+
+    for operation in (None, "mean"):
+        live = list(records.rows(operation))
+        for offset in range(0, len(live) + 2, 5):
+            assert records.window(offset, 6, operation) == live[offset:offset + 6]
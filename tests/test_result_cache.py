@@ -0,0 +1,92 @@
+"""
+Unit tests for the operation result cache.
+"""
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from main import CalculatorREPL
+from mappings.operations_map import LazyOperationMapping
+from mappings.result_cache import ResultCache
+from operations.vectorized import Vector
+
+
+def test_normalized_operands_share_an_entry():
+    """Ensure equal values with different scales hit the same entry."""
+    cache = ResultCache(maxsize=8)
+    execute = MagicMock(return_value=Decimal("2.5"))
+    cached = cache.wrap("mean", execute)
+
+    assert cached(Decimal("2"), Decimal("3")) == Decimal("2.5")
+    assert cached(Decimal("2.00"), Decimal("3.0")) == Decimal("2.5")
+    execute.assert_called_once()
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_distinct_operations_and_signed_zero_do_not_collide():
+    """Ensure keys include the operation name and keep -0 apart from 0."""
+    key = ResultCache.key
+    assert key("mean", [Decimal(1), Decimal(2)]) != key("median", [Decimal(1), Decimal(2)])
+    assert key("add", [Decimal("-0"), Decimal(0)]) != key("add", [Decimal(0), Decimal(0)])
+    assert key("mean", [Decimal("1.2345678901234567890123456789012"),
+                        Decimal("1.2345678901234567890123456789013")]) != key("mean", [Decimal(1), Decimal(1)])
+
+
+def test_lru_eviction():
+    """Ensure the least recently used entry is evicted first."""
+    cache = ResultCache(maxsize=2)
+    keys = [cache.key("mean", [Decimal(i)]) for i in range(3)]
+    cache.put(keys[0], Decimal(0))
+    cache.put(keys[1], Decimal(1))
+    assert cache.get(keys[0]) == Decimal(0)  # Touch 0 so 1 becomes the oldest
+    cache.put(keys[2], Decimal(2))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == Decimal(0)
+    assert cache.info().evictions == 1
+
+
+def test_non_scalar_operands_bypass_the_cache():
+    """Ensure vectors are never cached and errors are not memoized."""
+    cache = ResultCache(maxsize=8)
+    execute = MagicMock(side_effect=[ValueError("boom"), Decimal(1), Decimal(1)])
+    cached = cache.wrap("mean", execute)
+    try:
+        cached(Decimal(1))
+    except ValueError:
+        pass
+    cached(Decimal(1))
+    cached(Vector([1, 2]))
+    assert execute.call_count == 3
+    assert cache.info().size == 1
+
+
+def test_persistent_tier_survives_restart(tmp_path):
+    """Ensure results written to SQLite are found by a fresh cache."""
+    path = str(tmp_path / "results.db")
+    first = ResultCache(maxsize=4, path=path)
+    first.wrap("std_dev", lambda *numbers: Decimal("1.58"))(Decimal(1), Decimal(2), Decimal(3))
+
+    second = ResultCache(maxsize=4, path=path)
+    execute = MagicMock()
+    assert second.wrap("std_dev", execute)(Decimal(1), Decimal(2), Decimal(3)) == Decimal("1.58")
+    execute.assert_not_called()
+    assert second.info().disk_hits == 1
+
+
+def test_mapping_wraps_only_cacheable_operations():
+    """Ensure statistics are memoized and arithmetic is not."""
+    mapping = LazyOperationMapping({
+        "mean": {"module": "operations.statistics", "class": "Mean", "arity": None},
+        "add": {"module": "operations.addition", "class": "Add", "arity": 2},
+    })
+    assert hasattr(mapping["mean"], "cache_info")
+    assert not hasattr(mapping["add"], "cache_info")
+    assert mapping["mean"](Decimal(1), Decimal(2)) == Decimal("1.50")
+
+
+@patch("builtins.print")
+def test_cache_command_prints_counters(mock_print):
+    """Ensure the REPL `cache` command reports the counters."""
+    CalculatorREPL.display_cache_info()
+    assert mock_print.call_args[0][0].startswith("🗃️ Result cache:")
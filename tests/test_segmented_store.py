@@ -0,0 +1,145 @@
+"""
+Unit tests for the segmented history store.
+"""
+import os
+
+import pytest
+
+from history.history import History
+from history.records import HistoryRecords
+from history.segmented_store import SegmentedHistoryStore, read_footer
+
+OPERATIONS = ["add", "mean", "divide"]
+
+
+def _rows(first, last):
+    """Builds history rows with IDs ``first`` to ``last``."""
+    return [(i, OPERATIONS[i % 3], [str(i), "1"], f"{i}.00") for i in range(first, last + 1)]
+
+
+@pytest.fixture
+def segmented_history(monkeypatch, tmp_path):
+    """Points History at a fresh segment directory inside a temporary directory."""
+    monkeypatch.setattr(History, "_backend", "segmented")
+    monkeypatch.setattr(History, "_history_file", str(tmp_path / "history.csv"))
+    monkeypatch.setattr(History, "_loaded", False)
+    yield tmp_path / "history.segments"
+    History._store = None  # pylint: disable=protected-access
+    History._loaded = False  # pylint: disable=protected-access
+
+
+def test_rotation_seals_segments_with_footers(tmp_path):
+    """Ensure a full active segment is sealed with its ID range and operation counts."""
+    store = SegmentedHistoryStore(str(tmp_path), segment_bytes=1000)
+    store.load()
+    for row in _rows(1, 120):
+        store.append([row])
+
+    footers = store.segments()
+    assert len(footers) > 1
+    assert footers[0]["first_id"] == 1 and footers[0]["last_id"] < footers[1]["first_id"]
+    assert sum(footer["entries"] for footer in footers) + len(store._active) == 120  # pylint: disable=protected-access
+    assert read_footer(footers[0]["path"])["operations"] == footers[0]["operations"]
+    assert SegmentedHistoryStore(str(tmp_path)).load() == _rows(1, 120)
+
+
+def test_find_and_rows_across_segments(tmp_path):
+    """Ensure lookups see entries in every tier and honour tombstones in newer segments."""
+    store = SegmentedHistoryStore(str(tmp_path), segment_bytes=1000, compression="lzma")
+    store.load()
+    for row in _rows(1, 120):
+        store.append([row])
+    store.remove(5)
+    store.remove(119)
+
+    assert store.segments()[0]["path"].endswith(".xz")
+    assert store.find(5) is None and store.find(119) is None and store.find(500) is None
+    assert store.find(6) == _rows(6, 6)[0] and store.find(120) == _rows(120, 120)[0]
+    expected = [row for row in _rows(1, 120) if row[0] not in (5, 119)]
+    assert store.rows("divide") == [row for row in expected if row[1] == "divide"]
+    assert store.rows() == expected
+    assert SegmentedHistoryStore(str(tmp_path)).load() == expected
+
+
+def test_load_changes_reads_only_new_records(tmp_path):
+    """Ensure records appended to the active segment by another writer are read incrementally."""
+    store = SegmentedHistoryStore(str(tmp_path))
+    store.append(_rows(1, 1))
+    assert store.load() == _rows(1, 1)
+
+    other = SegmentedHistoryStore(str(tmp_path))
+    other.load()
+    other.append(_rows(2, 2))
+    other.remove(1)
+    assert store.load_changes() == [_rows(2, 2)[0], (1, "__removed__", [], "")]
+    assert store.load_changes() == []
+
+
+def test_clear_and_retention_delete_segment_files(tmp_path):
+    """Ensure clearing and retention drop whole segment files."""
+    store = SegmentedHistoryStore(str(tmp_path), segment_bytes=1000, retention_segments=2)
+    store.load()
+    for row in _rows(1, 200):
+        store.append([row])
+
+    assert len(store.segments()) == 2
+    assert store.load()[0][0] > 1, "The oldest segments should have been dropped."
+
+    store.clear()
+    assert store.segments() == [] and store.load() == []
+    assert os.listdir(tmp_path) == ["active.seg"]
+
+
+def test_history_segmented_backend(segmented_history):
+    """Ensure the History facade persists adds and removals through the segmented backend."""
+    History.add_entry("add", ["2", "3"], "5.00")
+    History.add_entry("divide", ["8", "2"], "4.00")
+    History.remove_entry(1)
+
+    history_df = History.get_history()
+    assert list(history_df["ID"]) == [2]
+    assert history_df.iloc[0]["Result"] == "4.00"
+    assert (segmented_history / "active.seg").exists()
+
+
+def test_footer_queries_match_a_full_load(tmp_path):
+    """Ensure count, window and position agree with a full load after removals in every tier and a restart."""
+    store = SegmentedHistoryStore(str(tmp_path), segment_bytes=1000)
+    for row in _rows(1, 150):
+        store.append([row])
+    for entry_id in (1, 2, 40, 41, 90, 149):
+        store.remove(entry_id)
+    store.append(_rows(151, 155))
+    store.remove(152)
+
+    for reader in (store, SegmentedHistoryStore(str(tmp_path))):
+        records = HistoryRecords.from_rows(SegmentedHistoryStore(str(tmp_path)).load())
+        for operation in (None, "add", "divide", "missing"):
+            assert reader.count(operation) == records.count(operation)
+            for offset in range(0, 160, 11):
+                assert reader.window(offset, 7, operation) == records.window(offset, 7, operation)
+            for entry_id in (3, 40, 42, 100, 155):
+                assert reader.position(entry_id, operation) == records.position(entry_id, operation)
+        assert reader.newest_id() == 155
+    assert all("cancelled" in read_footer(footer["path"]) for footer in store.segments())
+
+
+def test_history_queries_keep_only_the_active_segment_hot(segmented_history, monkeypatch):
+    """Ensure History pages, finds and numbers entries from the footers instead of loading every segment."""
+    monkeypatch.setattr("history.history.HISTORY_SEGMENT_BYTES", 200)
+    for i in range(1, 21):
+        History.add_entry("add", [str(i), "1"], f"{i + 1}.00")
+
+    def fail_load(self):
+        raise AssertionError("The segmented history should not be loaded whole.")
+
+    monkeypatch.setattr(SegmentedHistoryStore, "load", fail_load)
+    History.reload()
+    History.remove_entry(5)
+    History.add_entry("divide", ["8", "2"], "4.00")
+
+    assert len(History._store.segments()) > 1  # pylint: disable=protected-access
+    assert History.count() == 20 and History.count("divide") == 1
+    assert History.entries(3, 2) == [(4, "add", ["4", "1"], "5.00"), (6, "add", ["6", "1"], "7.00")]
+    assert History.find(21) == (21, "divide", ["8", "2"], "4.00") and History.find(5) is None
+    assert History.position(21) == 19 and History.position(21, "divide") == 0
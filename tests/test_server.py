@@ -0,0 +1,161 @@
+"""
+Unit tests for the asyncio calculator server and its client.
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app import client
+from app.evaluator import evaluate_command
+from app.server import CalculatorServer, is_heavy
+
+
+async def _exchange(server, lines, **start_options):
+    """Starts ``server``, pipelines ``lines`` over one connection and returns the parsed responses."""
+    listener = await server.start(**start_options)
+    async with listener:
+        if start_options.get("socket_path"):
+            reader, writer = await asyncio.open_unix_connection(start_options["socket_path"])
+        else:
+            reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+        writer.write("".join(line + "\n" for line in lines).encode())
+        await writer.drain()
+        writer.write_eof()
+        responses = [json.loads(line) async for line in reader]
+        writer.close()
+    server.close()
+    return responses
+
+
+def test_pipelined_responses_keep_request_order():
+    """Ensure concurrent requests on one connection are answered in order."""
+    lines = [json.dumps({"id": index, "command": f"add {index} 1"}) for index in range(20)]
+    lines.insert(5, json.dumps({"id": "slow", "command": "mean 1 2 3 4"}))
+    responses = asyncio.run(_exchange(CalculatorServer(executor="thread", record_history=False), lines,
+                                      host="127.0.0.1", port=0))
+    assert [response["id"] for response in responses] == [*range(5), "slow", *range(5, 20)]
+    assert responses[0] == {"id": 0, "result": "1.00", "error": None}
+    assert responses[5]["result"] == "2.50"
+
+
+def test_batch_bare_and_invalid_requests(tmp_path):
+    """Ensure batches, bare lines, engines and malformed JSON each get one response over a Unix socket."""
+    lines = [
+        json.dumps({"id": 1, "commands": ["add 1 2", "divide 1 0", "2 * (3 + 4)"]}),
+        "multiply 3 4",
+        "{not json",
+        json.dumps({"id": 4}),
+        json.dumps({"id": 5, "command": "add 1.005 1.005", "engine": "fixed"}),
+        json.dumps({"id": 6, "command": "add 1 1", "engine": "quad"}),
+    ]
+    responses = asyncio.run(_exchange(CalculatorServer(executor="thread", record_history=False), lines,
+                                      socket_path=str(tmp_path / "calculator.sock")))
+    batch, bare, invalid, missing, fixed, unknown_engine = responses
+    assert [outcome["result"] for outcome in batch["results"]] == ["3.00", None, "14.00"]
+    assert "Division by zero" in batch["results"][1]["error"]
+    assert bare == {"id": None, "result": "12.00", "error": None}
+    assert invalid["error"].startswith("⚠️ Invalid request")
+    assert missing == {"id": 4, "result": None, "error": "⚠️ Invalid request: expected 'command' or 'commands'"}
+    assert fixed["result"] == "2.02"
+    assert "Unknown numeric engine 'quad'" in unknown_engine["error"]
+
+
+def test_malformed_request_does_not_stall_the_connection():
+    """Ensure badly shaped requests get an error and later pipelined requests still get answers."""
+    lines = [json.dumps({"id": 1, "commands": 5}), json.dumps({"id": 2, "command": ["add 1 2"]}),
+             *(json.dumps({"id": index, "command": f"add {index} 1"}) for index in range(3, 8))]
+    server = CalculatorServer(concurrency=2, executor="thread", record_history=False)
+    responses = asyncio.run(asyncio.wait_for(_exchange(server, lines, host="127.0.0.1", port=0), timeout=10))
+
+    assert responses[0] == {"id": 1, "result": None, "error": "⚠️ Invalid request: 'commands' must be a list of strings"}
+    assert responses[1]["error"] == "⚠️ Invalid request: 'command' must be a string"
+    assert [response["result"] for response in responses[2:]] == ["4.00", "5.00", "6.00", "7.00", "8.00"]
+
+
+def test_failed_task_still_gets_a_response():
+    """Ensure an exception escaping a request becomes an error response instead of ending the sender."""
+    server = CalculatorServer(concurrency=2, executor="thread", record_history=False)
+
+    async def failing_evaluate(commands, offload, engine):
+        if commands == ["add 1 1"]:
+            raise RuntimeError("worker crashed")
+        return [evaluate_command(command, engine) for command in commands]
+
+    server._evaluate = failing_evaluate  # pylint: disable=protected-access
+    responses = asyncio.run(asyncio.wait_for(
+        _exchange(server, ["add 1 1", "add 2 2"], host="127.0.0.1", port=0), timeout=10))
+    assert responses == [{"id": None, "result": None, "error": "❌ Error: worker crashed"},
+                         {"id": None, "result": "4.00", "error": None}]
+
+
+def test_server_records_history(isolated_history):
+    """Ensure successful results are written to history."""
+    from history.history import History
+
+    asyncio.run(_exchange(CalculatorServer(executor="thread"), ["add 2 3", "divide 1 0"], host="127.0.0.1", port=0))
+    history_df = History.get_history()
+    assert list(history_df["Operation"]) == ["add"]
+    assert list(history_df["Result"]) == [5.0]
+
+
+@pytest.mark.parametrize("command, heavy", [
+    ("add 2 3", False),
+    ("multiply 2 8", False),
+    ("mean 1 2 3", True),
+    ("(2 + 3) * 4", True),
+    ("add @values.csv 1", True),
+])
+def test_is_heavy(command, heavy):
+    """Ensure statistics, formulas and operand files are offloaded."""
+    assert is_heavy(command) is heavy
+
+
+def test_unknown_executor_is_rejected():
+    """Ensure a typo in SERVER_EXECUTOR fails fast."""
+    with pytest.raises(ValueError, match="Unknown executor"):
+        CalculatorServer(executor="fibre")
+
+
+@pytest.fixture
+def running_server(request):
+    """Runs a server on an ephemeral TCP port in a background thread (``thread`` executor unless parametrized)."""
+    loop = asyncio.new_event_loop()
+    server = CalculatorServer(executor=getattr(request, "param", "thread"), record_history=False)
+    listener = loop.run_until_complete(server.start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield listener.sockets[0].getsockname()[1]
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    listener.close()
+    loop.run_until_complete(listener.wait_closed())
+    loop.close()
+    server.close()
+
+
+def test_client_request_and_main(running_server, capsys):
+    """Ensure the stdlib client pipelines requests and prints results."""
+    responses = client.request([{"id": 1, "command": "add 2 3"}, {"id": 2, "command": "subtract 2 3"}],
+                               host="127.0.0.1", port=running_server)
+    assert [response["result"] for response in responses] == ["5.00", "-1.00"]
+
+    assert client.main(["--port", str(running_server), "mean 1 2 3", "divide 1 0"]) == 1
+    output = capsys.readouterr().out
+    assert "✅ Result: 2.00" in output and "Division by zero" in output
+
+
+@pytest.mark.parametrize("running_server", ["process"], indirect=True)
+def test_process_executor_closes_client_connections(running_server):
+    """Ensure pool workers do not hold a client's socket open once its offloaded request is answered."""
+    responses = client.request([{"id": 1, "command": "mean 1 2 3"}], host="127.0.0.1", port=running_server, timeout=10)
+    assert responses == [{"id": 1, "result": "2.00", "error": None}]
+    responses = client.request([{"id": 2, "command": "(2 + 3) * 4"}], host="127.0.0.1", port=running_server, timeout=10)
+    assert responses[0]["result"] == "20.00"
+
+
+def test_client_reports_unreachable_server(capsys):
+    """Ensure a missing server is reported instead of raising."""
+    assert client.main(["--socket", "/nonexistent/calculator.sock", "add 1 2"]) == 2
+    assert "Could not reach" in capsys.readouterr().err
@@ -0,0 +1,90 @@
+"""
+Unit tests for operand files and streaming statistics.
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.evaluator import CommandError, evaluate, parse_command
+from operations import decimal_stats
+from operations.sources import OperandSource
+from operations.statistics import Mean, Median, StandardDeviation, Variance
+
+
+@pytest.fixture
+def prices(tmp_path):
+    """A CSV file with a header and two numeric columns."""
+    path = tmp_path / "Prices.csv"
+    rows = ["item,price,qty"] + [f"{i},{i * 1.25},{i % 7}" for i in range(1, 101)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return path
+
+
+def test_column_by_name_and_index(prices):
+    """Ensure a column can be chosen by header name or zero-based index."""
+    by_name = list(OperandSource(str(prices), "price"))
+    by_index = list(OperandSource(str(prices), "1"))
+    assert by_name == by_index == [Decimal(str(i * 1.25)) for i in range(1, 101)]
+
+
+def test_headerless_file_reads_every_value(tmp_path):
+    """Ensure a plain file of numbers is read in full, skipping blanks."""
+    path = tmp_path / "values.txt"
+    path.write_text("1\n2, 3\n\n4\n", encoding="utf-8")
+    assert list(OperandSource(str(path))) == [Decimal(1), Decimal(2), Decimal(3), Decimal(4)]
+
+
+def test_split_cells_match_csv_module(tmp_path, monkeypatch):
+    """Ensure block splitting agrees with ``csv`` across block boundaries, CRLF and quoted cells."""
+    monkeypatch.setattr("operations.sources.READ_BLOCK_SIZE", 5)
+    path = tmp_path / "mixed.csv"
+    path.write_bytes(b"1,2\r\n3.5,,4\r\n\r\n5\n6,\"7\"\n\"8\n\",9\n10")
+    assert list(OperandSource(str(path))) == [Decimal(value) for value in "1 2 3.5 4 5 6 7 8 9 10".split()]
+    assert list(OperandSource(str(path)).chunks(float)) == [[1.0, 2.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]]
+
+
+def test_chunks_are_bounded(prices):
+    """Ensure the file is read in chunks no larger than ``chunk_size``."""
+    chunks = list(OperandSource(str(prices), "qty", chunk_size=16).chunks())
+    assert max(len(chunk) for chunk in chunks) == 16
+    assert sum(len(chunk) for chunk in chunks) == 100
+
+
+@pytest.mark.parametrize("operation", [Mean, Median, StandardDeviation, Variance])
+def test_streamed_results_match_in_memory(prices, operation):
+    """Ensure statistics over a file equal the same statistics over its values."""
+    source = OperandSource(str(prices), "price", chunk_size=7)
+    assert operation.execute(source) == operation.execute(*list(source))
+    assert operation.execute(source, Decimal(5)) == operation.execute(*list(source), Decimal(5))
+
+
+def test_moments_merge_matches_single_pass():
+    """Ensure merged partial moments equal the moments of the whole list."""
+    values = [Decimal(value) / 8 for value in range(-50, 75)]
+    merged = decimal_stats.Moments.of(values[:40]).merge(decimal_stats.Moments.of(values[40:]))
+    assert merged.variance() == decimal_stats.variance(values)
+    assert merged.stdev() == decimal_stats.stdev(values)
+    assert (merged.minimum, merged.maximum) == (min(values), max(values))
+
+
+def test_parse_command_accepts_operand_files(prices):
+    """Ensure ``@file:column`` parses for statistics and keeps the path's case."""
+    operation, operands = parse_command(f"MEAN @{prices}:price")
+    assert operation == "mean" and operands == [OperandSource(str(prices), "price")]
+    assert evaluate(operation, operands) == Decimal("63.13")
+
+
+def test_parse_command_rejects_bad_operand_files(prices):
+    """Ensure missing files and arithmetic operations over files are rejected."""
+    with pytest.raises(CommandError, match="not found"):
+        parse_command("mean @missing.csv")
+    with pytest.raises(CommandError, match="does not accept text operand files"):
+        parse_command(f"add @{prices} 1")
+
+
+def test_non_numeric_value_is_reported(tmp_path):
+    """Ensure a bad cell is named in the error."""
+    path = tmp_path / "bad.csv"
+    path.write_text("1\n2\nabc\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Non-numeric value 'abc'"):
+        Mean.execute(OperandSource(str(path)))
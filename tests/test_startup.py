@@ -0,0 +1,41 @@
+"""
+Unit tests for startup performance: heavy imports stay off the start-up path.
+"""
+import subprocess
+import sys
+from unittest.mock import patch
+
+from app.startup import HEAVY_MODULES, PROJECT_ROOT, import_time_report, measure_imports
+from main import main
+
+
+def test_main_import_defers_heavy_modules():
+    """Ensure importing the calculator does not load pandas, numpy, pytest or multiprocessing."""
+    probe = "import sys, main; print(','.join(m for m in %r if m in sys.modules))" % (HEAVY_MODULES,)
+    completed = subprocess.run([sys.executable, "-c", probe], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "", f"Heavy modules imported at startup: {completed.stdout.strip()}"
+
+
+def test_measure_imports_reports_main():
+    """Ensure import timings include the measured module."""
+    timings = measure_imports("main")
+    assert "main" in [name for name, _, _ in timings]
+    assert all(self_us >= 0 and cumulative_us >= self_us for _, self_us, cumulative_us in timings)
+
+
+def test_import_time_report_lists_heavy_modules():
+    """Ensure the report flags every heavy module as deferred."""
+    report = import_time_report("main", top=3)
+    assert report.startswith("⏱️ Import time for 'main'")
+    for heavy in HEAVY_MODULES:
+        assert f"🔸 {heavy}: ✅ deferred" in report
+
+
+@patch("builtins.print")
+def test_main_import_time_flag(mock_print):
+    """Ensure `--import-time` prints the report instead of starting the REPL."""
+    with patch("app.startup.import_time_report", return_value="report") as mock_report:
+        main(["--import-time"])
+    mock_report.assert_called_once()
+    mock_print.assert_called_once_with("report")
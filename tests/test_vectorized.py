@@ -0,0 +1,79 @@
+"""
+Unit tests for vectorized element-wise arithmetic.
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.evaluator import evaluate, parse_command
+from operations.addition import Add
+from operations.multiplication import Multiply
+from operations.vectorized import Vector, execute
+
+
+@pytest.mark.parametrize("precise", [False, True])
+@pytest.mark.parametrize("operation, a, b, expected", [
+    ("add", [1, 2, 3], [4, 5, 6], ["5", "7", "9"]),
+    ("subtract", [10, 20], [1, 2], ["9", "18"]),
+    ("multiply", [1.5, 2], [2, 2], ["3", "4"]),
+    ("divide", [1, 2, 3], [2, 4, 6], ["0.5", "0.5", "0.5"]),
+])
+def test_elementwise(operation, a, b, expected, precise):
+    """Ensure two vectors are combined element-wise in both modes."""
+    result = execute(operation, Vector(a), Vector(b), precise=precise)
+    assert isinstance(result, Vector)
+    assert list(result) == [Decimal(value) for value in expected]
+
+
+def test_scalar_broadcasts_against_vector():
+    """Ensure scalars and one-element vectors broadcast like NumPy."""
+    assert list(Add.execute(Vector([1, 2, 3]), Decimal(10))) == [Decimal(11), Decimal(12), Decimal(13)]
+    assert list(Multiply.execute(Vector([2]), Vector([1, 2]))) == [Decimal(2), Decimal(4)]
+
+
+def test_mismatched_lengths_rejected():
+    """Ensure vectors of different lengths cannot be combined."""
+    with pytest.raises(ValueError, match="Vector lengths differ"):
+        Add.execute(Vector([1, 2]), Vector([1, 2, 3]))
+
+
+@pytest.mark.parametrize("precise", [False, True])
+def test_vector_division_by_zero(precise):
+    """Ensure any zero divisor raises ZeroDivisionError like scalar division."""
+    with pytest.raises(ZeroDivisionError):
+        execute("divide", Vector([1, 2]), Vector([1, 0]), precise=precise)
+    with pytest.raises(ZeroDivisionError):
+        execute("divide", Vector([8, 2, 0]), precise=precise)
+
+
+@pytest.mark.parametrize("operation, values, expected", [
+    ("add", [1, 2, 3], Decimal(6)),
+    ("subtract", [10, 1, 2], Decimal(7)),
+    ("multiply", [2, 3, 4], Decimal(24)),
+    ("divide", [100, 5, 2], Decimal(10)),
+])
+def test_reductions(operation, values, expected):
+    """Ensure a single vector is reduced left to right."""
+    assert execute(operation, Vector(values)) == expected
+
+
+def test_precise_mode_keeps_decimal_semantics():
+    """Ensure precise mode produces exactly the scalar Decimal results."""
+    result = execute("divide", Vector(["1", "2"]), Decimal(3), precise=True)
+    assert list(result) == [Decimal(1) / Decimal(3), Decimal(2) / Decimal(3)]
+
+
+def test_vector_rejects_booleans():
+    """Ensure vector elements follow the scalar type rules."""
+    with pytest.raises(TypeError, match="Invalid type"):
+        Vector([True, 1])
+
+
+def test_evaluator_parses_vectors():
+    """Ensure bracketed operands parse as vectors and statistics flatten them."""
+    operation, numbers = parse_command("add [1, 2, 3] [4,5,6]")
+    assert operation == "add" and all(isinstance(number, Vector) for number in numbers)
+    assert str(evaluate(operation, numbers)) == "[5.00, 7.00, 9.00]"
+
+    assert parse_command("mean [1,2] 3") == ("mean", [Decimal(1), Decimal(2), Decimal(3)])
+    assert evaluate(*parse_command("add [1,2,3]")) == Decimal("6.00")
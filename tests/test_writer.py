@@ -0,0 +1,128 @@
+"""
+Unit tests for the write-behind history writer.
+"""
+import time
+
+import pytest
+
+from history.csv_store import CSVHistoryStore
+from history.history import History
+from history.writer import WriteBehindWriter
+
+
+class RecordingStore:
+    """Collects appended groups and sync calls in memory."""
+
+    def __init__(self, failures=0):
+        self.groups = []
+        self.syncs = 0
+        self.failures = failures
+
+    def append(self, rows):
+        """Records one group, failing first when asked to."""
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        self.groups.append(list(rows))
+
+    def sync(self):
+        """Counts fsync requests."""
+        self.syncs += 1
+
+
+def _rows(first, last):
+    """Builds history rows with IDs ``first`` to ``last``."""
+    return [(i, "add", [str(i), "1"], f"{i + 1}.00") for i in range(first, last + 1)]
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Polls ``predicate`` until it holds or ``timeout`` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return predicate()
+
+
+@pytest.fixture
+def write_behind_history(isolated_history, monkeypatch):
+    """Turns on write-behind for an isolated CSV history."""
+    monkeypatch.setattr(History, "_write_behind", True)
+    yield isolated_history
+    History.close_writer()
+
+
+def test_groups_follow_the_size_threshold():
+    """Ensure everything queued is written as one group once the batch size is reached."""
+    store = RecordingStore()
+    writer = WriteBehindWriter(store, batch_size=4, interval=60)
+    for row in _rows(1, 3):
+        writer.submit([row])
+    time.sleep(0.02)
+    assert store.groups == [] and writer.depth == 3, "A partial batch waits for its interval."
+
+    writer.submit(_rows(4, 5))
+    assert _wait_for(lambda: store.groups == [_rows(1, 5)])
+    writer.submit(_rows(6, 6))
+    writer.flush()
+    assert store.groups == [_rows(1, 5), _rows(6, 6)]
+    assert writer.stats()["max_depth"] == 5
+    writer.close()
+
+
+def test_time_threshold_and_fsync_durability():
+    """Ensure a partial batch is written after the interval, synced in fsync mode, and unknown modes are rejected."""
+    store = RecordingStore()
+    writer = WriteBehindWriter(store, batch_size=100, interval=0.01, durability="fsync")
+    writer.submit(_rows(1, 3))
+
+    assert _wait_for(lambda: store.groups == [_rows(1, 3)])
+    assert store.syncs == 1
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(_rows(4, 4))
+    for durability in ("sometimes", "none"):
+        with pytest.raises(ValueError):
+            WriteBehindWriter(store, durability=durability)
+
+
+def test_failed_groups_are_retried_without_losing_rows():
+    """Ensure a failed group is raised from flush, stays queued and is written on a later attempt."""
+    store = RecordingStore(failures=2)
+    writer = WriteBehindWriter(store, batch_size=10, interval=60, retry_delay=0.001)
+    writer.submit(_rows(1, 2))
+    with pytest.raises(OSError):
+        writer.flush()
+    writer.submit(_rows(3, 3))
+    writer.close()
+
+    assert [row for group in store.groups for row in group] == _rows(1, 3), "No row may be lost or reordered."
+    assert writer.stats()["errors"] == 2 and writer.stats()["depth"] == 0
+
+
+def test_close_raises_when_rows_cannot_be_written():
+    """Ensure close stops retrying after repeated failures and reports the rows it could not write."""
+    store = RecordingStore(failures=100)
+    writer = WriteBehindWriter(store, retry_delay=0.001)
+    writer.submit(_rows(1, 2))
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+
+    stats = writer.stats()
+    assert store.groups == [] and stats["depth"] == 2
+    assert stats["errors"] >= 3 and stats["last_error"] == "disk full"
+
+
+def test_history_write_behind(write_behind_history):
+    """Ensure History queues entries and flushes them before other store operations."""
+    History.add_entry("add", ["2", "3"], "5.00")
+    History.add_entries([("divide", ["8", "2"], "4.00"), ("multiply", ["2", "2"], "4.00")])
+    assert History.writer_stats()["durability"] == "flush"
+
+    History.remove_entry(1)  # ✅ Flushes the queued entries before the tombstone
+    History.flush()
+    rows = CSVHistoryStore(str(write_behind_history)).load()
+    assert [row[0] for row in rows] == [2, 3]
+
+    History.close_writer()
+    assert History.writer_stats() is None
+    assert list(History.get_history()["ID"]) == [2, 3]